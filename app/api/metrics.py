@@ -0,0 +1,206 @@
+"""
+Endpoint de métricas e instrumentação das rotas de predição.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+
+from app.services.cache import get_prediction_cache
+from app.services.metrics import format_metric, metrics
+from app.services.predictor import micro_batch_stats
+from utils.logger import get_dropped_log_count, get_logger
+
+log = get_logger(__name__)
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Instantes de início e fim do endpoint da requisição corrente
+_endpoint_marks: ContextVar[list[float] | None] = ContextVar(
+    "endpoint_marks", default=None
+)
+
+
+def _mark_endpoint(call: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Envolve o endpoint para registrar os instantes de início e fim.
+
+    Args:
+        call: Função assíncrona do endpoint.
+
+    Returns:
+        Callable[..., Any]: Endpoint instrumentado.
+    """
+
+    @wraps(call)
+    async def endpoint(*args: Any, **kwargs: Any) -> Any:
+        marks = _endpoint_marks.get()
+        if marks is not None:
+            marks[0] = time.perf_counter()
+        try:
+            return await call(*args, **kwargs)
+        finally:
+            if marks is not None:
+                marks[1] = time.perf_counter()
+
+    return endpoint
+
+
+class InstrumentedRoute(APIRoute):
+    """
+    Rota que mede as etapas executadas pelo FastAPI fora do endpoint.
+
+    - parse: leitura do corpo e decodificação do JSON (reaproveitado depois
+      pelo FastAPI, que usa o cache de ``Request.json``).
+    - validate: resolução das dependências e validação do corpo, do fim do
+      parse ao início do endpoint.
+    - serialize: validação e serialização da resposta, do fim do endpoint à
+      resposta pronta.
+
+    Também contabiliza requisições e erros por rota e status.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        """
+        Retorna o handler da rota envolvido pela instrumentação.
+
+        Returns:
+            Callable[[Request], Any]: Handler ASGI da rota.
+        """
+        if iscoroutinefunction(self.dependant.call):
+            self.dependant.call = _mark_endpoint(self.dependant.call)
+        original_handler = super().get_route_handler()
+        route_path = self.path
+        has_body = self.body_field is not None
+
+        async def handler(request: Request) -> Response:
+            if not metrics.enabled:
+                return await original_handler(request)
+
+            parsed_at = time.perf_counter()
+            if has_body and "json" in request.headers.get("content-type", ""):
+                try:
+                    await request.json()
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    pass
+                now = time.perf_counter()
+                metrics.observe_stage("parse", now - parsed_at)
+                parsed_at = now
+
+            marks: list[float] = [0.0, 0.0]
+            token = _endpoint_marks.set(marks)
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            try:
+                response = await original_handler(request)
+                status_code = response.status_code
+                return response
+            except HTTPException as error:
+                status_code = error.status_code
+                raise
+            except RequestValidationError:
+                status_code = 422
+                raise
+            finally:
+                _endpoint_marks.reset(token)
+                started_at, finished_at = marks
+                if started_at:
+                    metrics.observe_stage("validate", started_at - parsed_at)
+                if finished_at and status_code < 400:
+                    metrics.observe_stage(
+                        "serialize", time.perf_counter() - finished_at
+                    )
+                metrics.record_request(route_path, status_code)
+
+        return handler
+
+
+def _runtime_metrics() -> list[str]:
+    """
+    Converte as estatísticas do micro-batcher, do cache e do log em métricas.
+
+    Returns:
+        list[str]: Linhas no formato texto do Prometheus.
+    """
+    lines: list[str] = []
+    batch_stats = micro_batch_stats.snapshot()
+    lines += format_metric(
+        "micro_batch_batches_total",
+        "counter",
+        "Lotes executados pelo micro-batcher.",
+        [((), batch_stats["batches"])],
+    )
+    lines += format_metric(
+        "micro_batch_rows_total",
+        "counter",
+        "Linhas preditas pelo micro-batcher.",
+        [((), batch_stats["rows"])],
+    )
+    lines += format_metric(
+        "micro_batch_queue_wait_seconds_max",
+        "gauge",
+        "Maior espera na fila do micro-batcher.",
+        [((), batch_stats["max_queue_wait_ms"] / 1000)],
+    )
+
+    prediction_cache = get_prediction_cache()
+    if prediction_cache is not None:
+        snapshot = prediction_cache.snapshot()
+        for name in ("hits", "misses", "evictions"):
+            lines += format_metric(
+                f"prediction_cache_{name}_total",
+                "counter",
+                f"Contador {name} do cache de predições.",
+                [((), snapshot[name])],
+            )
+        lines += format_metric(
+            "prediction_cache_entries",
+            "gauge",
+            "Entradas armazenadas no cache de predições.",
+            [((), snapshot["size"])],
+        )
+
+    lines += format_metric(
+        "log_records_dropped_total",
+        "counter",
+        "Registros de log descartados com a fila cheia.",
+        [((), get_dropped_log_count())],
+    )
+    return lines
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Métricas no formato Prometheus",
+    description="Histogramas de latência por etapa, contadores e estatísticas",
+)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Exporta as métricas da aplicação no formato texto do Prometheus.
+
+    Returns:
+        PlainTextResponse: Métricas em texto.
+
+    Raises:
+        HTTPException: Se a instrumentação estiver desabilitada.
+    """
+    if not metrics.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Métricas desabilitadas (METRICS_ENABLED=false)",
+        )
+    lines = [*metrics.render(), *_runtime_metrics()]
+    return PlainTextResponse(
+        "\n".join(lines) + "\n", media_type=PROMETHEUS_CONTENT_TYPE
+    )
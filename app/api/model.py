@@ -0,0 +1,68 @@
+"""
+Endpoint de informações do modelo em produção.
+"""
+
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, status
+
+from app.config import settings
+from app.schemas.model import ModelInfo
+from app.services.predictor import PredictorService, get_predictor_service
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+router = APIRouter(prefix="/model", tags=["model"])
+
+
+def _to_datetime(timestamp: float | None) -> datetime | None:
+    """
+    Converte um timestamp Unix em datetime UTC.
+
+    Args:
+        timestamp: Segundos desde a época, ou None.
+
+    Returns:
+        datetime | None: Data correspondente em UTC.
+    """
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+@router.get(
+    "/",
+    response_model=ModelInfo,
+    status_code=status.HTTP_200_OK,
+    summary="Informações do modelo ativo",
+    description="Retorna a versão do modelo em uso e o instante da última troca",
+)
+async def model_info(
+    predictor_service: PredictorService = Depends(get_predictor_service),
+) -> ModelInfo:
+    """
+    Endpoint com os metadados da versão do modelo ativa.
+
+    Args:
+        predictor_service: Serviço de predição injetado como dependência.
+
+    Returns:
+        ModelInfo: Metadados da versão ativa.
+    """
+    log.debug("Consulta às informações do modelo ativo")
+    if predictor_service.forest is not None:
+        backend = "compiled"
+    elif predictor_service.sklearn_model is not None:
+        backend = "sklearn"
+    else:
+        backend = "pyfunc"
+    return ModelInfo(
+        name=settings.MODEL_NAME,
+        alias=settings.MODEL_STAGE,
+        version=predictor_service.model_version,
+        model_uri=predictor_service.model_uri,
+        backend=backend,
+        loaded_at=_to_datetime(predictor_service.loaded_at),
+        last_swap_at=_to_datetime(predictor_service.last_swap_at),
+    )
@@ -2,15 +2,79 @@
 Endpoint de predição de preços de imóveis.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from collections.abc import AsyncIterator
+from typing import Any
 
-from app.schemas.prediction import PredictionInput, PredictionOutput
-from app.services.predictor import PredictorService, get_predictor_service
-from utils.logger import get_logger
+import numpy as np
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from pydantic_core import from_json
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from app.api.metrics import InstrumentedRoute
+from app.config import settings
+from app.schemas.prediction import (
+    DEFAULT_INTERVAL_COVERAGE,
+    BatchPredictionInput,
+    BatchPredictionItem,
+    BatchPredictionOutput,
+    ExplanationInput,
+    ExplanationOutput,
+    IntervalMethod,
+    PredictionExplanation,
+    PredictionInput,
+    PredictionInterval,
+    PredictionOutput,
+    SweepInput,
+    SweepOutput,
+    validate_feature_matrix,
+    validate_records,
+)
+from app.services.arrow import (
+    ARROW_STREAM_MEDIA_TYPE,
+    predictions_to_arrow,
+    read_arrow_stream,
+    table_to_matrix,
+)
+from app.services.executor import InferenceExecutor, get_inference_executor
+from app.services.metrics import metrics
+from app.services.predictor import (
+    PredictorService,
+    get_micro_batcher,
+    get_predictor_service,
+)
+from utils.logger import SAMPLED, get_logger
 
 log = get_logger(__name__)
 
-router = APIRouter(prefix="/predict", tags=["prediction"])
+router = APIRouter(
+    prefix="/predict", tags=["prediction"], route_class=InstrumentedRoute
+)
+
+_INTERVAL_QUERY = Query(
+    None,
+    description=(
+        "Calcula um intervalo de predição a partir das predições de cada "
+        "árvore: quantis (``quantile``) ou média ± desvio padrão (``std``)"
+    ),
+)
+_COVERAGE_QUERY = Query(
+    DEFAULT_INTERVAL_COVERAGE,
+    gt=0,
+    lt=1,
+    description="Cobertura nominal do intervalo de predição",
+)
 
 
 @router.post(
@@ -18,18 +82,31 @@ router = APIRouter(prefix="/predict", tags=["prediction"])
     response_model=PredictionOutput,
     status_code=status.HTTP_200_OK,
     summary="Prediz o preço de um imóvel",
-    description="Recebe características de um imóvel e retorna uma predição do preço",
+    description=(
+        "Recebe características de um imóvel e retorna uma predição do preço, "
+        "com um intervalo de predição opcional"
+    ),
+    response_model_exclude_none=True,
 )
 async def predict(
     input_data: PredictionInput,
+    interval: IntervalMethod | None = _INTERVAL_QUERY,
+    coverage: float = _COVERAGE_QUERY,
     predictor_service: PredictorService = Depends(get_predictor_service),
+    executor: InferenceExecutor = Depends(get_inference_executor),
 ) -> PredictionOutput:
     """
     Endpoint para predição de preços de imóveis.
 
+    A inferência é executada no executor configurado para não bloquear o
+    event loop. Predições com intervalo não passam pelo micro-batching.
+
     Args:
         input_data: Dados de entrada do imóvel para predição.
+        interval: Método do intervalo de predição; sem intervalo se omitido.
+        coverage: Cobertura nominal do intervalo.
         predictor_service: Serviço de predição injetado como dependência.
+        executor: Executor de inferência injetado como dependência.
 
     Returns:
         PredictionOutput: Resultado da predição com o valor predito.
@@ -38,10 +115,30 @@ async def predict(
         HTTPException: Em caso de erro na predição.
     """
     try:
-        log.info("Recebida solicitação de predição via endpoint /predict")
-        result = predictor_service.predict(input_data)
-        log.info("Predição realizada com sucesso pelo serviço")
+        log.info(
+            "Recebida solicitação de predição via endpoint /predict", extra=SAMPLED
+        )
+        if interval is not None:
+            matrix = np.array(
+                [[getattr(input_data, name) for name in settings.FEATURE_ORDER]]
+            )
+            values = await executor.run(
+                predictor_service, "predict_intervals", matrix, interval, coverage
+            )
+            [(value, lower, upper)] = values.tolist()
+            result = PredictionOutput(
+                predicted_value=value,
+                interval=PredictionInterval(lower=lower, upper=upper),
+            )
+        elif settings.MICRO_BATCHING_ENABLED:
+            batcher = get_micro_batcher(predictor_service, executor)
+            result = await batcher.submit(input_data)
+        else:
+            result = await executor.run(predictor_service, "predict", input_data)
+        log.info("Predição realizada com sucesso pelo serviço", extra=SAMPLED)
         return result
+    except NotImplementedError as error:
+        raise _unsupported_by_model(error) from error
     except ValueError as error:
         log.error("Erro ao carregar modelo: %s", error)
         raise HTTPException(
@@ -54,3 +151,689 @@ async def predict(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erro ao realizar predição: {error}",
         ) from error
+
+
+def _batch_too_large(n_rows: int) -> HTTPException:
+    """
+    Monta o erro de lote acima de ``MAX_BATCH_SIZE``.
+
+    Args:
+        n_rows: Quantidade de linhas recebidas.
+
+    Returns:
+        HTTPException: Erro 413 com a quantidade recebida e o máximo.
+    """
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Lote com {n_rows} linhas excede o máximo de {settings.MAX_BATCH_SIZE}",
+    )
+
+
+def _unsupported_by_model(error: NotImplementedError) -> HTTPException:
+    """
+    Monta o erro de um recurso que o modelo ativo não suporta, como intervalos
+    ou explicações de um modelo sem árvores.
+
+    Args:
+        error: Exceção levantada pelo serviço de predição.
+
+    Returns:
+        HTTPException: Erro 501 com a mensagem do serviço.
+    """
+    log.warning("Recurso indisponível para o modelo ativo: %s", error)
+    return HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(error))
+
+
+def _prediction_error(error: Exception) -> HTTPException:
+    """
+    Converte uma falha na predição em lote em erro HTTP.
+
+    Args:
+        error: Exceção levantada pelo serviço de predição.
+
+    Returns:
+        HTTPException: Erro 501 se o recurso solicitado não for suportado
+            pelo modelo; erro 500 com a mensagem correspondente nos demais casos.
+    """
+    if isinstance(error, NotImplementedError):
+        return _unsupported_by_model(error)
+    if isinstance(error, ValueError):
+        log.error("Erro ao carregar modelo: %s", error)
+        detail = f"Erro ao carregar modelo: {error}"
+    else:
+        log.error("Erro inesperado durante predição em lote: %s", error)
+        detail = f"Erro ao realizar predição: {error}"
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail
+    )
+
+
+async def _predict_valid_rows(
+    matrix: np.ndarray,
+    errors: dict[int, str],
+    predictor_service: PredictorService,
+    executor: InferenceExecutor,
+    interval: IntervalMethod | None = None,
+    coverage: float = DEFAULT_INTERVAL_COVERAGE,
+) -> np.ndarray:
+    """
+    Prediz as linhas válidas de uma matriz em uma única chamada ao modelo.
+
+    Args:
+        matrix: Matriz de features do lote.
+        errors: Mensagem de erro por posição de linha inválida.
+        predictor_service: Serviço de predição.
+        executor: Executor de inferência.
+        interval: Método do intervalo de predição; sem intervalo se omitido.
+        coverage: Cobertura nominal do intervalo.
+
+    Returns:
+        np.ndarray: Predição de cada linha ou, com ``interval``, matriz
+            ``(n_linhas, 3)`` com predição e limites; NaN nas linhas inválidas.
+    """
+    shape = len(matrix) if interval is None else (len(matrix), 3)
+    values = np.full(shape, np.nan)
+    if len(errors) == len(matrix):
+        return values
+    valid = np.ones(len(matrix), dtype=bool)
+    valid[list(errors)] = False
+    subset = matrix[valid] if errors else matrix
+    if interval is None:
+        values[valid] = await executor.run(predictor_service, "predict_matrix", subset)
+    else:
+        values[valid] = await executor.run(
+            predictor_service, "predict_intervals", subset, interval, coverage
+        )
+    return values
+
+
+async def _predict_arrow_batch(
+    body: bytes,
+    predictor_service: PredictorService,
+    executor: InferenceExecutor,
+    interval: IntervalMethod | None = None,
+    coverage: float = DEFAULT_INTERVAL_COVERAGE,
+) -> Response:
+    """
+    Prediz um lote enviado como stream Arrow IPC.
+
+    Args:
+        body: Corpo Arrow com uma coluna por feature de ``FEATURE_ORDER``.
+        predictor_service: Serviço de predição.
+        executor: Executor de inferência.
+        interval: Método do intervalo de predição; sem intervalo se omitido.
+        coverage: Cobertura nominal do intervalo.
+
+    Returns:
+        Response: Stream Arrow com ``index``, ``predicted_value`` e ``error``,
+            mais ``interval_lower`` e ``interval_upper`` quando solicitado.
+
+    Raises:
+        HTTPException: Se o corpo for inválido, exceder o tamanho máximo ou a
+            predição falhar.
+    """
+    with metrics.time("parse"):
+        try:
+            table = read_arrow_stream(body)
+        except ValueError as error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)
+            ) from error
+    if table.num_rows > settings.MAX_BATCH_SIZE:
+        raise _batch_too_large(table.num_rows)
+    if not table.num_rows:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Lote Arrow sem linhas",
+        )
+
+    log.info(
+        "Recebida solicitação de predição em lote Arrow com %s linhas",
+        table.num_rows,
+        extra=SAMPLED,
+    )
+    with metrics.time("convert"):
+        try:
+            matrix, nulls = table_to_matrix(table, settings.FEATURE_ORDER)
+        except ValueError as error:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(error)
+            ) from error
+    with metrics.time("validate"):
+        errors = validate_feature_matrix(matrix, settings.FEATURE_ORDER, nulls)
+
+    try:
+        values = await _predict_valid_rows(
+            matrix, errors, predictor_service, executor, interval, coverage
+        )
+    except Exception as error:
+        raise _prediction_error(error) from error
+
+    log.info(
+        "Predição em lote Arrow concluída | válidas=%s | inválidas=%s",
+        len(matrix) - len(errors),
+        len(errors),
+        extra=SAMPLED,
+    )
+    intervals = None
+    if interval is not None:
+        values, intervals = values[:, 0], values[:, 1:]
+    return Response(
+        content=predictions_to_arrow(values, errors, intervals),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+    )
+
+
+def _parse_json_batch(body: bytes) -> BatchPredictionInput:
+    """
+    Decodifica e valida o corpo JSON do lote.
+
+    Args:
+        body: Corpo da requisição.
+
+    Returns:
+        BatchPredictionInput: Lote validado.
+
+    Raises:
+        RequestValidationError: Se o corpo for inválido, no mesmo formato
+            usado pelo FastAPI para corpos declarados no endpoint.
+    """
+    with metrics.time("parse"):
+        try:
+            return BatchPredictionInput.model_validate_json(body)
+        except ValidationError as error:
+            raise RequestValidationError(
+                [
+                    {**item, "loc": ("body", *item["loc"])}
+                    for item in error.errors(include_url=False)
+                ],
+                body=body,
+            ) from error
+
+
+_BATCH_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {"schema": BatchPredictionInput.model_json_schema()},
+        ARROW_STREAM_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+    },
+}
+
+
+@router.post(
+    "/batch",
+    response_model=BatchPredictionOutput,
+    status_code=status.HTTP_200_OK,
+    summary="Prediz o preço de um lote de imóveis",
+    description=(
+        "Recebe uma lista de imóveis e retorna as predições na mesma ordem, "
+        "reportando erros de validação por linha, com intervalos de predição "
+        f"opcionais. Corpos ``{ARROW_STREAM_MEDIA_TYPE}`` com uma coluna por "
+        "feature são respondidos com um stream Arrow"
+    ),
+    openapi_extra={"requestBody": _BATCH_REQUEST_BODY},
+    responses={
+        200: {
+            "content": {
+                ARROW_STREAM_MEDIA_TYPE: {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            }
+        }
+    },
+)
+async def predict_batch(
+    request: Request,
+    interval: IntervalMethod | None = _INTERVAL_QUERY,
+    coverage: float = _COVERAGE_QUERY,
+    predictor_service: PredictorService = Depends(get_predictor_service),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+) -> BatchPredictionOutput | Response:
+    """
+    Endpoint para predição de preços de imóveis em lote.
+
+    Cada linha é validada individualmente; linhas inválidas recebem uma mensagem
+    de erro e as válidas são preditas em uma única chamada ao modelo. O formato
+    é escolhido pelo ``Content-Type``: JSON (padrão) ou stream Arrow IPC.
+
+    Args:
+        request: Requisição com o corpo JSON ou Arrow.
+        interval: Método do intervalo de predição; sem intervalo se omitido.
+        coverage: Cobertura nominal do intervalo.
+        predictor_service: Serviço de predição injetado como dependência.
+        executor: Executor de inferência injetado como dependência.
+
+    Returns:
+        BatchPredictionOutput | Response: Resultados por linha, na ordem de
+            entrada, em JSON ou em stream Arrow.
+
+    Raises:
+        HTTPException: Se o lote exceder o tamanho máximo ou a predição falhar.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    if content_type.split(";")[0].strip() == ARROW_STREAM_MEDIA_TYPE:
+        return await _predict_arrow_batch(
+            body, predictor_service, executor, interval, coverage
+        )
+
+    batch = _parse_json_batch(body)
+    if len(batch.instances) > settings.MAX_BATCH_SIZE:
+        raise _batch_too_large(len(batch.instances))
+
+    log.info(
+        "Recebida solicitação de predição em lote com %s linhas",
+        len(batch.instances),
+        extra=SAMPLED,
+    )
+    with metrics.time("validate"):
+        matrix, errors = validate_records(batch.instances, settings.FEATURE_ORDER)
+    try:
+        values = await _predict_valid_rows(
+            matrix, errors, predictor_service, executor, interval, coverage
+        )
+    except Exception as error:
+        raise _prediction_error(error) from error
+
+    log.info(
+        "Predição em lote concluída | válidas=%s | inválidas=%s",
+        len(matrix) - len(errors),
+        len(errors),
+        extra=SAMPLED,
+    )
+    if interval is None:
+        items = [
+            BatchPredictionItem(index=index, predicted_value=value)
+            for index, value in enumerate(values.tolist())
+        ]
+    else:
+        items = [
+            BatchPredictionItem(
+                index=index,
+                predicted_value=value,
+                interval=PredictionInterval(lower=lower, upper=upper),
+            )
+            for index, (value, lower, upper) in enumerate(values.tolist())
+        ]
+    for position, message in errors.items():
+        items[position] = BatchPredictionItem(index=position, error=message)
+    return BatchPredictionOutput(predictions=items)
+
+
+@router.post(
+    "/explain",
+    response_model=ExplanationOutput,
+    status_code=status.HTTP_200_OK,
+    summary="Explica a predição do preço de imóveis",
+    description=(
+        "Decompõe a predição de cada imóvel em um valor base mais a "
+        "contribuição aditiva de cada feature, seguindo os caminhos de decisão "
+        "das árvores da floresta"
+    ),
+)
+async def explain(
+    batch: ExplanationInput,
+    predictor_service: PredictorService = Depends(get_predictor_service),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+) -> ExplanationOutput:
+    """
+    Endpoint de explicação das predições por feature.
+
+    Todas as linhas são explicadas em uma única travessia vetorizada das
+    árvores, consultando o cache de predições quando habilitado.
+
+    Args:
+        batch: Imóveis a explicar.
+        predictor_service: Serviço de predição injetado como dependência.
+        executor: Executor de inferência injetado como dependência.
+
+    Returns:
+        ExplanationOutput: Explicações na ordem de entrada.
+
+    Raises:
+        HTTPException: Se o lote exceder o tamanho máximo, o modelo não
+            suportar explicações ou a explicação falhar.
+    """
+    if len(batch.instances) > settings.MAX_BATCH_SIZE:
+        raise _batch_too_large(len(batch.instances))
+
+    log.info(
+        "Recebida solicitação de explicação com %s linhas",
+        len(batch.instances),
+        extra=SAMPLED,
+    )
+    with metrics.time("convert"):
+        matrix = np.array(
+            [
+                [getattr(item, name) for name in settings.FEATURE_ORDER]
+                for item in batch.instances
+            ],
+            dtype=np.float64,
+        )
+    try:
+        results = await executor.run(predictor_service, "explain_matrix", matrix)
+    except Exception as error:
+        raise _prediction_error(error) from error
+
+    return ExplanationOutput(
+        explanations=[
+            PredictionExplanation(
+                predicted_value=value,
+                base_value=base_value,
+                contributions=dict(
+                    zip(settings.FEATURE_ORDER, contributions, strict=True)
+                ),
+            )
+            for value, base_value, *contributions in results.tolist()
+        ]
+    )
+
+
+@router.post(
+    "/sweep",
+    response_model=SweepOutput,
+    status_code=status.HTTP_200_OK,
+    summary="Analisa a sensibilidade do preço a uma ou duas features",
+    description=(
+        "Varia uma ou duas features de um imóvel de referência sobre uma grade, "
+        "mantendo as demais fixas, e retorna a curva ou superfície de preços. "
+        "A grade é limitada a ``SWEEP_MAX_POINTS`` pontos"
+    ),
+)
+async def sweep(
+    sweep_input: SweepInput,
+    predictor_service: PredictorService = Depends(get_predictor_service),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+) -> SweepOutput:
+    """
+    Endpoint de análise de sensibilidade (what-if).
+
+    A grade é expandida no servidor em uma única matriz, validada contra as
+    restrições do PredictionInput e predita em uma única chamada ao modelo,
+    sem passar pelo cache de predições.
+
+    Args:
+        sweep_input: Imóvel de referência e eixos variados.
+        predictor_service: Serviço de predição injetado como dependência.
+        executor: Executor de inferência injetado como dependência.
+
+    Returns:
+        SweepOutput: Grades e predições em formato de curva ou superfície.
+
+    Raises:
+        HTTPException: Se a grade exceder o tamanho máximo, gerar imóveis
+            inválidos ou a predição falhar.
+    """
+    if sweep_input.size > settings.SWEEP_MAX_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"Grade com {sweep_input.size} pontos excede o máximo de "
+                f"{settings.SWEEP_MAX_POINTS}"
+            ),
+        )
+
+    log.info(
+        "Recebida solicitação de sensibilidade com %s pontos",
+        sweep_input.size,
+        extra=SAMPLED,
+    )
+    with metrics.time("convert"):
+        matrix = sweep_input.to_matrix(settings.FEATURE_ORDER)
+    with metrics.time("validate"):
+        errors = validate_feature_matrix(matrix, settings.FEATURE_ORDER)
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Grade inválida: {next(iter(errors.values()))}",
+        )
+
+    try:
+        values = await executor.run(predictor_service, "predict_matrix", matrix, False)
+    except Exception as error:
+        raise _prediction_error(error) from error
+
+    shape = [axis.size for axis in sweep_input.axes]
+    return SweepOutput(
+        features=[axis.feature for axis in sweep_input.axes],
+        grids=[axis.grid().tolist() for axis in sweep_input.axes],
+        predicted_values=values.reshape(shape).tolist(),
+    )
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Resposta NDJSON que é enviada enquanto o corpo da requisição é lido.
+
+    Não escuta desconexões em paralelo como o StreamingResponse padrão faz em
+    servidores ASGI < 2.4, pois essa escuta consumiria as mensagens do corpo
+    da requisição. A desconexão é detectada pelo próprio ``Request.stream``.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as error:
+            raise ClientDisconnect() from error
+        if self.background is not None:
+            await self.background()
+
+
+async def _iter_ndjson_lines(
+    request: Request,
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Itera as linhas do corpo NDJSON conforme os pedaços chegam.
+
+    Linhas em branco são ignoradas, mas contam para o índice. Linhas maiores
+    que ``STREAM_MAX_LINE_BYTES`` são descartadas e retornadas como None, de
+    modo que a memória usada não depende do tamanho do upload.
+
+    Args:
+        request: Requisição com o corpo NDJSON.
+
+    Yields:
+        tuple[int, bytes | None]: Índice da linha e seu conteúdo.
+    """
+    max_line_bytes = settings.STREAM_MAX_LINE_BYTES
+    buffer = b""
+    index = 0
+    oversized = False
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if oversized or len(line) > max_line_bytes:
+                yield index, None
+                oversized = False
+            elif line.strip():
+                yield index, line
+            index += 1
+        if len(buffer) > max_line_bytes:
+            oversized = True
+            buffer = b""
+    if oversized:
+        yield index, None
+    elif buffer.strip():
+        yield index, buffer
+
+
+def _parse_ndjson_line(line: bytes | None) -> PredictionInput:
+    """
+    Decodifica e valida uma linha NDJSON.
+
+    Args:
+        line: Conteúdo da linha, ou None se excedeu o tamanho máximo.
+
+    Returns:
+        PredictionInput: Entrada validada.
+
+    Raises:
+        ValueError: Se a linha exceder o tamanho máximo ou for inválida.
+    """
+    if line is None:
+        raise ValueError(
+            f"Linha excede o limite de {settings.STREAM_MAX_LINE_BYTES} bytes"
+        )
+    return PredictionInput.model_validate_json(line)
+
+
+def _decode_ndjson_line(line: bytes | None) -> Any:
+    """
+    Decodifica o JSON de uma linha sem validá-la.
+
+    Args:
+        line: Conteúdo da linha, ou None se excedeu o tamanho máximo.
+
+    Returns:
+        Any: Objeto decodificado, ou a própria linha se ela não contiver um
+            objeto JSON, para que ``_validate_ndjson_record`` reporte o erro.
+    """
+    if line is None:
+        return None
+    try:
+        record = from_json(line)
+    except ValueError:
+        return line
+    return record if isinstance(record, dict) else line
+
+
+def _validate_ndjson_record(record: Any) -> PredictionInput:
+    """
+    Valida um registro decodificado por ``_decode_ndjson_line``.
+
+    Args:
+        record: Objeto JSON decodificado ou a linha original.
+
+    Returns:
+        PredictionInput: Entrada validada.
+
+    Raises:
+        ValueError: Se o registro for inválido.
+    """
+    if isinstance(record, dict):
+        return PredictionInput.model_validate(record)
+    return _parse_ndjson_line(record)
+
+
+async def _score_ndjson_chunk(
+    rows: list[tuple[int, bytes | None]],
+    predictor_service: PredictorService,
+    executor: InferenceExecutor,
+) -> bytes:
+    """
+    Valida e prediz um pedaço de linhas, serializando os resultados em NDJSON.
+
+    Falhas na predição são reportadas em cada linha válida do pedaço, já que o
+    status da resposta foi enviado antes do processamento.
+
+    Args:
+        rows: Pares (índice, linha) do pedaço.
+        predictor_service: Serviço de predição.
+        executor: Executor de inferência.
+
+    Returns:
+        bytes: Uma linha JSON por linha de entrada, na mesma ordem.
+    """
+    with metrics.time("parse"):
+        records = [_decode_ndjson_line(line) for _, line in rows]
+    with metrics.time("validate"):
+        matrix, errors = validate_records(
+            records, settings.FEATURE_ORDER, _validate_ndjson_record
+        )
+    try:
+        values = await _predict_valid_rows(
+            matrix, errors, predictor_service, executor
+        )
+    except Exception as error:
+        log.error("Erro durante predição em streaming: %s", error)
+        values = np.full(len(matrix), np.nan)
+        message = f"Erro ao realizar predição: {error}"
+        errors = {
+            position: errors.get(position, message) for position in range(len(rows))
+        }
+
+    items = [
+        BatchPredictionItem(index=index, predicted_value=value)
+        for (index, _), value in zip(rows, values.tolist(), strict=True)
+    ]
+    for position, message in errors.items():
+        items[position] = BatchPredictionItem(index=rows[position][0], error=message)
+    return b"".join(item.model_dump_json().encode() + b"\n" for item in items)
+
+
+async def _stream_predictions(
+    request: Request,
+    predictor_service: PredictorService,
+    executor: InferenceExecutor,
+) -> AsyncIterator[bytes]:
+    """
+    Lê o corpo em pedaços de ``STREAM_CHUNK_SIZE`` linhas e emite os resultados.
+
+    O próximo pedaço do corpo só é lido depois que o anterior é enviado, então
+    no máximo um pedaço fica em memória.
+
+    Args:
+        request: Requisição com o corpo NDJSON.
+        predictor_service: Serviço de predição.
+        executor: Executor de inferência.
+
+    Yields:
+        bytes: Resultados NDJSON de cada pedaço.
+    """
+    chunk: list[tuple[int, bytes | None]] = []
+    total = 0
+    async for row in _iter_ndjson_lines(request):
+        chunk.append(row)
+        if len(chunk) >= settings.STREAM_CHUNK_SIZE:
+            yield await _score_ndjson_chunk(chunk, predictor_service, executor)
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        yield await _score_ndjson_chunk(chunk, predictor_service, executor)
+        total += len(chunk)
+    log.info("Predição em streaming concluída com %s linhas", total, extra=SAMPLED)
+
+
+@router.post(
+    "/stream",
+    response_class=NDJSONStreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Prediz o preço de imóveis enviados em NDJSON",
+    description=(
+        "Recebe um corpo NDJSON (um imóvel por linha), prediz em pedaços e "
+        "devolve um resultado NDJSON por linha conforme cada pedaço termina"
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def predict_stream(
+    request: Request,
+    predictor_service: PredictorService = Depends(get_predictor_service),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+) -> NDJSONStreamingResponse:
+    """
+    Endpoint de predição em streaming para cargas NDJSON de qualquer tamanho.
+
+    Cada linha de saída segue o BatchPredictionItem, com ``index`` igual à
+    posição da linha no corpo; linhas inválidas recebem o erro na própria
+    linha, sem interromper o streaming.
+
+    Args:
+        request: Requisição com o corpo NDJSON.
+        predictor_service: Serviço de predição injetado como dependência.
+        executor: Executor de inferência injetado como dependência.
+
+    Returns:
+        NDJSONStreamingResponse: Resultados NDJSON na ordem de entrada.
+    """
+    log.info("Recebida solicitação de predição em streaming", extra=SAMPLED)
+    return NDJSONStreamingResponse(
+        _stream_predictions(request, predictor_service, executor)
+    )
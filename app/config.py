@@ -2,6 +2,8 @@
 Configurações da aplicação usando Pydantic Settings.
 """
 
+import os
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,6 +16,45 @@ class Settings(BaseSettings):
         MODEL_NAME: Nome do modelo no MLflow Model Registry.
         MODEL_STAGE: Estágio do modelo (Production, Staging, etc.).
         MLFLOW_TRACKING_URI: URI do servidor de tracking do MLflow.
+        FEATURE_ORDER: Ordem das features esperada pelo modelo.
+        MAX_BATCH_SIZE: Número máximo de linhas aceitas por predição em lote.
+        SWEEP_MAX_POINTS: Número máximo de pontos da grade em /predict/sweep.
+        MICRO_BATCHING_ENABLED: Agrupa chamadas concorrentes de /predict em lotes.
+        MICRO_BATCH_MAX_SIZE: Número máximo de linhas por micro-lote.
+        MICRO_BATCH_MAX_WAIT_MS: Espera máxima pelo preenchimento do micro-lote.
+        INFERENCE_EXECUTOR: Onde a inferência é executada (inline, thread, process).
+        INFERENCE_WORKERS: Quantidade de threads ou processos do executor.
+        INPUT_FAST_PATH_ENABLED: Envia arrays NumPy direto ao modelo Scikit-learn,
+            sem DataFrame, quando o flavor carregado permite.
+        INFERENCE_BACKEND: Backend de predição (pyfunc ou compiled).
+        COMPILED_PARITY_TOLERANCE: Diferença máxima aceita entre o backend
+            compilado e o modelo original.
+        EXPLANATIONS_PRECOMPUTE: Pré-calcula a decomposição por caminho usada
+            em /predict/explain ao carregar o modelo; caso contrário, ela é
+            calculada na primeira explicação de cada versão.
+        PREDICTION_CACHE_ENABLED: Habilita o cache de predições.
+        PREDICTION_CACHE_BACKEND: Armazenamento do cache (memory ou sqlite).
+        PREDICTION_CACHE_MAX_SIZE: Quantidade máxima de entradas do cache.
+        PREDICTION_CACHE_TTL_SECONDS: Tempo de vida das entradas (0 desabilita).
+        PREDICTION_CACHE_QUANTIZATION: Casas decimais para arredondar as
+            features na chave do cache (None desabilita).
+        PREDICTION_CACHE_PATH: Arquivo do backend sqlite.
+        MODEL_RELOAD_ENABLED: Monitora o alias no Model Registry e troca o
+            modelo sem reiniciar a aplicação. Incompatível com
+            ``INFERENCE_EXECUTOR=process``.
+        MODEL_RELOAD_INTERVAL_SECONDS: Intervalo entre consultas ao registry.
+        MODEL_RELOAD_WARMUP_CALLS: Predições de aquecimento antes da troca.
+        SHARED_MODEL_DIR: Diretório onde a floresta compilada é exportada e
+            mapeada em memória por todos os workers (requer backend compiled).
+        METRICS_ENABLED: Habilita a instrumentação de latência e o /metrics.
+        STREAM_CHUNK_SIZE: Linhas validadas e preditas por pedaço em
+            /predict/stream.
+        STREAM_MAX_LINE_BYTES: Tamanho máximo de uma linha NDJSON.
+        STARTUP_LOAD_ENABLED: Carrega e aquece o modelo na inicialização, antes
+            de reportar prontidão em /health/ready.
+        STARTUP_WARMUP_CALLS: Predições de aquecimento após o carregamento.
+        STARTUP_WARMUP_PAYLOADS: Arquivo JSONL com corpos de requisição
+            reproduzidos no aquecimento (usa o exemplo do schema se omitido).
     """
 
     MODEL_NAME: str = "property-price-predictor"
@@ -31,6 +72,44 @@ class Settings(BaseSettings):
         "Longitude",
     ]
 
+    MAX_BATCH_SIZE: int = 10_000
+    SWEEP_MAX_POINTS: int = 10_000
+
+    MICRO_BATCHING_ENABLED: bool = False
+    MICRO_BATCH_MAX_SIZE: int = 64
+    MICRO_BATCH_MAX_WAIT_MS: float = 2.0
+
+    INFERENCE_EXECUTOR: Literal["inline", "thread", "process"] = "thread"
+    INFERENCE_WORKERS: int = os.cpu_count() or 1
+
+    INPUT_FAST_PATH_ENABLED: bool = True
+    INFERENCE_BACKEND: Literal["pyfunc", "compiled"] = "pyfunc"
+    COMPILED_PARITY_TOLERANCE: float = 1e-6
+
+    EXPLANATIONS_PRECOMPUTE: bool = False
+
+    PREDICTION_CACHE_ENABLED: bool = False
+    PREDICTION_CACHE_BACKEND: Literal["memory", "sqlite"] = "memory"
+    PREDICTION_CACHE_MAX_SIZE: int = 100_000
+    PREDICTION_CACHE_TTL_SECONDS: float = 3600.0
+    PREDICTION_CACHE_QUANTIZATION: int | None = None
+    PREDICTION_CACHE_PATH: str = "cache/predictions.sqlite3"
+
+    MODEL_RELOAD_ENABLED: bool = False
+    MODEL_RELOAD_INTERVAL_SECONDS: float = 30.0
+    MODEL_RELOAD_WARMUP_CALLS: int = 3
+
+    SHARED_MODEL_DIR: str | None = None
+
+    METRICS_ENABLED: bool = True
+
+    STREAM_CHUNK_SIZE: int = 1_000
+    STREAM_MAX_LINE_BYTES: int = 65_536
+
+    STARTUP_LOAD_ENABLED: bool = True
+    STARTUP_WARMUP_CALLS: int = 20
+    STARTUP_WARMUP_PAYLOADS: str | None = None
+
     model_config: SettingsConfigDict = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
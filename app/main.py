@@ -2,21 +2,71 @@
 Aplicação principal FastAPI.
 """
 
-from fastapi import FastAPI
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from app.api import predict
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
+
+from app.api import metrics, model, predict
+from app.config import settings
+from app.services.cache import get_prediction_cache
+from app.services.executor import get_inference_executor, reset_inference_executor
+from app.services.predictor import (
+    close_micro_batcher,
+    get_predictor_service,
+    micro_batch_stats,
+)
+from app.services.reloader import start_model_reloader, stop_model_reloader
+from app.services.startup import load_and_warm_up, startup_state
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """
+    Gerencia o ciclo de vida da aplicação.
+
+    Na inicialização, carrega e aquece o modelo em segundo plano quando
+    ``STARTUP_LOAD_ENABLED`` está habilitado e inicia o monitoramento do Model
+    Registry. No encerramento, finaliza o monitoramento, o micro-batcher e o
+    executor de inferência, aguardando as predições em andamento.
+    """
+    overrides = application.dependency_overrides
+    service_provider = overrides.get(get_predictor_service, get_predictor_service)
+    startup_task: asyncio.Task | None = None
+    if settings.STARTUP_LOAD_ENABLED:
+        executor = overrides.get(get_inference_executor, get_inference_executor)()
+        startup_task = asyncio.create_task(load_and_warm_up(service_provider, executor))
+    else:
+        startup_state.reset("lazy")
+    start_model_reloader(service_provider)
+    yield
+    if startup_task is not None and not startup_task.done():
+        startup_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await startup_task
+    stop_model_reloader()
+    await close_micro_batcher()
+    reset_inference_executor()
+    log.info("Recursos de inferência encerrados")
+
+
 app = FastAPI(
     title="ML Property Pricing API",
     description="API para predição de preços de imóveis utilizando Machine Learning",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Registrar rotas
 app.include_router(predict.router)
+app.include_router(model.router)
+app.include_router(metrics.router)
 
 
 @app.get("/", tags=["health"])
@@ -40,5 +90,40 @@ async def health():
         dict: Status detalhado da API.
     """
     log.debug("Verificação de saúde executada com sucesso")
-    return {"status": "ok"}
+    response: dict = {"status": "ok", "startup": startup_state.snapshot()}
+    if settings.MICRO_BATCHING_ENABLED:
+        response["micro_batching"] = micro_batch_stats.snapshot()
+    prediction_cache = get_prediction_cache()
+    if prediction_cache is not None:
+        response["prediction_cache"] = prediction_cache.snapshot()
+    return response
 
+
+@app.get("/health/live", tags=["health"])
+async def health_live():
+    """
+    Endpoint de liveness: o processo está de pé e o event loop responde.
+
+    Returns:
+        dict: Status do processo.
+    """
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", tags=["health"])
+async def health_ready() -> JSONResponse:
+    """
+    Endpoint de readiness: o modelo está carregado e aquecido.
+
+    Returns:
+        JSONResponse: Estado do carregamento, com status 200 quando pronto e
+            503 enquanto carrega ou após uma falha.
+    """
+    return JSONResponse(
+        startup_state.snapshot(),
+        status_code=(
+            status.HTTP_200_OK
+            if startup_state.ready
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
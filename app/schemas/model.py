@@ -0,0 +1,44 @@
+"""
+Schemas Pydantic com informações do modelo em produção.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ModelInfo(BaseModel):
+    """
+    Schema com os metadados da versão do modelo ativa.
+
+    Attributes:
+        name: Nome do modelo no MLflow Model Registry.
+        alias: Alias monitorado no registry.
+        version: Versão ativa do modelo.
+        model_uri: URI usada no carregamento da versão ativa.
+        backend: Backend de predição em uso (compiled, sklearn ou pyfunc).
+        loaded_at: Instante em que a versão ativa foi carregada.
+        last_swap_at: Instante da última troca de versão, se houve.
+    """
+
+    name: str = Field(..., description="Nome do modelo no Model Registry")
+    alias: str = Field(..., description="Alias monitorado no registry")
+    version: str = Field(..., description="Versão ativa do modelo")
+    model_uri: str = Field(..., description="URI usada no carregamento")
+    backend: str = Field(..., description="Backend de predição em uso")
+    loaded_at: datetime = Field(..., description="Carregamento da versão ativa")
+    last_swap_at: datetime | None = Field(None, description="Última troca de versão")
+
+    model_config: ConfigDict = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "name": "property-price-predictor",
+                "alias": "staging",
+                "version": "3",
+                "model_uri": "models:/property-price-predictor/3",
+                "backend": "sklearn",
+                "loaded_at": "2024-01-01T12:00:00Z",
+                "last_swap_at": "2024-01-01T12:00:00Z",
+            }
+        },
+    )
@@ -2,7 +2,21 @@
 Schemas Pydantic para entrada e saída de predições.
 """
 
-from pydantic import BaseModel, ConfigDict, Field
+from collections.abc import Callable, Sequence
+from itertools import chain
+from math import prod
+from operator import attrgetter, itemgetter
+from typing import Any, Literal
+
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
 
 class PredictionInput(BaseModel):
@@ -40,6 +54,7 @@ class PredictionInput(BaseModel):
     Longitude: float = Field(..., description="Longitude do bloco")
 
     model_config: ConfigDict = ConfigDict(
+        allow_inf_nan=False,
         json_schema_extra={
             "example": {
                 "MedInc": 8.3252,
@@ -55,15 +70,37 @@ class PredictionInput(BaseModel):
     )
 
 
+IntervalMethod = Literal["quantile", "std"]
+
+DEFAULT_INTERVAL_COVERAGE: float = 0.9
+
+
+class PredictionInterval(BaseModel):
+    """
+    Intervalo de predição calculado a partir das predições de cada árvore.
+
+    Attributes:
+        lower: Limite inferior do intervalo.
+        upper: Limite superior do intervalo.
+    """
+
+    lower: float = Field(..., description="Limite inferior do intervalo")
+    upper: float = Field(..., description="Limite superior do intervalo")
+
+
 class PredictionOutput(BaseModel):
     """
     Schema de saída para predição de preço de imóvel.
 
     Attributes:
         predicted_value: Valor predito do imóvel (em centenas de milhares de dólares).
+        interval: Intervalo de predição, presente apenas quando solicitado.
     """
 
     predicted_value: float = Field(..., description="Valor predito do imóvel")
+    interval: PredictionInterval | None = Field(
+        None, description="Intervalo de predição, quando solicitado"
+    )
 
     model_config: ConfigDict = ConfigDict(
         json_schema_extra={
@@ -72,3 +109,472 @@ class PredictionOutput(BaseModel):
             }
         },
     )
+
+
+class BatchPredictionInput(BaseModel):
+    """
+    Schema de entrada para predição em lote.
+
+    As linhas são recebidas sem validação prévia para que erros em uma linha
+    sejam reportados individualmente, sem invalidar o lote inteiro.
+
+    Attributes:
+        instances: Lista de registros com as features de cada imóvel.
+    """
+
+    instances: list[dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        description="Registros de imóveis no formato de PredictionInput",
+    )
+
+    model_config: ConfigDict = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "instances": [
+                    PredictionInput.model_config["json_schema_extra"]["example"],
+                ]
+            }
+        },
+    )
+
+
+class BatchPredictionItem(BaseModel):
+    """
+    Resultado individual de uma linha da predição em lote.
+
+    Attributes:
+        index: Posição da linha no lote de entrada.
+        predicted_value: Valor predito, ausente quando a linha é inválida.
+        error: Mensagem de erro da linha, ausente em caso de sucesso.
+        interval: Intervalo de predição, ausente quando não solicitado ou
+            quando a linha é inválida.
+    """
+
+    index: int = Field(..., description="Posição da linha no lote de entrada")
+    predicted_value: float | None = Field(None, description="Valor predito do imóvel")
+    error: str | None = Field(None, description="Erro de validação ou predição")
+    interval: PredictionInterval | None = Field(
+        None, description="Intervalo de predição, quando solicitado"
+    )
+
+
+class BatchPredictionOutput(BaseModel):
+    """
+    Schema de saída para predição em lote.
+
+    Attributes:
+        predictions: Resultados na mesma ordem das linhas de entrada.
+    """
+
+    predictions: list[BatchPredictionItem] = Field(
+        ..., description="Resultados na ordem de entrada"
+    )
+
+    model_config: ConfigDict = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "predictions": [
+                    {"index": 0, "predicted_value": 4.526, "error": None},
+                    {
+                        "index": 1,
+                        "predicted_value": None,
+                        "error": "AveRooms: Input should be greater than 0",
+                    },
+                ]
+            }
+        },
+    )
+
+
+class ExplanationInput(BaseModel):
+    """
+    Schema de entrada para explicação de predições.
+
+    Attributes:
+        instances: Imóveis a explicar, validados como PredictionInput.
+    """
+
+    instances: list[PredictionInput] = Field(
+        ..., min_length=1, description="Imóveis a explicar"
+    )
+
+    model_config: ConfigDict = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "instances": [
+                    PredictionInput.model_config["json_schema_extra"]["example"],
+                ]
+            }
+        },
+    )
+
+
+class PredictionExplanation(BaseModel):
+    """
+    Explicação aditiva de uma predição.
+
+    A predição é igual a ``base_value`` mais a soma de ``contributions``.
+
+    Attributes:
+        predicted_value: Valor predito do imóvel.
+        base_value: Valor médio do alvo no treino (média das raízes das árvores).
+        contributions: Contribuição de cada feature para a predição.
+    """
+
+    predicted_value: float = Field(..., description="Valor predito do imóvel")
+    base_value: float = Field(..., description="Valor base das árvores")
+    contributions: dict[str, float] = Field(
+        ..., description="Contribuição aditiva de cada feature"
+    )
+
+
+class ExplanationOutput(BaseModel):
+    """
+    Schema de saída para explicação de predições.
+
+    Attributes:
+        explanations: Explicações na mesma ordem das linhas de entrada.
+    """
+
+    explanations: list[PredictionExplanation] = Field(
+        ..., description="Explicações na ordem de entrada"
+    )
+
+    model_config: ConfigDict = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "explanations": [
+                    {
+                        "predicted_value": 4.526,
+                        "base_value": 2.068,
+                        "contributions": {
+                            "MedInc": 1.912,
+                            "HouseAge": 0.104,
+                            "AveRooms": 0.087,
+                            "AveBedrms": -0.012,
+                            "Population": 0.005,
+                            "AveOccup": 0.221,
+                            "Latitude": 0.071,
+                            "Longitude": 0.070,
+                        },
+                    }
+                ]
+            }
+        },
+    )
+
+
+class SweepAxis(BaseModel):
+    """
+    Feature variada em uma análise de sensibilidade e seus valores.
+
+    A grade é dada explicitamente em ``values`` ou como ``num`` pontos
+    igualmente espaçados de ``start`` a ``stop`` (inclusive).
+
+    Attributes:
+        feature: Nome da feature variada.
+        values: Valores explícitos da grade.
+        start: Início da faixa.
+        stop: Fim da faixa.
+        num: Quantidade de pontos da faixa.
+    """
+
+    feature: str = Field(..., description="Feature variada")
+    values: list[float] | None = Field(
+        None, min_length=1, description="Valores explícitos da grade"
+    )
+    start: float | None = Field(None, description="Início da faixa")
+    stop: float | None = Field(None, description="Fim da faixa")
+    num: int | None = Field(None, ge=2, description="Quantidade de pontos da faixa")
+
+    model_config: ConfigDict = ConfigDict(allow_inf_nan=False)
+
+    @field_validator("feature")
+    @classmethod
+    def _check_feature(cls, feature: str) -> str:
+        """
+        Verifica se a feature existe no PredictionInput.
+
+        Args:
+            feature: Nome recebido.
+
+        Returns:
+            str: O próprio nome.
+
+        Raises:
+            ValueError: Se a feature for desconhecida.
+        """
+        if feature not in PredictionInput.model_fields:
+            raise ValueError(f"Feature desconhecida: {feature}")
+        return feature
+
+    @model_validator(mode="after")
+    def _check_grid(self) -> "SweepAxis":
+        """
+        Verifica se a grade foi dada por valores ou por faixa, não ambos.
+
+        Returns:
+            SweepAxis: O próprio eixo.
+
+        Raises:
+            ValueError: Se a grade estiver ausente, incompleta ou duplicada.
+        """
+        has_range = (self.start, self.stop, self.num) != (None, None, None)
+        if (self.values is None) == (not has_range):
+            raise ValueError("Informe values ou start, stop e num")
+        if has_range and None in (self.start, self.stop, self.num):
+            raise ValueError("A faixa exige start, stop e num")
+        return self
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            int: Quantidade de pontos da grade, sem materializá-la.
+        """
+        return len(self.values) if self.values is not None else self.num
+
+    def grid(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Valores da grade em float64.
+        """
+        if self.values is not None:
+            return np.asarray(self.values, dtype=np.float64)
+        return np.linspace(self.start, self.stop, self.num)
+
+
+class SweepInput(BaseModel):
+    """
+    Schema de entrada para análise de sensibilidade (what-if).
+
+    As features de ``axes`` percorrem suas grades e as demais ficam fixas nos
+    valores de ``base``; com dois eixos, todas as combinações são avaliadas.
+
+    Attributes:
+        base: Imóvel de referência.
+        axes: Uma ou duas features variadas, sem repetição.
+    """
+
+    base: PredictionInput = Field(..., description="Imóvel de referência")
+    axes: list[SweepAxis] = Field(
+        ..., min_length=1, max_length=2, description="Features variadas"
+    )
+
+    model_config: ConfigDict = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "base": PredictionInput.model_config["json_schema_extra"]["example"],
+                "axes": [{"feature": "MedInc", "start": 2.0, "stop": 12.0, "num": 11}],
+            }
+        },
+    )
+
+    @model_validator(mode="after")
+    def _check_distinct_axes(self) -> "SweepInput":
+        """
+        Verifica se cada feature aparece em no máximo um eixo.
+
+        Returns:
+            SweepInput: A própria entrada.
+
+        Raises:
+            ValueError: Se uma feature for repetida.
+        """
+        if len({axis.feature for axis in self.axes}) != len(self.axes):
+            raise ValueError("Cada feature pode aparecer em apenas um eixo")
+        return self
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            int: Quantidade de pontos da grade completa.
+        """
+        return prod(axis.size for axis in self.axes)
+
+    def to_matrix(self, columns: Sequence[str]) -> np.ndarray:
+        """
+        Expande a grade em uma matriz de features.
+
+        As linhas seguem a ordem C da grade: com dois eixos, o segundo varia
+        mais rápido, de modo que ``reshape(tamanhos)`` recupera a superfície.
+
+        Args:
+            columns: Campos do PredictionInput, na ordem das colunas da matriz.
+
+        Returns:
+            np.ndarray: Matriz ``(size, n_features)`` em float64.
+        """
+        base = np.array([getattr(self.base, name) for name in columns])
+        matrix = np.tile(base, (self.size, 1))
+        grids = np.meshgrid(*(axis.grid() for axis in self.axes), indexing="ij")
+        for axis, grid in zip(self.axes, grids, strict=True):
+            matrix[:, list(columns).index(axis.feature)] = grid.ravel()
+        return matrix
+
+
+class SweepOutput(BaseModel):
+    """
+    Schema de saída para análise de sensibilidade.
+
+    Attributes:
+        features: Features variadas, na ordem dos eixos.
+        grids: Valores da grade de cada eixo.
+        predicted_values: Curva (um eixo) ou superfície (dois eixos, linhas
+            indexadas pelo primeiro) com as predições.
+    """
+
+    features: list[str] = Field(..., description="Features variadas")
+    grids: list[list[float]] = Field(..., description="Grade de cada eixo")
+    predicted_values: list[float] | list[list[float]] = Field(
+        ..., description="Curva ou superfície de predições"
+    )
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """
+    Converte um erro de validação do Pydantic em uma mensagem compacta.
+
+    Args:
+        error: Erro de validação levantado pelo schema.
+
+    Returns:
+        str: Mensagens no formato ``campo: mensagem`` separadas por ``; ``.
+    """
+    messages = []
+    for item in error.errors():
+        location = ".".join(str(part) for part in item["loc"])
+        messages.append(f"{location}: {item['msg']}" if location else item["msg"])
+    return "; ".join(messages)
+
+
+# Restrição do annotated_types -> (comparação, mensagem do Pydantic)
+_CONSTRAINT_CHECKS: dict[str, tuple[Callable[..., np.ndarray], str]] = {
+    "gt": (np.greater, "Input should be greater than {}"),
+    "ge": (np.greater_equal, "Input should be greater than or equal to {}"),
+    "lt": (np.less, "Input should be less than {}"),
+    "le": (np.less_equal, "Input should be less than or equal to {}"),
+}
+
+
+def validate_feature_matrix(
+    matrix: np.ndarray, columns: Sequence[str], nulls: np.ndarray | None = None
+) -> dict[int, str]:
+    """
+    Valida uma matriz de features contra as restrições do PredictionInput.
+
+    As restrições (``gt``, ``ge``, ``lt``, ``le``) são lidas dos metadados dos
+    campos do schema e aplicadas como máscaras vetorizadas por coluna. Valores
+    nulos e não finitos também são rejeitados, com as mesmas mensagens que o
+    PredictionInput produz linha a linha.
+
+    Args:
+        matrix: Matriz ``(n_linhas, n_features)`` em float64.
+        columns: Nome do campo de cada coluna da matriz.
+        nulls: Máscara ``(n_linhas, n_features)`` de valores ausentes.
+
+    Returns:
+        dict[int, str]: Mensagem de erro por posição de linha inválida, no
+            formato de ``format_validation_error``.
+    """
+    field_checks: list[tuple[str, list[tuple[np.ndarray, str]]]] = []
+    invalid = np.zeros(matrix.shape[0], dtype=bool)
+    for position, name in enumerate(columns):
+        values = matrix[:, position]
+        missing = (
+            nulls[:, position]
+            if nulls is not None
+            else np.zeros(len(values), dtype=bool)
+        )
+        finite = np.isfinite(values)
+        checks = [
+            (missing, "Input should be a valid number"),
+            (~finite & ~missing, "Input should be a finite number"),
+        ]
+        for constraint in PredictionInput.model_fields[name].metadata:
+            for attribute, (compare, message) in _CONSTRAINT_CHECKS.items():
+                bound = getattr(constraint, attribute, None)
+                if bound is None:
+                    continue
+                with np.errstate(invalid="ignore"):
+                    failed = finite & ~compare(values, bound)
+                checks.append((failed, message.format(bound)))
+        for mask, _ in checks:
+            invalid |= mask
+        field_checks.append((name, checks))
+
+    errors: dict[int, str] = {}
+    for row in np.flatnonzero(invalid).tolist():
+        errors[row] = "; ".join(
+            f"{name}: {message}"
+            for name, checks in field_checks
+            for mask, message in checks
+            if mask[row]
+        )
+    return errors
+
+
+# Tipos aceitos sem conversão pelo caminho vetorizado; os demais (bool, str,
+# None...) passam pela validação do Pydantic para manter as mesmas regras
+_PLAIN_NUMBER_TYPES = frozenset({float, int})
+
+
+def validate_records(
+    records: Sequence[Any],
+    columns: Sequence[str],
+    validate: Callable[[Any], PredictionInput] = PredictionInput.model_validate,
+) -> tuple[np.ndarray, dict[int, str]]:
+    """
+    Valida registros em lote, montando a matriz de features.
+
+    Registros que são dicionários com todas as features como ``int`` ou
+    ``float`` são copiados direto para a matriz e validados por
+    ``validate_feature_matrix``. Os demais passam por ``validate``, de modo
+    que tipos convertidos, campos ausentes e entradas malformadas recebam
+    exatamente o erro do schema.
+
+    Args:
+        records: Registros brutos.
+        columns: Campos do PredictionInput, na ordem das colunas da matriz.
+        validate: Função que converte um registro em PredictionInput,
+            levantando ValueError se o registro for inválido.
+
+    Returns:
+        tuple[np.ndarray, dict[int, str]]: Matriz ``(n_registros,
+            n_features)`` e mensagem de erro por posição de registro
+            inválido; as linhas inválidas da matriz não devem ser usadas.
+    """
+    getter = itemgetter(*columns)
+    matrix = np.empty((len(records), len(columns)), dtype=np.float64)
+    try:
+        rows = list(map(getter, records))
+        if set(map(type, chain.from_iterable(rows))) <= _PLAIN_NUMBER_TYPES:
+            matrix[:] = rows
+            return matrix, validate_feature_matrix(matrix, columns)
+    except (KeyError, TypeError, OverflowError):
+        pass
+
+    attribute_getter = attrgetter(*columns)
+    schema_errors: dict[int, str] = {}
+    for position, record in enumerate(records):
+        try:
+            row = getter(record)
+            if all(type(value) in _PLAIN_NUMBER_TYPES for value in row):
+                matrix[position] = row
+                continue
+        except (KeyError, TypeError, OverflowError):
+            pass
+        try:
+            matrix[position] = attribute_getter(validate(record))
+        except ValidationError as error:
+            schema_errors[position] = format_validation_error(error)
+            matrix[position] = np.nan
+        except ValueError as error:
+            schema_errors[position] = str(error)
+            matrix[position] = np.nan
+
+    errors = validate_feature_matrix(matrix, columns)
+    errors.update(schema_errors)
+    return matrix, dict(sorted(errors.items()))
@@ -0,0 +1,138 @@
+"""
+Conversão entre o formato Arrow IPC (stream) e as matrizes de predição.
+
+Clientes de alto volume enviam as features em colunas Arrow, evitando o custo
+de decodificar JSON e validar um objeto Pydantic por linha. O pyarrow só é
+importado na primeira requisição Arrow.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def read_arrow_stream(body: bytes) -> pa.Table:
+    """
+    Lê um corpo Arrow IPC no formato stream sem copiar os buffers.
+
+    Args:
+        body: Corpo da requisição.
+
+    Returns:
+        pa.Table: Tabela com os lotes do stream.
+
+    Raises:
+        ValueError: Se o corpo não for um stream Arrow válido.
+    """
+    import pyarrow as pa
+
+    try:
+        with pa.ipc.open_stream(pa.py_buffer(body)) as reader:
+            return reader.read_all()
+    except (pa.ArrowInvalid, OSError) as error:
+        raise ValueError(f"Corpo Arrow inválido: {error}") from error
+
+
+def table_to_matrix(
+    table: pa.Table, columns: Sequence[str]
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Monta a matriz de features na ordem indicada a partir de uma tabela Arrow.
+
+    Colunas float64 com um único bloco e sem nulos são lidas como views NumPy
+    dos próprios buffers Arrow; a única cópia é a escrita na matriz
+    ``(n_linhas, n_features)`` em ordem de linha, exigida pelo modelo. Colunas
+    inteiras ou float32 são convertidas para float64.
+
+    Args:
+        table: Tabela recebida.
+        columns: Colunas esperadas, na ordem do modelo.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray | None]: Matriz float64 e máscara de
+            valores nulos, ou None se não houver nulos.
+
+    Raises:
+        ValueError: Se faltarem colunas ou alguma coluna não for numérica.
+    """
+    import pyarrow as pa
+
+    missing = [name for name in columns if name not in table.column_names]
+    if missing:
+        raise ValueError(f"Colunas ausentes no corpo Arrow: {', '.join(missing)}")
+
+    matrix = np.empty((table.num_rows, len(columns)), dtype=np.float64)
+    nulls: np.ndarray | None = None
+    for position, name in enumerate(columns):
+        column = table.column(name)
+        if not (pa.types.is_floating(column.type) or pa.types.is_integer(column.type)):
+            raise ValueError(f"Coluna {name} deve ser numérica, recebido {column.type}")
+        if column.type != pa.float64():
+            column = column.cast(pa.float64())
+        array = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+        if array.null_count:
+            if nulls is None:
+                nulls = np.zeros(matrix.shape, dtype=bool)
+            nulls[:, position] = array.is_null().to_numpy(zero_copy_only=False)
+            matrix[:, position] = array.to_numpy(zero_copy_only=False)
+        else:
+            matrix[:, position] = array.to_numpy(zero_copy_only=True)
+    return matrix, nulls
+
+
+def predictions_to_arrow(
+    values: np.ndarray,
+    errors: dict[int, str],
+    intervals: np.ndarray | None = None,
+) -> bytes:
+    """
+    Serializa as predições de um lote como stream Arrow IPC.
+
+    O stream tem as colunas ``index``, ``predicted_value`` e ``error``, com o
+    mesmo significado dos campos de BatchPredictionItem, e as colunas
+    ``interval_lower`` e ``interval_upper`` quando há intervalos.
+
+    Args:
+        values: Predição de cada linha; o valor das linhas com erro é ignorado.
+        errors: Mensagem de erro por posição de linha inválida.
+        intervals: Limites inferior e superior de cada linha, formato
+            ``(n_linhas, 2)``.
+
+    Returns:
+        bytes: Stream Arrow IPC com um único lote.
+    """
+    import pyarrow as pa
+
+    n_rows = len(values)
+    invalid = np.zeros(n_rows, dtype=bool)
+    invalid[list(errors)] = True
+    if errors:
+        messages = [None] * n_rows
+        for row, message in errors.items():
+            messages[row] = message
+        error_column = pa.array(messages, type=pa.string())
+    else:
+        error_column = pa.nulls(n_rows, type=pa.string())
+    columns = [
+        pa.array(np.arange(n_rows, dtype=np.int64)),
+        pa.array(np.asarray(values, dtype=np.float64), mask=invalid),
+        error_column,
+    ]
+    names = ["index", "predicted_value", "error"]
+    if intervals is not None:
+        bounds = np.asarray(intervals, dtype=np.float64)
+        columns += [pa.array(bounds[:, side], mask=invalid) for side in (0, 1)]
+        names += ["interval_lower", "interval_upper"]
+    batch = pa.record_batch(columns, names=names)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
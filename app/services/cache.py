@@ -0,0 +1,387 @@
+"""
+Cache de predições com chave versionada pelo modelo.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.schemas.prediction import PredictionInput
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Entrada validada ou valores das features na ordem de FEATURE_ORDER
+CacheInput = PredictionInput | Sequence[float]
+
+
+@dataclass
+class CacheStats:
+    """
+    Contadores de uso do cache.
+
+    Attributes:
+        hits: Consultas atendidas pelo cache.
+        misses: Consultas sem entrada válida no cache.
+        evictions: Entradas removidas por LRU ou expiração do TTL.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class CacheBackend(ABC):
+    """
+    Interface de armazenamento do cache de predições.
+
+    Implementações devem ser seguras para uso concorrente entre threads.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializa os contadores do backend.
+        """
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """
+        Recupera um valor do cache.
+
+        Args:
+            key: Chave canônica da entrada.
+
+        Returns:
+            Any | None: Valor armazenado ou None se ausente ou expirado.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        Armazena um valor no cache.
+
+        Args:
+            key: Chave canônica da entrada.
+            value: Valor serializável em JSON.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove todas as entradas do cache.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: Quantidade de entradas armazenadas.
+        """
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Cache em memória do processo com evicção LRU e expiração por TTL.
+
+    Attributes:
+        max_size: Quantidade máxima de entradas.
+        ttl_seconds: Tempo de vida das entradas; zero desabilita a expiração.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """
+        Inicializa o cache em memória.
+
+        Args:
+            max_size: Quantidade máxima de entradas.
+            ttl_seconds: Tempo de vida das entradas; zero desabilita a expiração.
+        """
+        super().__init__()
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            if self.ttl_seconds and expires_at < time.monotonic():
+                del self._entries[key]
+                self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache em arquivo SQLite, compartilhável entre processos workers.
+
+    O limite de tamanho é aplicado periodicamente (a cada ``trim_interval``
+    escritas), removendo as entradas acessadas há mais tempo.
+
+    Attributes:
+        path: Caminho do arquivo SQLite.
+        max_size: Quantidade máxima aproximada de entradas.
+        ttl_seconds: Tempo de vida das entradas; zero desabilita a expiração.
+    """
+
+    trim_interval: int = 256
+
+    def __init__(self, path: str | Path, max_size: int, ttl_seconds: float) -> None:
+        """
+        Inicializa o cache em arquivo.
+
+        Args:
+            path: Caminho do arquivo SQLite.
+            max_size: Quantidade máxima aproximada de entradas.
+            ttl_seconds: Tempo de vida das entradas; zero desabilita a expiração.
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+        )
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at = row
+            if self.ttl_seconds and expires_at < now:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.stats.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        payload = json.dumps(value)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, payload, now + self.ttl_seconds, now),
+            )
+            self._writes += 1
+            if self._writes % self.trim_interval == 0:
+                self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        """
+        Remove entradas expiradas e as menos acessadas acima do limite.
+
+        Args:
+            now: Instante atual, em segundos desde a época.
+        """
+        evicted = 0
+        if self.ttl_seconds:
+            evicted += self._connection.execute(
+                "DELETE FROM cache WHERE expires_at < ?", (now,)
+            ).rowcount
+        evicted += self._connection.execute(
+            "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+            "ORDER BY accessed_at LIMIT max(0, (SELECT COUNT(*) FROM cache) - ?))",
+            (self.max_size,),
+        ).rowcount
+        self.stats.evictions += evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+
+class PredictionCache:
+    """
+    Cache de predições com chave canônica derivada do PredictionInput.
+
+    A chave inclui um namespace (ex.: ``predict``), a versão resolvida do
+    modelo e os valores das features na ordem de ``FEATURE_ORDER``,
+    opcionalmente quantizados. Como a versão faz parte da chave, a troca do
+    modelo invalida o cache automaticamente.
+
+    Attributes:
+        backend: Armazenamento das entradas.
+        quantization_decimals: Casas decimais usadas para arredondar as
+            features antes de montar a chave; None desabilita a quantização.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        quantization_decimals: int | None = None,
+        feature_order: Sequence[str] | None = None,
+    ) -> None:
+        """
+        Inicializa o cache de predições.
+
+        Args:
+            backend: Armazenamento das entradas.
+            quantization_decimals: Casas decimais da quantização das features.
+            feature_order: Ordem das features na chave; usa as settings se omitido.
+        """
+        self.backend = backend
+        self.quantization_decimals = quantization_decimals
+        self._feature_getter = attrgetter(*(feature_order or settings.FEATURE_ORDER))
+
+    def make_key(
+        self, namespace: str, model_version: str, input_data: CacheInput
+    ) -> str:
+        """
+        Monta a chave canônica de uma entrada.
+
+        Args:
+            namespace: Tipo de resultado armazenado (ex.: ``predict``).
+            model_version: Versão resolvida do modelo.
+            input_data: Dados de entrada do imóvel, ou os valores das
+                features já na ordem de ``FEATURE_ORDER``.
+
+        Returns:
+            str: Chave canônica.
+        """
+        values = (
+            self._feature_getter(input_data)
+            if isinstance(input_data, PredictionInput)
+            else input_data
+        )
+        if self.quantization_decimals is not None:
+            values = [round(value, self.quantization_decimals) for value in values]
+        # Soma com 0.0 normaliza -0.0 para 0.0
+        return "|".join(
+            [namespace, model_version, *(repr(float(value) + 0.0) for value in values)]
+        )
+
+    def get(
+        self, namespace: str, model_version: str, input_data: CacheInput
+    ) -> Any | None:
+        """
+        Recupera um resultado armazenado.
+
+        Args:
+            namespace: Tipo de resultado armazenado.
+            model_version: Versão resolvida do modelo.
+            input_data: Dados de entrada ou valores das features.
+
+        Returns:
+            Any | None: Resultado armazenado ou None.
+        """
+        return self.backend.get(self.make_key(namespace, model_version, input_data))
+
+    def set(
+        self,
+        namespace: str,
+        model_version: str,
+        input_data: CacheInput,
+        value: Any,
+    ) -> None:
+        """
+        Armazena um resultado.
+
+        Args:
+            namespace: Tipo de resultado armazenado.
+            model_version: Versão resolvida do modelo.
+            input_data: Dados de entrada ou valores das features.
+            value: Resultado serializável em JSON.
+        """
+        self.backend.set(self.make_key(namespace, model_version, input_data), value)
+
+    def snapshot(self) -> dict[str, int]:
+        """
+        Retorna os contadores e o tamanho atual do cache.
+
+        Returns:
+            dict[str, int]: Acertos, faltas, evicções e quantidade de entradas.
+        """
+        return {**asdict(self.backend.stats), "size": len(self.backend)}
+
+
+@lru_cache
+def get_prediction_cache() -> PredictionCache | None:
+    """
+    Retorna o cache de predições configurado, ou None se desabilitado.
+
+    Returns:
+        PredictionCache | None: Cache compartilhado pelo processo.
+    """
+    if not settings.PREDICTION_CACHE_ENABLED:
+        return None
+
+    if settings.PREDICTION_CACHE_BACKEND == "sqlite":
+        backend: CacheBackend = SQLiteCacheBackend(
+            settings.PREDICTION_CACHE_PATH,
+            max_size=settings.PREDICTION_CACHE_MAX_SIZE,
+            ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS,
+        )
+    else:
+        backend = InMemoryCacheBackend(
+            max_size=settings.PREDICTION_CACHE_MAX_SIZE,
+            ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS,
+        )
+    log.info(
+        "Cache de predições habilitado | backend=%s | max_size=%s | ttl=%ss",
+        settings.PREDICTION_CACHE_BACKEND,
+        settings.PREDICTION_CACHE_MAX_SIZE,
+        settings.PREDICTION_CACHE_TTL_SECONDS,
+    )
+    return PredictionCache(backend, settings.PREDICTION_CACHE_QUANTIZATION)
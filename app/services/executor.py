@@ -0,0 +1,215 @@
+"""
+Executor de inferência que retira a predição do event loop.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any
+
+from app.config import settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+EXECUTOR_MODES: tuple[str, ...] = ("inline", "thread", "process")
+
+# Serviço de predição carregado uma única vez em cada processo do pool
+_worker_service: Any = None
+
+# Barreira compartilhada pelos processos do pool, usada por ``run_on_each_worker``
+_worker_barrier: Any = None
+
+
+def _init_process_worker(barrier: Any) -> None:
+    """
+    Carrega o modelo no processo worker.
+
+    Executado uma única vez por processo do pool, de forma que cada worker
+    mantenha sua própria instância do PredictorService.
+
+    Args:
+        barrier: Barreira com uma vaga por processo do pool.
+    """
+    global _worker_service, _worker_barrier
+    from app.services.predictor import PredictorService
+
+    _worker_barrier = barrier
+    _worker_service = PredictorService()
+
+
+def _run_in_process_worker(method_name: str, *args: Any) -> Any:
+    """
+    Executa um método do serviço de predição carregado no processo worker.
+
+    Args:
+        method_name: Nome do método do PredictorService.
+        *args: Argumentos repassados ao método.
+
+    Returns:
+        Any: Resultado do método.
+    """
+    return getattr(_worker_service, method_name)(*args)
+
+
+def _run_in_each_process_worker(method_name: str, *args: Any) -> Any:
+    """
+    Executa um método do serviço e aguarda os demais processos na barreira.
+
+    Como cada tarefa só termina depois que todas chegam à barreira, nenhum
+    processo pode executar duas delas: cada worker do pool recebe exatamente uma.
+
+    Args:
+        method_name: Nome do método do PredictorService.
+        *args: Argumentos repassados ao método.
+
+    Returns:
+        Any: Resultado do método.
+    """
+    try:
+        result = getattr(_worker_service, method_name)(*args)
+    except BaseException:
+        # Libera os processos que já aguardam na barreira
+        _worker_barrier.abort()
+        raise
+    _worker_barrier.wait()
+    return result
+
+
+class InferenceExecutor:
+    """
+    Despacha chamadas CPU-bound do serviço de predição para um pool de workers.
+
+    Modos suportados:
+    - inline: executa no próprio event loop (sem pool).
+    - thread: executa em um ThreadPoolExecutor usando o serviço injetado.
+    - process: executa em um ProcessPoolExecutor; cada processo carrega o
+      modelo uma única vez na inicialização, ignorando o serviço injetado.
+
+    Attributes:
+        mode: Modo de execução.
+        max_workers: Quantidade de workers do pool.
+    """
+
+    def __init__(self, mode: str, max_workers: int) -> None:
+        """
+        Inicializa o executor de inferência.
+
+        Args:
+            mode: Modo de execução (inline, thread ou process).
+            max_workers: Quantidade de workers do pool.
+
+        Raises:
+            ValueError: Se o modo de execução for desconhecido.
+        """
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(
+                f"Modo de executor inválido: {mode}. Use um de {EXECUTOR_MODES}."
+            )
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self._pool: Executor | None = None
+        if mode == "thread":
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="inference",
+            )
+        elif mode == "process":
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_process_worker,
+                initargs=(context.Barrier(self.max_workers),),
+            )
+        log.info(
+            "Executor de inferência configurado | modo=%s | workers=%s",
+            self.mode,
+            self.max_workers,
+        )
+
+    async def run(self, service: Any, method_name: str, *args: Any) -> Any:
+        """
+        Executa um método do serviço de predição fora do event loop.
+
+        Args:
+            service: Serviço de predição (ignorado no modo process).
+            method_name: Nome do método a executar (ex.: ``predict``).
+            *args: Argumentos repassados ao método.
+
+        Returns:
+            Any: Resultado do método.
+        """
+        if self._pool is None:
+            return getattr(service, method_name)(*args)
+
+        loop = asyncio.get_running_loop()
+        if self.mode == "process":
+            call = partial(_run_in_process_worker, method_name, *args)
+        else:
+            call = partial(getattr(service, method_name), *args)
+        return await loop.run_in_executor(self._pool, call)
+
+    async def run_on_each_worker(
+        self, service: Any, method_name: str, *args: Any
+    ) -> list[Any]:
+        """
+        Executa um método do serviço uma vez em cada processo do pool.
+
+        Útil para preparar o estado de cada processo (ex.: aquecimento). Fora do
+        modo process há um único serviço e o método roda uma única vez.
+
+        Args:
+            service: Serviço de predição (ignorado no modo process).
+            method_name: Nome do método a executar (ex.: ``warm_up``).
+            *args: Argumentos repassados ao método.
+
+        Returns:
+            list[Any]: Resultado de cada execução.
+        """
+        if self.mode != "process":
+            return [await self.run(service, method_name, *args)]
+
+        loop = asyncio.get_running_loop()
+        call = partial(_run_in_each_process_worker, method_name, *args)
+        return list(
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._pool, call)
+                    for _ in range(self.max_workers)
+                )
+            )
+        )
+
+    def shutdown(self) -> None:
+        """
+        Encerra o pool de workers aguardando as tarefas em andamento.
+        """
+        if self._pool is not None:
+            log.info("Encerrando executor de inferência (modo=%s)", self.mode)
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+@lru_cache
+def get_inference_executor() -> InferenceExecutor:
+    """
+    Retorna uma instância singleton do InferenceExecutor.
+
+    Returns:
+        InferenceExecutor: Executor configurado a partir das settings.
+    """
+    return InferenceExecutor(
+        mode=settings.INFERENCE_EXECUTOR,
+        max_workers=settings.INFERENCE_WORKERS,
+    )
+
+
+def reset_inference_executor() -> None:
+    """
+    Encerra o executor atual, se existir, e limpa o cache do singleton.
+    """
+    if get_inference_executor.cache_info().currsize:
+        get_inference_executor().shutdown()
+    get_inference_executor.cache_clear()
@@ -0,0 +1,565 @@
+"""
+Motor de inferência compilado para florestas de árvores de regressão.
+
+Converte o pipeline ``StandardScaler + RandomForestRegressor`` registrado no
+MLflow em arrays contíguos (feature, threshold, filhos e valor de cada nó de
+todas as árvores) e avalia todas as árvores de um lote com operações
+vetorizadas do NumPy, sem passar por pandas, pyfunc ou validações do
+Scikit-learn.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any
+
+import numpy as np
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_PARITY_ROWS: int = 256
+DEFAULT_PARITY_TOLERANCE: float = 1e-6
+
+_ARRAY_FIELDS: tuple[str, ...] = ("feature", "threshold", "children", "value", "roots")
+_METADATA_FILE: str = "forest.json"
+
+
+@dataclass(frozen=True)
+class CompiledForest:
+    """
+    Representação compacta e contígua de uma floresta de regressão.
+
+    Os nós de todas as árvores são concatenados em arrays únicos. As folhas
+    apontam para si mesmas com threshold infinito, de modo que a travessia pode
+    executar um número fixo de passos (a profundidade máxima) sem ramificações.
+    Thresholds e valores podem estar quantizados em float32 ou float16 (ver
+    ``scripts/compress.py``); as predições são sempre float64.
+
+    Attributes:
+        feature: Índice da feature avaliada em cada nó.
+        threshold: Threshold de cada nó no espaço original das features, com o
+            escalonamento do pipeline já incorporado.
+        children: Índices globais dos filhos esquerdo e direito de cada nó.
+        value: Valor médio do alvo em cada nó.
+        roots: Índice global da raiz de cada árvore.
+        max_depth: Profundidade máxima entre todas as árvores.
+        n_features: Quantidade de features esperada na entrada.
+    """
+
+    feature: np.ndarray
+    threshold: np.ndarray
+    children: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    max_depth: int
+    n_features: int
+
+    @property
+    def n_trees(self) -> int:
+        """
+        Returns:
+            int: Quantidade de árvores da floresta.
+        """
+        return int(self.roots.shape[0])
+
+    @property
+    def n_nodes(self) -> int:
+        """
+        Returns:
+            int: Quantidade total de nós de todas as árvores.
+        """
+        return int(self.feature.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Memória ocupada pelos arrays da floresta, em bytes.
+        """
+        return sum(getattr(self, name).nbytes for name in _ARRAY_FIELDS)
+
+    def save(self, directory: str | Path) -> Path:
+        """
+        Exporta os arrays da floresta como arquivos ``.npy`` em um diretório.
+
+        A escrita acontece em um diretório temporário renomeado ao final, de
+        modo que leitores nunca observem uma exportação parcial. Se outro
+        processo já tiver exportado o mesmo diretório, a exportação existente é
+        mantida.
+
+        Args:
+            directory: Diretório de destino.
+
+        Returns:
+            Path: Diretório com a floresta exportada.
+        """
+        target = Path(directory)
+        if is_exported_forest(target):
+            return target
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+        try:
+            for name in _ARRAY_FIELDS:
+                np.save(staging / f"{name}.npy", getattr(self, name))
+            metadata = {"max_depth": self.max_depth, "n_features": self.n_features}
+            (staging / _METADATA_FILE).write_text(json.dumps(metadata))
+            os.rename(staging, target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not is_exported_forest(target):
+                raise
+        log.info("Floresta exportada para %s (%s bytes)", target, self.nbytes)
+        return target
+
+    @classmethod
+    def load(cls, directory: str | Path, mmap: bool = True) -> CompiledForest:
+        """
+        Carrega uma floresta exportada por ``save``.
+
+        Com ``mmap`` habilitado, os arrays são mapeados em modo somente
+        leitura, compartilhando as mesmas páginas do page cache entre todos
+        os processos que carregam o mesmo diretório.
+
+        Args:
+            directory: Diretório com a floresta exportada.
+            mmap: Mapeia os arquivos em memória em vez de copiá-los.
+
+        Returns:
+            CompiledForest: Floresta carregada.
+        """
+        source = Path(directory)
+        metadata = json.loads((source / _METADATA_FILE).read_text())
+        mmap_mode = "r" if mmap else None
+        arrays = {
+            name: np.load(source / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in _ARRAY_FIELDS
+        }
+        return cls(
+            **arrays,
+            max_depth=int(metadata["max_depth"]),
+            n_features=int(metadata["n_features"]),
+        )
+
+    def apply(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Percorre todas as árvores para todas as linhas de uma só vez.
+
+        Args:
+            matrix: Matriz de entrada com formato ``(n_linhas, n_features)``.
+
+        Returns:
+            np.ndarray: Índices globais das folhas, formato ``(n_linhas, n_árvores)``.
+
+        Raises:
+            ValueError: Se a matriz não tiver a quantidade esperada de features.
+        """
+        matrix = self._check_matrix(matrix)
+        n_rows = matrix.shape[0]
+        nodes = np.broadcast_to(self.roots, (n_rows, self.n_trees)).copy()
+        rows = np.arange(n_rows)[:, None]
+        for _ in range(self.max_depth):
+            go_right = matrix[rows, self.feature[nodes]] > self.threshold[nodes]
+            nodes = self.children[nodes, go_right.view(np.uint8)]
+        return nodes
+
+    def _check_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Converte a entrada para float64 e verifica o formato.
+
+        Args:
+            matrix: Matriz de entrada com formato ``(n_linhas, n_features)``.
+
+        Returns:
+            np.ndarray: Matriz em float64.
+
+        Raises:
+            ValueError: Se a matriz não tiver a quantidade esperada de features.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] != self.n_features:
+            raise ValueError(
+                f"Entrada com formato {matrix.shape} incompatível com "
+                f"{self.n_features} features."
+            )
+        return matrix
+
+    def predict_per_tree(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Calcula a predição de cada árvore para cada linha.
+
+        Args:
+            matrix: Matriz de entrada com formato ``(n_linhas, n_features)``.
+
+        Returns:
+            np.ndarray: Predições float64 com formato ``(n_linhas, n_árvores)``,
+                mesmo quando os valores estão quantizados.
+        """
+        return self.value[self.apply(matrix)].astype(np.float64, copy=False)
+
+    def predict(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Calcula a predição da floresta (média das árvores) para cada linha.
+
+        Args:
+            matrix: Matriz de entrada com formato ``(n_linhas, n_features)``.
+
+        Returns:
+            np.ndarray: Predições com formato ``(n_linhas,)``.
+        """
+        return self.predict_per_tree(matrix).mean(axis=1)
+
+
+@dataclass(frozen=True)
+class ForestExplainer:
+    """
+    Decompõe as predições de uma floresta em contribuições aditivas por feature.
+
+    Segue a decomposição por caminho de Saabas: ao descer de um nó para um
+    filho, a variação do valor médio do alvo é atribuída à feature testada no
+    nó. A predição de cada árvore é o valor da raiz mais a soma das variações
+    no caminho; na floresta, ``bias`` (a média das raízes) mais a média das
+    contribuições de todas as árvores.
+
+    Attributes:
+        forest: Floresta explicada.
+        deltas: Variação do valor ao descer para o filho esquerdo e direito de
+            cada nó, formato ``(n_nós, 2)``; nula nas folhas.
+        bias: Média dos valores das raízes.
+    """
+
+    forest: CompiledForest
+    deltas: np.ndarray
+    bias: float
+
+    @classmethod
+    def from_forest(cls, forest: CompiledForest) -> ForestExplainer:
+        """
+        Pré-calcula as variações de valor de cada nó da floresta.
+
+        Args:
+            forest: Floresta compilada.
+
+        Returns:
+            ForestExplainer: Explicador da floresta.
+        """
+        value = np.asarray(forest.value, dtype=np.float64)
+        return cls(
+            forest=forest,
+            deltas=np.ascontiguousarray(value[forest.children] - value[:, None]),
+            bias=float(value[forest.roots].mean()),
+        )
+
+    def explain(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Calcula as contribuições de todas as linhas em uma única travessia.
+
+        As variações de cada passo são somadas por (linha, feature) com um
+        ``bincount``, sem laço por árvore ou por linha.
+
+        Args:
+            matrix: Matriz de entrada com formato ``(n_linhas, n_features)``.
+
+        Returns:
+            np.ndarray: Matriz ``(n_linhas, 2 + n_features)`` com a predição,
+                ``bias`` e a contribuição de cada feature.
+
+        Raises:
+            ValueError: Se a matriz não tiver a quantidade esperada de features.
+        """
+        forest = self.forest
+        matrix = forest._check_matrix(matrix)
+        n_rows, n_features = matrix.shape
+        nodes = np.broadcast_to(forest.roots, (n_rows, forest.n_trees)).copy()
+        rows = np.arange(n_rows)[:, None]
+        offsets = rows * n_features
+        totals = np.zeros(n_rows * n_features)
+        for _ in range(forest.max_depth):
+            feature = forest.feature[nodes]
+            go_right = (matrix[rows, feature] > forest.threshold[nodes]).view(np.uint8)
+            totals += np.bincount(
+                (offsets + feature).ravel(),
+                weights=self.deltas[nodes, go_right].ravel(),
+                minlength=totals.size,
+            )
+            nodes = forest.children[nodes, go_right]
+
+        contributions = totals.reshape(n_rows, n_features) / forest.n_trees
+        prediction = forest.value[nodes].astype(np.float64).mean(axis=1)
+        return np.column_stack(
+            [prediction, np.full(n_rows, self.bias), contributions]
+        )
+
+
+def prediction_intervals(
+    per_tree: np.ndarray, method: str, coverage: float
+) -> np.ndarray:
+    """
+    Calcula a predição e um intervalo a partir das predições de cada árvore.
+
+    Com ``quantile``, os limites são os quantis ``(1 - coverage) / 2`` e
+    ``(1 + coverage) / 2`` das árvores; com ``std``, são a média mais ou menos
+    o desvio padrão entre as árvores multiplicado pelo quantil normal da
+    cobertura.
+
+    Args:
+        per_tree: Predições com formato ``(n_linhas, n_árvores)``.
+        method: ``quantile`` ou ``std``.
+        coverage: Cobertura nominal do intervalo, entre 0 e 1.
+
+    Returns:
+        np.ndarray: Matriz ``(n_linhas, 3)`` com predição, limite inferior e
+            limite superior.
+
+    Raises:
+        ValueError: Se o método for desconhecido ou a cobertura inválida.
+    """
+    if not 0 < coverage < 1:
+        raise ValueError(f"Cobertura {coverage} fora do intervalo (0, 1).")
+    mean = per_tree.mean(axis=1)
+    if method == "quantile":
+        tail = (1 - coverage) / 2
+        lower, upper = np.quantile(per_tree, [tail, 1 - tail], axis=1)
+    elif method == "std":
+        spread = NormalDist().inv_cdf((1 + coverage) / 2) * per_tree.std(axis=1)
+        lower, upper = mean - spread, mean + spread
+    else:
+        raise ValueError(f"Método de intervalo desconhecido: {method}.")
+    return np.column_stack([mean, lower, upper])
+
+
+def is_exported_forest(directory: str | Path) -> bool:
+    """
+    Verifica se um diretório contém uma floresta exportada completa.
+
+    Args:
+        directory: Diretório a verificar.
+
+    Returns:
+        bool: True se os metadados da exportação estiverem presentes.
+    """
+    return (Path(directory) / _METADATA_FILE).is_file()
+
+
+def _split_pipeline(model: Any) -> tuple[list[Any], Any]:
+    """
+    Separa as etapas de pré-processamento do estimador final.
+
+    Args:
+        model: Pipeline do Scikit-learn ou estimador isolado.
+
+    Returns:
+        tuple[list[Any], Any]: Transformadores e estimador final.
+    """
+    steps = getattr(model, "steps", None)
+    if steps is None:
+        return [], model
+    return [step for _, step in steps[:-1]], steps[-1][1]
+
+
+def _resolve_scaling(
+    transformers: list[Any], n_features: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Combina os StandardScaler do pipeline em uma única transformação afim.
+
+    Args:
+        transformers: Etapas de pré-processamento do pipeline.
+        n_features: Quantidade de features de entrada.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Escala e deslocamento tais que
+            ``x = z * escala + deslocamento``.
+
+    Raises:
+        ValueError: Se alguma etapa não puder ser incorporada aos thresholds.
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    scale = np.ones(n_features, dtype=np.float64)
+    offset = np.zeros(n_features, dtype=np.float64)
+    for transformer in transformers:
+        if transformer is None or transformer == "passthrough":
+            continue
+        if not isinstance(transformer, StandardScaler):
+            raise ValueError(
+                f"Etapa {type(transformer).__name__} não suportada "
+                "pelo motor compilado."
+            )
+        # ``mean_`` é calculado mesmo com with_mean=False; valem as flags
+        step_scale = np.ones(n_features)
+        if transformer.with_std and transformer.scale_ is not None:
+            step_scale = transformer.scale_
+        step_mean = np.zeros(n_features)
+        if transformer.with_mean and transformer.mean_ is not None:
+            step_mean = transformer.mean_
+        # Composição: z_novo = (z - mean) / scale  =>  z = z_novo * scale + mean
+        offset = offset + scale * step_mean
+        scale = scale * step_scale
+    return scale, offset
+
+
+def compile_pipeline(
+    model: Any,
+    feature_order: Sequence[str] | None = None,
+) -> CompiledForest:
+    """
+    Compila um pipeline treinado em uma CompiledForest.
+
+    Suporta pipelines compostos por StandardScaler seguidos de um
+    RandomForestRegressor, ExtraTreesRegressor ou DecisionTreeRegressor de
+    saída única.
+
+    Args:
+        model: Pipeline ou estimador treinado.
+        feature_order: Ordem das colunas da matriz de entrada. Quando o modelo
+            foi treinado com nomes de features, os índices são remapeados.
+
+    Returns:
+        CompiledForest: Floresta compilada.
+
+    Raises:
+        ValueError: Se o modelo possuir etapas ou estimadores não suportados.
+    """
+    from sklearn.tree import BaseDecisionTree
+
+    transformers, estimator = _split_pipeline(model)
+    estimators = getattr(estimator, "estimators_", None)
+    if estimators is None:
+        estimators = [estimator]
+    if not all(isinstance(tree, BaseDecisionTree) for tree in estimators):
+        raise ValueError(
+            f"Estimador {type(estimator).__name__} não suportado pelo motor compilado."
+        )
+    if getattr(estimator, "n_outputs_", 1) != 1:
+        raise ValueError("O motor compilado suporta apenas modelos de saída única.")
+
+    n_features = int(estimators[0].n_features_in_)
+    scale, offset = _resolve_scaling(transformers, n_features)
+
+    # Mapeia a posição da feature no modelo para a coluna da matriz de entrada
+    column_of = np.arange(n_features)
+    trained_names = getattr(model, "feature_names_in_", None)
+    if feature_order is not None and trained_names is not None:
+        trained_names = list(trained_names)
+        if sorted(trained_names) != sorted(feature_order):
+            raise ValueError(
+                f"Features do modelo {trained_names} não correspondem a "
+                f"{list(feature_order)}."
+            )
+        column_of = np.array([list(feature_order).index(n) for n in trained_names])
+
+    features, thresholds, children, values, roots = [], [], [], [], []
+    max_depth = 0
+    offset_nodes = 0
+    for tree in estimators:
+        tree_ = tree.tree_
+        node_count = tree_.node_count
+        is_leaf = tree_.children_left < 0
+        local_ids = np.arange(node_count)
+
+        feature = np.where(is_leaf, 0, tree_.feature)
+        threshold = tree_.threshold * scale[feature] + offset[feature]
+        threshold = np.where(is_leaf, np.inf, threshold)
+        left = np.where(is_leaf, local_ids, tree_.children_left) + offset_nodes
+        right = np.where(is_leaf, local_ids, tree_.children_right) + offset_nodes
+
+        features.append(column_of[feature])
+        thresholds.append(threshold)
+        children.append(np.stack([left, right], axis=1))
+        values.append(tree_.value[:, 0, 0])
+        roots.append(offset_nodes)
+        max_depth = max(max_depth, int(tree_.max_depth))
+        offset_nodes += node_count
+
+    forest = CompiledForest(
+        feature=np.ascontiguousarray(np.concatenate(features), dtype=np.intp),
+        threshold=np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64),
+        children=np.ascontiguousarray(np.concatenate(children), dtype=np.intp),
+        value=np.ascontiguousarray(np.concatenate(values), dtype=np.float64),
+        roots=np.asarray(roots, dtype=np.intp),
+        max_depth=max_depth,
+        n_features=n_features,
+    )
+    log.info(
+        "Floresta compilada | árvores=%s | nós=%s | profundidade=%s",
+        forest.n_trees,
+        forest.n_nodes,
+        forest.max_depth,
+    )
+    return forest
+
+
+def build_parity_rows(
+    forest: CompiledForest,
+    n_rows: int = DEFAULT_PARITY_ROWS,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Gera linhas sintéticas cobrindo a faixa de thresholds de cada feature.
+
+    Args:
+        forest: Floresta compilada.
+        n_rows: Quantidade de linhas geradas.
+        random_state: Semente aleatória para reprodutibilidade.
+
+    Returns:
+        np.ndarray: Matriz com formato ``(n_rows, n_features)``.
+    """
+    rng = np.random.default_rng(random_state)
+    split_nodes = np.isfinite(forest.threshold)
+    low = np.zeros(forest.n_features)
+    high = np.ones(forest.n_features)
+    for column in range(forest.n_features):
+        column_thresholds = forest.threshold[
+            split_nodes & (forest.feature == column)
+        ]
+        if column_thresholds.size:
+            margin = 0.1 * (np.ptp(column_thresholds) or 1.0)
+            low[column] = column_thresholds.min() - margin
+            high[column] = column_thresholds.max() + margin
+    return rng.uniform(low, high, size=(n_rows, forest.n_features))
+
+
+def check_parity(
+    forest: CompiledForest,
+    reference_predict: Callable[[np.ndarray], Any],
+    rows: np.ndarray | None = None,
+    tolerance: float = DEFAULT_PARITY_TOLERANCE,
+) -> float:
+    """
+    Compara as predições da floresta compilada com as do modelo original.
+
+    Args:
+        forest: Floresta compilada.
+        reference_predict: Função de predição do modelo original, recebendo a
+            matriz de entrada na mesma ordem de colunas da floresta.
+        rows: Linhas de verificação; geradas sinteticamente se omitidas.
+        tolerance: Diferença absoluta máxima aceita.
+
+    Returns:
+        float: Maior diferença absoluta observada.
+
+    Raises:
+        ValueError: Se alguma predição divergir acima da tolerância.
+    """
+    if rows is None:
+        rows = build_parity_rows(forest)
+    expected = np.asarray(reference_predict(rows), dtype=np.float64).ravel()
+    max_error = float(np.max(np.abs(forest.predict(rows) - expected)))
+    if max_error > tolerance:
+        raise ValueError(
+            f"Floresta compilada diverge do modelo original (erro máximo "
+            f"{max_error:.3e} > {tolerance:.1e})."
+        )
+    log.debug("Paridade verificada | erro máximo=%.3e", max_error)
+    return max_error
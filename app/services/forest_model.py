@@ -0,0 +1,64 @@
+"""
+Modelo pyfunc do MLflow que serve uma CompiledForest exportada.
+
+Usado para registrar variantes da floresta que não têm mais um estimador
+Scikit-learn equivalente, como as comprimidas por ``scripts/compress.py``.
+Importa o MLflow no nível do módulo; por isso a aplicação só o carrega ao
+desserializar um modelo desse tipo.
+"""
+
+from typing import Any
+
+import mlflow.pyfunc
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.services.forest import CompiledForest
+
+FOREST_ARTIFACT: str = "forest"
+
+
+class CompiledForestModel(mlflow.pyfunc.PythonModel):
+    """
+    Modelo pyfunc que prediz com uma CompiledForest.
+
+    A floresta é salva como artefato ``forest`` (diretório exportado por
+    ``CompiledForest.save``) e mapeada em memória ao carregar o modelo.
+
+    Attributes:
+        forest: Floresta carregada por ``load_context``.
+    """
+
+    forest: CompiledForest | None = None
+
+    def load_context(self, context: mlflow.pyfunc.PythonModelContext) -> None:
+        """
+        Carrega a floresta a partir dos artefatos do modelo.
+
+        Args:
+            context: Contexto do MLflow com os caminhos dos artefatos.
+        """
+        self.forest = CompiledForest.load(context.artifacts[FOREST_ARTIFACT])
+
+    def predict(
+        self,
+        context: mlflow.pyfunc.PythonModelContext,
+        model_input: pd.DataFrame,
+        params: dict[str, Any] | None = None,
+    ) -> np.ndarray:
+        """
+        Prediz o valor dos imóveis.
+
+        Args:
+            context: Contexto do MLflow.
+            model_input: DataFrame com as colunas de ``FEATURE_ORDER`` ou
+                matriz já na ordem de ``FEATURE_ORDER``.
+            params: Parâmetros de inferência (não utilizados).
+
+        Returns:
+            np.ndarray: Predições em float64, uma por linha.
+        """
+        if hasattr(model_input, "columns"):
+            model_input = model_input[settings.FEATURE_ORDER].to_numpy()
+        return self.forest.predict(np.asarray(model_input, dtype=np.float64))
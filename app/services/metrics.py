@@ -0,0 +1,458 @@
+"""
+Métricas de latência por etapa e contadores no formato texto do Prometheus.
+
+As etapas instrumentadas no caminho de predição são:
+- parse: leitura do corpo e decodificação do JSON.
+- validate: validação do PredictionInput.
+- convert: montagem do array NumPy ou DataFrame de entrada.
+- predict: chamada ao modelo.
+- serialize: validação e serialização da resposta.
+
+Com ``INFERENCE_EXECUTOR=process`` as etapas convert e predict rodam nos
+processos do pool e não são agregadas no processo da API.
+"""
+
+import bisect
+import math
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from contextlib import nullcontext
+from typing import Any
+
+from app.config import settings
+
+# 10 µs a ~10 s e 1 a 16384 linhas, em potências de 2
+LATENCY_BUCKETS: tuple[float, ...] = tuple(1e-5 * 2**power for power in range(21))
+BATCH_SIZE_BUCKETS: tuple[float, ...] = tuple(float(2**power) for power in range(15))
+QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _format_labels(labels: LabelKey, extra: LabelKey = ()) -> str:
+    """
+    Formata labels no padrão ``{chave="valor",...}`` do Prometheus.
+
+    Args:
+        labels: Pares (nome, valor) da série.
+        extra: Pares adicionais (ex.: ``le`` ou ``quantile``).
+
+    Returns:
+        str: Labels formatados, ou string vazia se não houver labels.
+    """
+    pairs = (*labels, *extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """
+    Formata um valor numérico para o formato texto do Prometheus.
+
+    Args:
+        value: Valor da amostra.
+
+    Returns:
+        str: Valor formatado.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def format_metric(
+    name: str,
+    metric_type: str,
+    help_text: str,
+    samples: Iterable[tuple[LabelKey, float]],
+) -> list[str]:
+    """
+    Monta as linhas de uma família de métricas simples (counter ou gauge).
+
+    Args:
+        name: Nome da métrica.
+        metric_type: Tipo Prometheus (counter ou gauge).
+        help_text: Descrição da métrica.
+        samples: Pares (labels, valor).
+
+    Returns:
+        list[str]: Linhas no formato texto do Prometheus.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    lines.extend(
+        f"{name}{_format_labels(labels)} {_format_value(value)}"
+        for labels, value in samples
+    )
+    return lines
+
+
+class Counter:
+    """
+    Contador monotônico com labels.
+
+    Attributes:
+        name: Nome da métrica.
+        help_text: Descrição da métrica.
+    """
+
+    def __init__(self, name: str, help_text: str) -> None:
+        """
+        Inicializa o contador.
+
+        Args:
+            name: Nome da métrica.
+            help_text: Descrição da métrica.
+        """
+        self.name = name
+        self.help_text = help_text
+        self._values: dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Incrementa o contador da série indicada pelos labels.
+
+        Args:
+            amount: Valor a somar.
+            **labels: Labels da série.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """
+        Retorna o valor atual de uma série.
+
+        Args:
+            **labels: Labels da série.
+
+        Returns:
+            float: Valor acumulado.
+        """
+        return self._values.get(tuple(sorted(labels.items())), 0.0)
+
+    def render(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Linhas no formato texto do Prometheus.
+        """
+        with self._lock:
+            samples = sorted(self._values.items())
+        return format_metric(self.name, "counter", self.help_text, samples)
+
+
+class HistogramSeries:
+    """
+    Série de um histograma de buckets fixos.
+
+    Attributes:
+        labels: Labels da série.
+        count: Quantidade de observações.
+        total: Soma das observações.
+    """
+
+    def __init__(self, buckets: Sequence[float], labels: LabelKey) -> None:
+        """
+        Inicializa a série.
+
+        Args:
+            buckets: Limites superiores dos buckets, em ordem crescente.
+            labels: Labels da série.
+        """
+        self.labels = labels
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Registra uma observação.
+
+        Args:
+            value: Valor observado.
+        """
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima um quantil por interpolação linear dentro do bucket.
+
+        Args:
+            q: Quantil desejado, entre 0 e 1.
+
+        Returns:
+            float: Valor estimado, ou NaN se não houver observações.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count = self.count
+        if not count:
+            return math.nan
+        rank = q * count
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self._buckets):
+                    return self._buckets[-1]
+                lower = self._buckets[index - 1] if index else 0.0
+                upper = self._buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self._buckets[-1]
+
+    def render(self, name: str) -> list[str]:
+        """
+        Monta as linhas de buckets, soma e contagem da série.
+
+        Args:
+            name: Nome da métrica.
+
+        Returns:
+            list[str]: Linhas no formato texto do Prometheus.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count, total = self.count, self.total
+        lines = []
+        cumulative = 0
+        for upper, bucket_count in zip(
+            (*self._buckets, math.inf), counts, strict=True
+        ):
+            cumulative += bucket_count
+            le = (("le", _format_value(upper)),)
+            lines.append(
+                f"{name}_bucket{_format_labels(self.labels, le)} {cumulative}"
+            )
+        lines.append(f"{name}_sum{_format_labels(self.labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(self.labels)} {count}")
+        return lines
+
+
+class Histogram:
+    """
+    Histograma de buckets fixos com quantis estimados.
+
+    Além das séries ``_bucket``, ``_sum`` e ``_count``, exporta os quantis
+    p50/p90/p99 estimados como gauge ``<nome>_quantile``.
+
+    Attributes:
+        name: Nome da métrica.
+        help_text: Descrição da métrica.
+        buckets: Limites superiores dos buckets.
+    """
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]) -> None:
+        """
+        Inicializa o histograma.
+
+        Args:
+            name: Nome da métrica.
+            help_text: Descrição da métrica.
+            buckets: Limites superiores dos buckets, em ordem crescente.
+        """
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self._series: dict[LabelKey, HistogramSeries] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: str) -> HistogramSeries:
+        """
+        Retorna a série dos labels indicados, criando-a se necessário.
+
+        Args:
+            **labels: Labels da série.
+
+        Returns:
+            HistogramSeries: Série do histograma.
+        """
+        key = tuple(sorted(labels.items()))
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(
+                    key, HistogramSeries(self.buckets, key)
+                )
+        return series
+
+    def render(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Linhas no formato texto do Prometheus.
+        """
+        series_list = [self._series[key] for key in sorted(self._series)]
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for series in series_list:
+            lines.extend(series.render(self.name))
+        lines.extend(
+            format_metric(
+                f"{self.name}_quantile",
+                "gauge",
+                f"Quantis estimados de {self.name}.",
+                (
+                    ((*series.labels, ("quantile", str(q))), series.quantile(q))
+                    for series in series_list
+                    for q in QUANTILES
+                ),
+            )
+        )
+        return lines
+
+
+class _StageTimer:
+    """
+    Context manager que registra a duração de uma etapa em uma série.
+    """
+
+    __slots__ = ("series", "started_at")
+
+    def __init__(self, series: HistogramSeries) -> None:
+        self.series = series
+        self.started_at = 0.0
+
+    def __enter__(self) -> "_StageTimer":
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.series.observe(time.perf_counter() - self.started_at)
+
+
+_DISABLED_TIMER = nullcontext()
+
+
+class MetricsRegistry:
+    """
+    Registro das métricas da aplicação.
+
+    A instrumentação pode ser desligada por ``METRICS_ENABLED``, lido a cada
+    uso, de modo que o custo da própria instrumentação possa ser medido.
+
+    Attributes:
+        stage_seconds: Duração de cada etapa do caminho de predição.
+        batch_size: Quantidade de linhas por chamada ao modelo.
+        requests: Requisições atendidas por rota e status.
+        errors: Requisições com status de erro por rota e status.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializa as métricas da aplicação.
+        """
+        self.stage_seconds = Histogram(
+            "prediction_stage_duration_seconds",
+            "Duração de cada etapa do caminho de predição.",
+            LATENCY_BUCKETS,
+        )
+        self.batch_size = Histogram(
+            "prediction_batch_size",
+            "Quantidade de linhas por chamada ao modelo.",
+            BATCH_SIZE_BUCKETS,
+        )
+        self.requests = Counter(
+            "http_requests_total", "Requisições atendidas por rota e status."
+        )
+        self.errors = Counter(
+            "http_request_errors_total", "Requisições com erro por rota e status."
+        )
+        self._stage_series: dict[str, HistogramSeries] = {}
+
+    def _stage(self, stage: str) -> HistogramSeries:
+        """
+        Retorna a série de uma etapa, evitando montar os labels a cada chamada.
+
+        Args:
+            stage: Nome da etapa.
+
+        Returns:
+            HistogramSeries: Série da etapa.
+        """
+        series = self._stage_series.get(stage)
+        if series is None:
+            series = self._stage_series[stage] = self.stage_seconds.labels(stage=stage)
+        return series
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: True se a instrumentação estiver habilitada.
+        """
+        return settings.METRICS_ENABLED
+
+    def time(self, stage: str) -> Any:
+        """
+        Retorna um context manager que mede a duração de uma etapa.
+
+        Args:
+            stage: Nome da etapa (ex.: ``predict``).
+
+        Returns:
+            Any: Context manager de medição, ou nulo se desabilitado.
+        """
+        if not settings.METRICS_ENABLED:
+            return _DISABLED_TIMER
+        return _StageTimer(self._stage(stage))
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """
+        Registra a duração de uma etapa medida externamente.
+
+        Args:
+            stage: Nome da etapa.
+            seconds: Duração, em segundos.
+        """
+        if settings.METRICS_ENABLED:
+            self._stage(stage).observe(seconds)
+
+    def observe_batch_size(self, size: int) -> None:
+        """
+        Registra o tamanho de um lote enviado ao modelo.
+
+        Args:
+            size: Quantidade de linhas.
+        """
+        if settings.METRICS_ENABLED:
+            self.batch_size.labels().observe(size)
+
+    def record_request(self, route: str, status_code: int) -> None:
+        """
+        Registra uma requisição atendida.
+
+        Args:
+            route: Caminho da rota (ex.: ``/predict/``).
+            status_code: Status HTTP da resposta.
+        """
+        if not settings.METRICS_ENABLED:
+            return
+        status_label = str(status_code)
+        self.requests.inc(route=route, status=status_label)
+        if status_code >= 400:
+            self.errors.inc(route=route, status=status_label)
+
+    def render(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Linhas de todas as métricas registradas.
+        """
+        return [
+            *self.requests.render(),
+            *self.errors.render(),
+            *self.stage_seconds.render(),
+            *self.batch_size.render(),
+        ]
+
+
+metrics = MetricsRegistry()
@@ -1,20 +1,211 @@
 """
 Serviço de predição de preços de imóveis.
+
+O MLflow e o pandas são importados apenas quando o modelo é carregado ou o
+backend pyfunc é usado, para que importar a aplicação seja rápido.
 """
 
-from functools import lru_cache
+import asyncio
+import copy
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
 
-import mlflow
-import mlflow.pyfunc
-import pandas as pd
+import numpy as np
 
 from app.config import settings
 from app.schemas.prediction import PredictionInput, PredictionOutput
-from utils.logger import get_logger
+from app.services.cache import PredictionCache, get_prediction_cache
+from app.services.executor import InferenceExecutor
+from app.services.forest import (
+    CompiledForest,
+    ForestExplainer,
+    check_parity,
+    compile_pipeline,
+    is_exported_forest,
+    prediction_intervals,
+)
+from app.services.metrics import metrics
+from utils.logger import SAMPLED, get_logger
 
 log = get_logger(__name__)
 
 
+def _unwrap_sklearn_model(model: Any) -> Any | None:
+    """
+    Recupera o modelo Scikit-learn encapsulado por um modelo pyfunc.
+
+    Args:
+        model: Modelo carregado via ``mlflow.pyfunc.load_model``.
+
+    Returns:
+        Any | None: Modelo Scikit-learn subjacente ou None se o flavor não
+            expuser um estimador do Scikit-learn.
+    """
+    from sklearn.base import BaseEstimator
+
+    try:
+        raw_model = model.get_raw_model()
+    except (AttributeError, NotImplementedError):
+        raw_model = getattr(getattr(model, "_model_impl", None), "sklearn_model", None)
+    return raw_model if isinstance(raw_model, BaseEstimator) else None
+
+
+def _fast_path_model(model: Any) -> Any | None:
+    """
+    Prepara a cópia do modelo Scikit-learn usada pelo caminho rápido.
+
+    O pipeline é treinado com DataFrame e guarda ``feature_names_in_``, o que
+    faria o Scikit-learn emitir um aviso a cada predição com array NumPy. A
+    cópia é rasa e remove apenas esses nomes: os parâmetros ajustados continuam
+    compartilhados com o modelo original.
+
+    Args:
+        model: Modelo Scikit-learn treinado.
+
+    Returns:
+        Any | None: Cópia que aceita arrays na ordem de ``FEATURE_ORDER``, ou
+            None se o modelo foi treinado com outra ordem de colunas.
+    """
+    from sklearn.base import BaseEstimator
+    from sklearn.pipeline import Pipeline
+
+    names = getattr(model, "feature_names_in_", None)
+    if names is not None and list(names) != list(settings.FEATURE_ORDER):
+        log.warning("Caminho rápido desabilitado: ordem das features diverge")
+        return None
+
+    def without_names(estimator: Any) -> Any:
+        if not isinstance(estimator, BaseEstimator):
+            return estimator
+        estimator = copy.copy(estimator)
+        estimator.__dict__.pop("feature_names_in_", None)
+        return estimator
+
+    if not isinstance(model, Pipeline):
+        return without_names(model)
+    fast_model = copy.copy(model)
+    fast_model.steps = [(name, without_names(step)) for name, step in model.steps]
+    return fast_model
+
+
+def _unwrap_packaged_forest(model: Any) -> CompiledForest | None:
+    """
+    Recupera a floresta de um modelo registrado como CompiledForestModel.
+
+    Args:
+        model: Modelo carregado via ``mlflow.pyfunc.load_model``.
+
+    Returns:
+        CompiledForest | None: Floresta empacotada no modelo, ou None se o
+            modelo for de outro tipo.
+    """
+    try:
+        python_model = model.unwrap_python_model()
+    except Exception:
+        return None
+    forest = getattr(python_model, "forest", None)
+    return forest if isinstance(forest, CompiledForest) else None
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """
+    Versão do modelo carregada e pronta para predições.
+
+    O serviço mantém uma única referência para a instância ativa; a troca de
+    versão substitui essa referência de forma atômica, e predições em
+    andamento concluem com a instância que capturaram no início.
+
+    Attributes:
+        model: Modelo pyfunc carregado do MLflow.
+        version: Versão do modelo no Model Registry.
+        model_uri: URI usada no carregamento.
+        sklearn_model: Cópia do modelo Scikit-learn subjacente sem nomes de
+            features, usada pelo caminho rápido sem pandas quando o flavor
+            carregado o expõe.
+        forest: Floresta compilada usada como backend alternativo.
+        loaded_at: Instante do carregamento, em segundos desde a época.
+    """
+
+    model: Any
+    version: str
+    model_uri: str
+    sklearn_model: Any = None
+    forest: CompiledForest | None = None
+    loaded_at: float = field(default_factory=time.time)
+
+    @cached_property
+    def tree_forest(self) -> CompiledForest | None:
+        """
+        Floresta usada para obter as predições de cada árvore.
+
+        É o backend compilado, quando ativo. Caso contrário, o modelo
+        Scikit-learn é compilado no primeiro acesso, para que predições que
+        não usam as saídas por árvore não paguem essa compilação.
+
+        Returns:
+            CompiledForest | None: Floresta equivalente ao modelo, ou None se
+                o modelo não puder ser compilado.
+        """
+        if self.forest is not None:
+            return self.forest
+        # O modelo original: a cópia do caminho rápido não tem nomes de features
+        sklearn_model = _unwrap_sklearn_model(self.model)
+        if sklearn_model is None:
+            return None
+
+        def reference_predict(rows: np.ndarray) -> Any:
+            import pandas as pd
+
+            frame = pd.DataFrame(rows, columns=settings.FEATURE_ORDER)
+            return sklearn_model.predict(frame)
+
+        try:
+            forest = compile_pipeline(sklearn_model, settings.FEATURE_ORDER)
+            check_parity(
+                forest,
+                reference_predict,
+                tolerance=settings.COMPILED_PARITY_TOLERANCE,
+            )
+        except Exception as error:
+            log.warning("Predições por árvore indisponíveis: %s", error)
+            return None
+        return forest
+
+    @cached_property
+    def explainer(self) -> ForestExplainer | None:
+        """
+        Decomposição por caminho usada nas explicações das predições.
+
+        Returns:
+            ForestExplainer | None: Explicador de ``tree_forest``, ou None se
+                o modelo não expuser as árvores.
+        """
+        forest = self.tree_forest
+        return None if forest is None else ForestExplainer.from_forest(forest)
+
+
+def resolve_registry_version() -> str:
+    """
+    Consulta a versão do modelo apontada pelo alias no Model Registry.
+
+    Returns:
+        str: Versão do modelo.
+    """
+    from mlflow import MlflowClient
+
+    model_version = MlflowClient().get_model_version_by_alias(
+        settings.MODEL_NAME, settings.MODEL_STAGE
+    )
+    return str(model_version.version)
+
+
 class PredictorService:
     """
     Serviço responsável por carregar o modelo e realizar predições.
@@ -22,6 +213,14 @@ class PredictorService:
     Attributes:
         model: Modelo de Machine Learning carregado do MLflow.
         model_uri: URI do modelo no MLflow Model Registry.
+        model_version: Versão do modelo resolvida no Model Registry.
+        cache: Cache de predições, quando habilitado nas settings.
+        sklearn_model: Cópia do modelo Scikit-learn subjacente sem nomes de
+            features, usada pelo caminho rápido sem pandas quando o flavor
+            carregado o expõe.
+        forest: Floresta compilada usada como backend alternativo, quando
+            ``INFERENCE_BACKEND`` é ``compiled`` e a verificação de paridade passa.
+        last_swap_at: Instante da última troca de versão, ou None.
     """
 
     def __init__(self) -> None:
@@ -30,17 +229,281 @@ class PredictorService:
 
         Configura o tracking URI do MLflow e carrega o modelo do Model Registry.
         """
+        import mlflow
+
         log.info("Inicializando PredictorService")
         mlflow.set_tracking_uri(settings.MLFLOW_TRACKING_URI)
-        self.model_uri = f"models:/{settings.MODEL_NAME}@{settings.MODEL_STAGE}"
-        log.debug("Model URI configurada: %s", self.model_uri)
+        self.cache: PredictionCache | None = get_prediction_cache()
+        self.last_swap_at: float | None = None
+        self._feature_getter = attrgetter(*settings.FEATURE_ORDER)
+        self._row_buffers = threading.local()
+        self._reload_lock = threading.Lock()
+
+        model_uri = f"models:/{settings.MODEL_NAME}@{settings.MODEL_STAGE}"
+        self._active = self._load(model_uri)
+
+    @property
+    def model(self) -> Any:
+        """Modelo pyfunc da versão ativa."""
+        return self._active.model
+
+    @model.setter
+    def model(self, value: Any) -> None:
+        """Substitui o modelo pyfunc da versão ativa."""
+        self._active = replace(self._active, model=value)
+
+    @property
+    def model_uri(self) -> str:
+        """URI usada no carregamento da versão ativa."""
+        return self._active.model_uri
+
+    @property
+    def model_version(self) -> str:
+        """Versão ativa do modelo no Model Registry."""
+        return self._active.version
+
+    @model_version.setter
+    def model_version(self, value: str) -> None:
+        """Substitui o identificador da versão ativa."""
+        self._active = replace(self._active, version=value)
+
+    @property
+    def sklearn_model(self) -> Any:
+        """Modelo Scikit-learn da versão ativa, quando disponível."""
+        return self._active.sklearn_model
+
+    @property
+    def forest(self) -> CompiledForest | None:
+        """Floresta compilada da versão ativa, quando disponível."""
+        return self._active.forest
+
+    @property
+    def loaded_at(self) -> float:
+        """Instante de carregamento da versão ativa."""
+        return self._active.loaded_at
+
+    def _load(self, model_uri: str, version: str | None = None) -> LoadedModel:
+        """
+        Carrega um modelo do MLflow e prepara os backends de predição.
+
+        Args:
+            model_uri: URI do modelo no MLflow.
+            version: Versão já conhecida; resolvida pelo alias se omitida.
+
+        Returns:
+            LoadedModel: Modelo carregado.
+        """
+        log.debug("Model URI configurada: %s", model_uri)
+        shared_path = None
+        if settings.SHARED_MODEL_DIR and settings.INFERENCE_BACKEND == "compiled":
+            if version is None:
+                try:
+                    version = resolve_registry_version()
+                except Exception as error:
+                    log.warning("Modo compartilhado indisponível sem versão: %s", error)
+            if version is not None:
+                shared_path = Path(settings.SHARED_MODEL_DIR) / settings.MODEL_NAME
+                shared_path = shared_path / version
+        if shared_path is not None and is_exported_forest(shared_path):
+            log.info("Mapeando floresta compartilhada de %s", shared_path)
+            return self._prepare_explainer(
+                LoadedModel(
+                    model=None,
+                    version=version,
+                    model_uri=model_uri,
+                    forest=CompiledForest.load(shared_path),
+                )
+            )
+
+        import mlflow.pyfunc
+
         try:
-            self.model = mlflow.pyfunc.load_model(self.model_uri)
+            model = mlflow.pyfunc.load_model(model_uri)
             log.info("Modelo carregado com sucesso a partir do MLflow")
         except Exception as error:
             log.critical("Falha ao carregar modelo do MLflow: %s", error)
             raise
 
+        if version is None:
+            version = self._resolve_model_version(model)
+
+        sklearn_model = None
+        if settings.INPUT_FAST_PATH_ENABLED:
+            sklearn_model = _unwrap_sklearn_model(model)
+        if sklearn_model is not None:
+            sklearn_model = _fast_path_model(sklearn_model)
+        if sklearn_model is not None:
+            log.debug("Caminho rápido sem pandas habilitado")
+
+        # Variantes comprimidas já são uma floresta e não exigem paridade
+        forest = _unwrap_packaged_forest(model)
+        if forest is not None:
+            log.info("Modelo empacotado como floresta compilada; backend compilado")
+        elif settings.INFERENCE_BACKEND == "compiled":
+            forest = self._compile_forest(model)
+        if forest is not None and shared_path is not None:
+            forest = CompiledForest.load(forest.save(shared_path))
+
+        return self._prepare_explainer(
+            LoadedModel(
+                model=model,
+                version=version,
+                model_uri=model_uri,
+                sklearn_model=sklearn_model,
+                forest=forest,
+            )
+        )
+
+    def _prepare_explainer(self, loaded: LoadedModel) -> LoadedModel:
+        """
+        Pré-calcula o explicador do modelo, quando ``EXPLANATIONS_PRECOMPUTE``
+        está habilitado.
+
+        Assim a primeira explicação de cada versão não paga a compilação da
+        floresta nem o cálculo das variações de valor de cada nó.
+
+        Args:
+            loaded: Modelo recém-carregado.
+
+        Returns:
+            LoadedModel: O mesmo modelo, com o explicador já calculado.
+        """
+        if settings.EXPLANATIONS_PRECOMPUTE:
+            if loaded.explainer is None:
+                log.warning("Modelo não expõe as árvores; explicações indisponíveis")
+            else:
+                log.info(
+                    "Explicações por feature pré-calculadas para %s nós",
+                    loaded.explainer.forest.n_nodes,
+                )
+        return loaded
+
+    def _resolve_model_version(self, model: Any) -> str:
+        """
+        Resolve a versão do modelo apontada pelo alias configurado.
+
+        Args:
+            model: Modelo pyfunc carregado, usado como fallback.
+
+        Returns:
+            str: Versão do Model Registry ou, se indisponível, o run_id do
+                modelo carregado prefixado por ``run:``; ``unknown`` se o
+                modelo também não tiver run_id.
+        """
+        try:
+            version = resolve_registry_version()
+        except Exception as error:
+            log.warning("Não foi possível resolver a versão do modelo: %s", error)
+            run_id = getattr(getattr(model, "metadata", None), "run_id", None)
+            version = f"run:{run_id}" if run_id else "unknown"
+        log.info("Versão do modelo ativa: %s", version)
+        return version
+
+    def _compile_forest(self, model: Any) -> CompiledForest | None:
+        """
+        Compila o modelo carregado e verifica a paridade com o modelo original.
+
+        Args:
+            model: Modelo pyfunc carregado.
+
+        Returns:
+            CompiledForest | None: Floresta compilada ou None quando o modelo não
+                é suportado ou diverge do original, mantendo o backend pyfunc.
+        """
+        sklearn_model = _unwrap_sklearn_model(model)
+        if sklearn_model is None:
+            log.warning("Modelo não expõe o Scikit-learn; usando backend pyfunc")
+            return None
+
+        def reference_predict(rows: np.ndarray) -> Any:
+            import pandas as pd
+
+            return model.predict(pd.DataFrame(rows, columns=settings.FEATURE_ORDER))
+
+        try:
+            forest = compile_pipeline(sklearn_model, settings.FEATURE_ORDER)
+            max_error = check_parity(
+                forest,
+                reference_predict,
+                tolerance=settings.COMPILED_PARITY_TOLERANCE,
+            )
+        except Exception as error:
+            log.warning("Motor compilado indisponível, usando pyfunc: %s", error)
+            return None
+
+        log.info("Backend compilado ativo | erro máximo de paridade=%.3e", max_error)
+        return forest
+
+    def reload(self, version: str) -> bool:
+        """
+        Carrega uma nova versão do modelo, aquece e a troca atomicamente.
+
+        O carregamento e o aquecimento acontecem fora do caminho das
+        requisições; predições em andamento terminam com a versão anterior.
+
+        Args:
+            version: Versão do Model Registry a ser carregada.
+
+        Returns:
+            bool: True se a versão foi trocada, False se já estava ativa.
+        """
+        with self._reload_lock:
+            if version == self.model_version:
+                return False
+
+            log.info(
+                "Carregando nova versão do modelo: %s -> %s",
+                self.model_version,
+                version,
+            )
+            loaded = self._load(f"models:/{settings.MODEL_NAME}/{version}", version)
+            self._warm_up(loaded)
+
+            previous_version = self.model_version
+            self._active = loaded
+            self.last_swap_at = time.time()
+            log.info(
+                "Versão do modelo trocada com sucesso: %s -> %s",
+                previous_version,
+                version,
+            )
+            return True
+
+    def warm_up(self, inputs: list[PredictionInput]) -> None:
+        """
+        Executa predições de aquecimento no modelo ativo, sem passar pelo cache.
+
+        Args:
+            inputs: Entradas reproduzidas, uma predição individual por entrada
+                seguida de uma predição em lote com todas elas.
+        """
+        self._warm_up(self._active, inputs)
+
+    def _warm_up(
+        self, loaded: LoadedModel, inputs: list[PredictionInput] | None = None
+    ) -> None:
+        """
+        Executa predições de aquecimento em um modelo ainda não ativo.
+
+        Args:
+            loaded: Modelo recém-carregado.
+            inputs: Entradas reproduzidas; o exemplo do schema repetido
+                ``MODEL_RELOAD_WARMUP_CALLS`` vezes se omitido.
+        """
+        if inputs is None:
+            example = PredictionInput.model_config["json_schema_extra"]["example"]
+            inputs = [PredictionInput(**example)] * settings.MODEL_RELOAD_WARMUP_CALLS
+        if not inputs:
+            return
+        matrix = np.array(
+            [self._feature_getter(item) for item in inputs], dtype=np.float64
+        )
+        for position in range(len(matrix)):
+            self._predict_matrix(matrix[position : position + 1], loaded)
+        if len(matrix) > 1:
+            self._predict_matrix(matrix, loaded)
+        log.debug("Aquecimento concluído com %s predições", len(matrix))
+
     def predict(self, input_data: PredictionInput) -> PredictionOutput:
         """
         Realiza a predição do preço do imóvel.
@@ -54,20 +517,585 @@ class PredictorService:
         Raises:
             ValueError: Se o modelo não estiver carregado.
         """
-        if self.model is None:
+        active = self._active
+        if active.model is None and active.forest is None:
             log.error("Modelo não carregado ao tentar realizar predição")
             raise ValueError("Modelo não foi carregado corretamente.")
 
-        log.debug("Convertendo dados de entrada para DataFrame")
-        input_dict = input_data.model_dump()
-        input_df = pd.DataFrame([input_dict], columns=settings.FEATURE_ORDER)
+        if self.cache is not None:
+            cached_value = self.cache.get("predict", active.version, input_data)
+            if cached_value is not None:
+                log.debug("Predição atendida pelo cache", extra=SAMPLED)
+                return PredictionOutput(predicted_value=cached_value)
+
+        if active.forest is not None or active.sklearn_model is not None:
+            with metrics.time("convert"):
+                row = self._to_row(input_data)
+            with metrics.time("predict"):
+                predicted_value = float(self._predict_matrix(row, active)[0])
+        else:
+            import pandas as pd
 
-        log.debug("Iniciando predição com modelo carregado")
-        prediction = self.model.predict(input_df)
-        predicted_value = float(prediction[0])
-        log.info("Predição concluída com sucesso")
+            log.debug("Convertendo dados de entrada para DataFrame", extra=SAMPLED)
+            with metrics.time("convert"):
+                input_dict = input_data.model_dump()
+                input_df = pd.DataFrame([input_dict], columns=settings.FEATURE_ORDER)
+
+            log.debug("Iniciando predição com modelo carregado", extra=SAMPLED)
+            with metrics.time("predict"):
+                prediction = active.model.predict(input_df)
+            predicted_value = float(prediction[0])
+        metrics.observe_batch_size(1)
+
+        if self.cache is not None:
+            self.cache.set("predict", active.version, input_data, predicted_value)
+        log.info("Predição concluída com sucesso", extra=SAMPLED)
         return PredictionOutput(predicted_value=predicted_value)
 
+    def predict_batch(self, inputs: list[PredictionInput]) -> list[PredictionOutput]:
+        """
+        Realiza a predição de um lote de imóveis com uma única chamada ao modelo.
+
+        Args:
+            inputs: Lista de dados de entrada já validados.
+
+        Returns:
+            list[PredictionOutput]: Predições na mesma ordem da entrada.
+
+        Raises:
+            ValueError: Se o modelo não estiver carregado.
+        """
+        active = self._active
+        if active.model is None and active.forest is None:
+            log.error("Modelo não carregado ao tentar realizar predição em lote")
+            raise ValueError("Modelo não foi carregado corretamente.")
+
+        if not inputs:
+            return []
+
+        log.debug(
+            "Montando matriz de entrada com %s linhas", len(inputs), extra=SAMPLED
+        )
+        with metrics.time("convert"):
+            matrix = np.array(
+                [self._feature_getter(item) for item in inputs], dtype=np.float64
+            )
+        values = self._predict_cached(matrix, active)
+        return [PredictionOutput(predicted_value=value) for value in values.tolist()]
+
+    def predict_matrix(self, matrix: np.ndarray, use_cache: bool = True) -> np.ndarray:
+        """
+        Prediz uma matriz de features já validada.
+
+        Usado pelas entradas em lote validadas de forma vetorizada, que não
+        montam um PredictionInput por linha.
+
+        Args:
+            matrix: Matriz ``(n_linhas, n_features)`` na ordem de
+                ``FEATURE_ORDER``.
+            use_cache: Consulta e alimenta o cache de predições. Desabilitado
+                para linhas sintéticas, como as grades de sensibilidade, que
+                dificilmente se repetem e expulsariam entradas úteis.
+
+        Returns:
+            np.ndarray: Predições em float64, uma por linha.
+
+        Raises:
+            ValueError: Se o modelo não estiver carregado.
+        """
+        active = self._active
+        if active.model is None and active.forest is None:
+            log.error("Modelo não carregado ao tentar realizar predição em lote")
+            raise ValueError("Modelo não foi carregado corretamente.")
+
+        if not use_cache:
+            with metrics.time("predict"):
+                values = self._predict_matrix(matrix, active)
+            metrics.observe_batch_size(len(matrix))
+            return values
+        return self._predict_cached(matrix, active)
+
+    def predict_intervals(
+        self, matrix: np.ndarray, method: str, coverage: float
+    ) -> np.ndarray:
+        """
+        Prediz uma matriz de features com intervalos de predição.
+
+        As predições de todas as árvores são calculadas em uma única travessia
+        vetorizada, e a predição pontual é a média delas, como em ``predict``.
+
+        Args:
+            matrix: Matriz ``(n_linhas, n_features)`` na ordem de
+                ``FEATURE_ORDER``.
+            method: ``quantile`` ou ``std`` (ver ``prediction_intervals``).
+            coverage: Cobertura nominal do intervalo, entre 0 e 1.
+
+        Returns:
+            np.ndarray: Matriz ``(n_linhas, 3)`` com predição, limite inferior
+                e limite superior.
+
+        Raises:
+            ValueError: Se o modelo não estiver carregado.
+            NotImplementedError: Se o modelo não expuser as predições por árvore.
+        """
+        active = self._active
+        if active.model is None and active.forest is None:
+            log.error("Modelo não carregado ao tentar realizar predição com intervalo")
+            raise ValueError("Modelo não foi carregado corretamente.")
+
+        forest = active.tree_forest
+        if forest is None:
+            raise NotImplementedError(
+                "O modelo ativo não expõe as predições por árvore; "
+                "intervalos indisponíveis."
+            )
+
+        def compute(rows: np.ndarray) -> np.ndarray:
+            per_tree = forest.predict_per_tree(rows)
+            return prediction_intervals(per_tree, method, coverage)
+
+        return self._predict_cached(
+            matrix, active, f"interval:{method}:{coverage!r}", compute, width=3
+        )
+
+    def explain_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Explica as predições de uma matriz de features já validada.
+
+        Args:
+            matrix: Matriz ``(n_linhas, n_features)`` na ordem de
+                ``FEATURE_ORDER``.
+
+        Returns:
+            np.ndarray: Matriz ``(n_linhas, 2 + n_features)`` com a predição,
+                o valor base e a contribuição de cada feature, na ordem de
+                ``FEATURE_ORDER``.
+
+        Raises:
+            ValueError: Se o modelo não estiver carregado.
+            NotImplementedError: Se o modelo não expuser as árvores.
+        """
+        active = self._active
+        if active.model is None and active.forest is None:
+            log.error("Modelo não carregado ao tentar explicar predições")
+            raise ValueError("Modelo não foi carregado corretamente.")
+
+        explainer = active.explainer
+        if explainer is None:
+            raise NotImplementedError(
+                "Explicações indisponíveis: o modelo ativo não expõe as árvores."
+            )
+        return self._predict_cached(
+            matrix,
+            active,
+            "explain",
+            explainer.explain,
+            width=2 + len(settings.FEATURE_ORDER),
+        )
+
+    def _predict_cached(
+        self,
+        matrix: np.ndarray,
+        active: LoadedModel,
+        namespace: str = "predict",
+        compute: Callable[[np.ndarray], np.ndarray] | None = None,
+        width: int | None = None,
+    ) -> np.ndarray:
+        """
+        Prediz uma matriz consultando o cache linha a linha.
+
+        Apenas as linhas ausentes do cache são enviadas ao modelo, em uma única
+        chamada.
+
+        Args:
+            matrix: Matriz ``(n_linhas, n_features)`` na ordem de
+                ``FEATURE_ORDER``.
+            active: Modelo usado na predição.
+            namespace: Namespace do cache, separando as predições de outras
+                saídas calculadas por linha.
+            compute: Função que calcula as linhas ausentes; a predição do
+                backend ativo se omitida.
+            width: Quantidade de valores por linha retornados por ``compute``;
+                None para um valor por linha.
+
+        Returns:
+            np.ndarray: Resultados em float64, formato ``(n_linhas,)`` ou
+                ``(n_linhas, width)``.
+        """
+        shape = (len(matrix),) if width is None else (len(matrix), width)
+        values = np.empty(shape, dtype=np.float64)
+        missing: list[int] | slice = slice(None)
+        rows: list[list[float]] = []
+        if self.cache is not None:
+            rows = matrix.tolist()
+            missing = []
+            for position, row in enumerate(rows):
+                cached_value = self.cache.get(namespace, active.version, row)
+                if cached_value is None:
+                    missing.append(position)
+                else:
+                    values[position] = cached_value
+
+        n_missing = len(values[missing])
+        if n_missing:
+            subset = matrix if n_missing == len(matrix) else matrix[missing]
+            log.debug("Iniciando predição em lote com modelo carregado", extra=SAMPLED)
+            with metrics.time("predict"):
+                if compute is None:
+                    predictions = self._predict_matrix(subset, active)
+                else:
+                    predictions = compute(subset)
+            metrics.observe_batch_size(n_missing)
+            values[missing] = predictions
+            if self.cache is not None:
+                for position, value in zip(missing, predictions.tolist(), strict=True):
+                    self.cache.set(namespace, active.version, rows[position], value)
+
+        log.info(
+            "Predição em lote concluída com %s linhas (%s do cache)",
+            len(matrix),
+            len(matrix) - n_missing,
+            extra=SAMPLED,
+        )
+        return values
+
+    def _to_row(self, input_data: PredictionInput) -> np.ndarray:
+        """
+        Copia as features validadas para uma linha float64 pré-alocada.
+
+        O buffer é mantido por thread, pois o executor pode rodar predições
+        concorrentes; ele é reutilizado a cada chamada e não deve ser retido.
+
+        Args:
+            input_data: Dados de entrada do imóvel.
+
+        Returns:
+            np.ndarray: Matriz ``(1, n_features)`` na ordem de ``FEATURE_ORDER``.
+        """
+        row = getattr(self._row_buffers, "row", None)
+        if row is None:
+            row = np.empty((1, len(settings.FEATURE_ORDER)), dtype=np.float64)
+            self._row_buffers.row = row
+        row[0] = self._feature_getter(input_data)
+        return row
+
+    def _predict_matrix(
+        self, matrix: np.ndarray, active: LoadedModel | None = None
+    ) -> np.ndarray:
+        """
+        Prediz uma matriz de features no backend ativo.
+
+        Args:
+            matrix: Matriz com colunas na ordem de ``settings.FEATURE_ORDER``.
+            active: Modelo a ser usado; o modelo ativo se omitido.
+
+        Returns:
+            np.ndarray: Predições em float64, uma por linha.
+        """
+        active = active or self._active
+        if active.forest is not None:
+            return active.forest.predict(matrix)
+        if active.sklearn_model is not None:
+            return np.asarray(active.sklearn_model.predict(matrix), dtype=np.float64)
+        import pandas as pd
+
+        input_df = pd.DataFrame(matrix, columns=settings.FEATURE_ORDER)
+        return np.asarray(active.model.predict(input_df), dtype=np.float64)
+
+
+@dataclass
+class MicroBatchStats:
+    """
+    Métricas acumuladas do agendador de micro-batching.
+
+    Attributes:
+        batches: Quantidade de lotes executados.
+        rows: Quantidade total de linhas preditas.
+        max_batch_size: Maior lote executado.
+        queue_wait_seconds_total: Soma do tempo de espera na fila, em segundos.
+        queue_wait_seconds_max: Maior tempo de espera na fila, em segundos.
+        batch_size_counts: Histograma de tamanhos de lote.
+    """
+
+    batches: int = 0
+    rows: int = 0
+    max_batch_size: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+    batch_size_counts: dict[int, int] = field(default_factory=dict)
+
+    def record(self, queue_waits: list[float]) -> None:
+        """
+        Registra a execução de um lote.
+
+        Args:
+            queue_waits: Tempo de espera na fila de cada linha do lote, em segundos.
+        """
+        batch_size = len(queue_waits)
+        self.batches += 1
+        self.rows += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.queue_wait_seconds_total += sum(queue_waits)
+        self.queue_wait_seconds_max = max(self.queue_wait_seconds_max, *queue_waits)
+        counts = self.batch_size_counts
+        counts[batch_size] = counts.get(batch_size, 0) + 1
+
+    def snapshot(self) -> dict[str, float | int | dict[int, int]]:
+        """
+        Retorna uma cópia das métricas com médias calculadas.
+
+        Returns:
+            dict: Métricas de tamanho de lote e espera na fila.
+        """
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "avg_batch_size": self.rows / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "avg_queue_wait_ms": (
+                1000 * self.queue_wait_seconds_total / self.rows if self.rows else 0.0
+            ),
+            "max_queue_wait_ms": 1000 * self.queue_wait_seconds_max,
+            "batch_size_counts": dict(sorted(self.batch_size_counts.items())),
+        }
+
+
+micro_batch_stats = MicroBatchStats()
+
+
+class MicroBatcher:
+    """
+    Agrupa predições concorrentes em um único lote vetorizado.
+
+    As solicitações são enfileiradas e um worker assíncrono executa o lote quando
+    ``max_batch_size`` linhas forem acumuladas ou quando ``max_wait_ms`` expirar
+    a partir da primeira linha do lote, resolvendo o future de cada chamador.
+
+    Attributes:
+        service: Serviço de predição usado para executar os lotes.
+        executor: Executor usado para rodar os lotes fora do event loop.
+        max_batch_size: Número máximo de linhas por lote.
+        max_wait_seconds: Tempo máximo de espera pelo preenchimento do lote.
+        stats: Métricas de tamanho de lote e espera na fila.
+    """
+
+    def __init__(
+        self,
+        service: PredictorService,
+        max_batch_size: int,
+        max_wait_ms: float,
+        stats: MicroBatchStats | None = None,
+        executor: InferenceExecutor | None = None,
+    ) -> None:
+        """
+        Inicializa o agendador de micro-batching.
+
+        Args:
+            service: Serviço de predição usado para executar os lotes.
+            max_batch_size: Número máximo de linhas por lote.
+            max_wait_ms: Tempo máximo de espera pelo preenchimento do lote, em ms.
+            stats: Métricas compartilhadas; uma nova instância é criada se omitido.
+            executor: Executor dos lotes; sem executor, o lote roda no event loop.
+        """
+        self.service = service
+        self.executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000
+        self.stats = stats if stats is not None else MicroBatchStats()
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: set[asyncio.Task] = set()
+
+    async def submit(self, input_data: PredictionInput) -> PredictionOutput:
+        """
+        Enfileira uma predição e aguarda o resultado do lote correspondente.
+
+        Args:
+            input_data: Dados de entrada do imóvel.
+
+        Returns:
+            PredictionOutput: Resultado da predição com o valor predito.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._start(loop)
+
+        future: asyncio.Future[PredictionOutput] = loop.create_future()
+        self._queue.put_nowait((input_data, future, time.perf_counter()))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Interrompe o worker e falha as solicitações ainda pendentes na fila.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        while self._queue is not None and not self._queue.empty():
+            self._reject([self._queue.get_nowait()])
+
+    @staticmethod
+    def _reject(batch: list[tuple]) -> None:
+        """
+        Falha os futures de solicitações que não serão mais executadas.
+
+        Args:
+            batch: Tuplas de (entrada, future, instante de enfileiramento).
+        """
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("Micro-batcher encerrado."))
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Cria a fila e o worker vinculados ao event loop atual.
+
+        Args:
+            loop: Event loop em execução.
+        """
+        log.debug(
+            "Iniciando micro-batcher | max_batch_size=%s | max_wait_ms=%.2f",
+            self.max_batch_size,
+            1000 * self.max_wait_seconds,
+        )
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """
+        Coleta solicitações em lotes e os executa indefinidamente.
+        """
+        while True:
+            batch: list[tuple] = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = self._loop.time() + self.max_wait_seconds
+                while len(batch) < self.max_batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # O lote em coleta já saiu da fila e não será visto por close()
+                self._reject(batch)
+                raise
+            task = self._loop.create_task(self._execute(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _execute(self, batch: list[tuple]) -> None:
+        """
+        Executa um lote e resolve os futures dos chamadores.
+
+        Args:
+            batch: Tuplas de (entrada, future, instante de enfileiramento).
+        """
+        started_at = time.perf_counter()
+        self.stats.record([started_at - enqueued_at for _, _, enqueued_at in batch])
+        inputs = [item for item, _, _ in batch]
+        try:
+            if self.executor is None:
+                results = self.service.predict_batch(inputs)
+            else:
+                results = await self.executor.run(self.service, "predict_batch", inputs)
+        except Exception as error:
+            log.error("Erro ao executar lote do micro-batcher: %s", error)
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future, _), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+_micro_batcher: MicroBatcher | None = None
+
+
+def get_micro_batcher(
+    service: PredictorService,
+    executor: InferenceExecutor | None = None,
+) -> MicroBatcher:
+    """
+    Retorna o micro-batcher compartilhado, criando-o na primeira chamada.
+
+    Args:
+        service: Serviço de predição usado para executar os lotes.
+        executor: Executor usado para rodar os lotes fora do event loop.
+
+    Returns:
+        MicroBatcher: Agendador configurado a partir das settings.
+    """
+    global _micro_batcher
+    if (
+        _micro_batcher is None
+        or _micro_batcher.service is not service
+        or _micro_batcher.executor is not executor
+    ):
+        _micro_batcher = MicroBatcher(
+            service,
+            max_batch_size=settings.MICRO_BATCH_MAX_SIZE,
+            max_wait_ms=settings.MICRO_BATCH_MAX_WAIT_MS,
+            stats=micro_batch_stats,
+            executor=executor,
+        )
+    return _micro_batcher
+
+
+async def close_micro_batcher() -> None:
+    """
+    Encerra o micro-batcher compartilhado, se existir.
+    """
+    global _micro_batcher
+    if _micro_batcher is not None:
+        await _micro_batcher.close()
+        _micro_batcher = None
+
+
+def export_shared_model() -> Path | None:
+    """
+    Exporta a floresta compilada da versão ativa para ``SHARED_MODEL_DIR``.
+
+    Pensado para rodar uma única vez no processo mestre (ex.: hook
+    ``on_starting`` do gunicorn), antes de os workers serem criados; cada
+    worker então apenas mapeia os arquivos exportados.
+
+    Returns:
+        Path | None: Diretório exportado, ou None se o modo compartilhado não
+            estiver habilitado ou o modelo não puder ser compilado.
+    """
+    if not settings.SHARED_MODEL_DIR or settings.INFERENCE_BACKEND != "compiled":
+        log.warning("Exportação ignorada: requer SHARED_MODEL_DIR e backend compiled")
+        return None
+
+    service = PredictorService()
+    if service.forest is None:
+        log.warning("Modelo não pôde ser compilado; workers usarão o pyfunc")
+        return None
+    path = Path(settings.SHARED_MODEL_DIR) / settings.MODEL_NAME / service.model_version
+    if not is_exported_forest(path):
+        log.warning("Versão do modelo não resolvida; floresta não exportada")
+        return None
+    log.info("Floresta compartilhada disponível em %s", path)
+    return path
+
 
 @lru_cache
 def get_predictor_service() -> PredictorService:
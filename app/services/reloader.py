@@ -0,0 +1,134 @@
+"""
+Monitoramento do Model Registry para troca do modelo sem indisponibilidade.
+"""
+
+import threading
+from collections.abc import Callable
+
+from app.config import settings
+from app.services.predictor import PredictorService, resolve_registry_version
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class ModelReloader:
+    """
+    Thread em segundo plano que acompanha o alias do modelo no registry.
+
+    A cada intervalo, resolve a versão apontada por
+    ``models:/{MODEL_NAME}@{MODEL_STAGE}`` e, quando ela muda, carrega, aquece e
+    troca o modelo do serviço fora do caminho das requisições.
+
+    Attributes:
+        interval_seconds: Intervalo entre consultas ao registry.
+        last_error: Último erro observado durante a verificação, se houver.
+    """
+
+    def __init__(
+        self,
+        service_provider: Callable[[], PredictorService],
+        interval_seconds: float,
+        version_resolver: Callable[[], str] = resolve_registry_version,
+    ) -> None:
+        """
+        Inicializa o monitor do registry.
+
+        Args:
+            service_provider: Função que retorna o serviço de predição ativo.
+            interval_seconds: Intervalo entre consultas ao registry.
+            version_resolver: Função que resolve a versão apontada pelo alias.
+        """
+        self.interval_seconds = interval_seconds
+        self.last_error: str | None = None
+        self._service_provider = service_provider
+        self._version_resolver = version_resolver
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Inicia a thread de monitoramento.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="model-reloader", daemon=True
+        )
+        self._thread.start()
+        log.info(
+            "Monitoramento do modelo iniciado (intervalo=%ss)", self.interval_seconds
+        )
+
+    def stop(self) -> None:
+        """
+        Interrompe a thread de monitoramento e aguarda seu término.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        log.info("Monitoramento do modelo encerrado")
+
+    def check_once(self) -> bool:
+        """
+        Verifica o registry uma vez e troca o modelo se o alias mudou.
+
+        Returns:
+            bool: True se uma nova versão foi ativada.
+        """
+        try:
+            version = self._version_resolver()
+            swapped = self._service_provider().reload(version)
+        except Exception as error:
+            self.last_error = str(error)
+            log.error("Falha ao verificar nova versão do modelo: %s", error)
+            return False
+        self.last_error = None
+        return swapped
+
+    def _run(self) -> None:
+        """
+        Laço de monitoramento executado na thread em segundo plano.
+        """
+        while not self._stop.wait(self.interval_seconds):
+            self.check_once()
+
+
+_model_reloader: ModelReloader | None = None
+
+
+def start_model_reloader(service_provider: Callable[[], PredictorService]) -> None:
+    """
+    Inicia o monitor compartilhado do registry, se habilitado nas settings.
+
+    Args:
+        service_provider: Função que retorna o serviço de predição ativo.
+
+    Raises:
+        ValueError: Se o executor de inferência estiver no modo process, em que
+            a troca só aconteceria no processo da API e não nos workers.
+    """
+    global _model_reloader
+    if not settings.MODEL_RELOAD_ENABLED or _model_reloader is not None:
+        return
+    if settings.INFERENCE_EXECUTOR == "process":
+        raise ValueError(
+            "MODEL_RELOAD_ENABLED não é suportado com INFERENCE_EXECUTOR=process: "
+            "os processos do pool continuariam servindo a versão antiga."
+        )
+    _model_reloader = ModelReloader(
+        service_provider, settings.MODEL_RELOAD_INTERVAL_SECONDS
+    )
+    _model_reloader.start()
+
+
+def stop_model_reloader() -> None:
+    """
+    Interrompe o monitor compartilhado do registry, se estiver em execução.
+    """
+    global _model_reloader
+    if _model_reloader is not None:
+        _model_reloader.stop()
+        _model_reloader = None
@@ -0,0 +1,190 @@
+"""
+Carregamento e aquecimento do modelo na inicialização da aplicação.
+
+O carregamento roda em segundo plano durante o lifespan, de modo que
+``/health/live`` responda imediatamente e ``/health/ready`` só reporte
+prontidão depois que o modelo estiver carregado e aquecido.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.config import settings
+from app.schemas.prediction import PredictionInput
+from app.services.executor import InferenceExecutor
+from app.services.predictor import PredictorService
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass
+class StartupState:
+    """
+    Estado do carregamento do modelo na inicialização.
+
+    Attributes:
+        status: Etapa atual (lazy, loading, ready ou failed).
+        model_version: Versão do modelo carregada.
+        load_seconds: Duração do carregamento do modelo.
+        warmup_seconds: Duração do aquecimento.
+        warmup_calls: Quantidade de entradas usadas no aquecimento.
+        error: Mensagem do erro que impediu a prontidão, se houver.
+    """
+
+    status: str = "lazy"
+    model_version: str | None = None
+    load_seconds: float | None = None
+    warmup_seconds: float | None = None
+    warmup_calls: int = 0
+    error: str | None = None
+
+    @property
+    def ready(self) -> bool:
+        """
+        Returns:
+            bool: True se a aplicação pode receber tráfego. No modo lazy o
+                modelo é carregado na primeira requisição.
+        """
+        return self.status in ("lazy", "ready")
+
+    def reset(self, status: str) -> None:
+        """
+        Reinicia o estado para um novo ciclo de inicialização.
+
+        Args:
+            status: Etapa inicial.
+        """
+        self.__dict__.update(asdict(StartupState(status=status)))
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: Estado atual, serializável em JSON.
+        """
+        return asdict(self)
+
+
+startup_state = StartupState()
+
+
+def read_payload_rows(path: Path) -> list[Any]:
+    """
+    Lê os registros de um arquivo JSONL de corpos de requisição.
+
+    Cada linha pode ser o corpo de ``/predict`` (um imóvel) ou de
+    ``/predict/batch`` (``{"instances": [...]}``).
+
+    Args:
+        path: Arquivo JSONL.
+
+    Returns:
+        list[Any]: Registros brutos, na ordem do arquivo.
+    """
+    rows: list[Any] = []
+    with path.open(encoding="utf-8") as payload_file:
+        for line in payload_file:
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                rows.append(None)
+                continue
+            if isinstance(payload, dict) and "instances" in payload:
+                rows.extend(payload["instances"])
+            else:
+                rows.append(payload)
+    return rows
+
+
+def load_warmup_inputs(path: str | None, calls: int) -> list[PredictionInput]:
+    """
+    Monta as entradas do aquecimento a partir de corpos de requisição gravados.
+
+    Registros inválidos são ignorados. O arquivo é repetido até completar
+    ``calls`` entradas; sem arquivo ou sem registros válidos, usa o exemplo
+    do schema.
+
+    Args:
+        path: Arquivo JSONL com corpos de requisição, ou None.
+        calls: Quantidade de entradas desejada.
+
+    Returns:
+        list[PredictionInput]: Entradas do aquecimento.
+    """
+    inputs: list[PredictionInput] = []
+    if path:
+        try:
+            rows = read_payload_rows(Path(path))
+        except OSError as error:
+            log.warning("Arquivo de aquecimento indisponível: %s", error)
+            rows = []
+        for row in rows:
+            try:
+                inputs.append(PredictionInput.model_validate(row))
+            except ValidationError:
+                continue
+        if len(inputs) < len(rows):
+            log.warning(
+                "%s registros inválidos ignorados no aquecimento",
+                len(rows) - len(inputs),
+            )
+    if not inputs:
+        example = PredictionInput.model_config["json_schema_extra"]["example"]
+        inputs = [PredictionInput(**example)]
+    return list(islice(cycle(inputs), max(calls, 0)))
+
+
+async def load_and_warm_up(
+    service_provider: Callable[[], PredictorService],
+    executor: InferenceExecutor,
+) -> None:
+    """
+    Carrega o modelo e executa as predições de aquecimento.
+
+    Com ``INFERENCE_EXECUTOR=process`` o aquecimento roda exatamente uma vez em
+    cada processo do pool, já que cada processo carrega sua própria cópia do
+    modelo.
+
+    Args:
+        service_provider: Função que retorna o serviço de predição.
+        executor: Executor de inferência usado pelas rotas.
+    """
+    startup_state.reset("loading")
+    try:
+        started_at = time.perf_counter()
+        service = await asyncio.to_thread(service_provider)
+        startup_state.load_seconds = time.perf_counter() - started_at
+        startup_state.model_version = service.model_version
+
+        inputs = load_warmup_inputs(
+            settings.STARTUP_WARMUP_PAYLOADS, settings.STARTUP_WARMUP_CALLS
+        )
+        started_at = time.perf_counter()
+        if inputs:
+            await executor.run_on_each_worker(service, "warm_up", inputs)
+        startup_state.warmup_seconds = time.perf_counter() - started_at
+        startup_state.warmup_calls = len(inputs)
+    except Exception as error:
+        startup_state.status = "failed"
+        startup_state.error = str(error)
+        log.critical("Falha ao carregar o modelo na inicialização: %s", error)
+        return
+
+    startup_state.status = "ready"
+    log.info(
+        "Modelo pronto | versão=%s | carregamento=%.2fs | aquecimento=%.3fs (%s)",
+        startup_state.model_version,
+        startup_state.load_seconds,
+        startup_state.warmup_seconds,
+        startup_state.warmup_calls,
+    )
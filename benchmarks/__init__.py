@@ -0,0 +1,3 @@
+"""
+Módulo de benchmarks de desempenho da API e do modelo.
+"""
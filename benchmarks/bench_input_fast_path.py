@@ -0,0 +1,97 @@
+"""
+Microbenchmark do caminho rápido de entrada do PredictorService.
+
+Compara, para uma única linha, a rota original (``model_dump`` + DataFrame +
+``pyfunc.predict``) com o caminho rápido (linha NumPy pré-alocada +
+``Pipeline.predict``). O modelo é treinado localmente com dados sintéticos e
+salvo em um diretório temporário, de modo que o benchmark roda offline.
+
+Uso:
+    python -m benchmarks.bench_input_fast_path --repeat 500
+"""
+
+import argparse
+import tempfile
+import timeit
+import warnings
+from collections.abc import Callable
+from operator import attrgetter
+
+import mlflow.pyfunc
+import mlflow.sklearn
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.schemas.prediction import PredictionInput
+from scripts.dataset import synthetic_dataset
+from scripts.train import build_pipeline
+
+SAMPLE_INPUT: dict[str, float] = PredictionInput.model_config["json_schema_extra"][
+    "example"
+]
+
+
+def _measure(call: Callable[[], object], repeat: int) -> float:
+    """
+    Mede o tempo médio de uma chamada em microssegundos.
+
+    Args:
+        call: Função sem argumentos a ser medida.
+        repeat: Quantidade de execuções.
+
+    Returns:
+        float: Tempo médio por chamada, em microssegundos.
+    """
+    call()
+    return timeit.timeit(call, number=repeat) / repeat * 1e6
+
+
+def main() -> None:
+    """
+    Executa o microbenchmark e imprime os resultados em tabela.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--max-depth", type=int, default=10)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    features, target = synthetic_dataset(2_000)
+    pipeline = build_pipeline(n_estimators=args.n_estimators, max_depth=args.max_depth)
+    pipeline.fit(features, target)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        mlflow.sklearn.save_model(pipeline, f"{model_dir}/model")
+        pyfunc_model = mlflow.pyfunc.load_model(f"{model_dir}/model")
+
+    input_data = PredictionInput(**SAMPLE_INPUT)
+    getter = attrgetter(*settings.FEATURE_ORDER)
+    row = np.empty((1, len(settings.FEATURE_ORDER)), dtype=np.float64)
+
+    def build_frame() -> pd.DataFrame:
+        return pd.DataFrame([input_data.model_dump()], columns=settings.FEATURE_ORDER)
+
+    def build_row() -> np.ndarray:
+        row[0] = getter(input_data)
+        return row
+
+    results = {
+        "conversão: model_dump + DataFrame": _measure(build_frame, args.repeat),
+        "conversão: linha NumPy pré-alocada": _measure(build_row, args.repeat),
+        "antes: DataFrame + pyfunc.predict": _measure(
+            lambda: pyfunc_model.predict(build_frame()), args.repeat
+        ),
+        "depois: linha NumPy + Pipeline.predict": _measure(
+            lambda: pipeline.predict(build_row()), args.repeat
+        ),
+    }
+
+    width = max(len(name) for name in results)
+    for name, micros in results.items():
+        print(f"{name:<{width}}  {micros:>10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
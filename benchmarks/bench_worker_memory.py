@@ -0,0 +1,155 @@
+"""
+Mede a memória por worker ao carregar o modelo via pyfunc ou via mmap.
+
+Cada modo sobe N processos que carregam o mesmo modelo simultaneamente e
+reportam o crescimento de RSS e PSS (``/proc/self/smaps_rollup``) causado pelo
+carregamento. O PSS divide as páginas compartilhadas entre os processos, então
+a soma do PSS representa a memória física total usada pelo modelo.
+
+Uso:
+    python -m benchmarks.bench_worker_memory --workers 4
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+
+SMAPS_ROLLUP: Path = Path("/proc/self/smaps_rollup")
+
+
+def _memory_kb() -> dict[str, int]:
+    """
+    Lê RSS e PSS do processo atual.
+
+    Returns:
+        dict[str, int]: Valores de ``Rss`` e ``Pss`` em kB.
+    """
+    values = {}
+    for line in SMAPS_ROLLUP.read_text().splitlines():
+        key, _, rest = line.partition(":")
+        if key in ("Rss", "Pss"):
+            values[key] = int(rest.split()[0])
+    return values
+
+
+def _worker(
+    mode: str,
+    model_path: str,
+    barrier: Any,
+    results: Any,
+) -> None:
+    """
+    Carrega o modelo no modo indicado e reporta tempo e memória.
+
+    Args:
+        mode: ``pyfunc`` ou ``mmap``.
+        model_path: Diretório do modelo MLflow ou da floresta exportada.
+        barrier: Barreira para manter todos os workers vivos na medição.
+        results: Fila onde o resultado é publicado.
+    """
+    import mlflow.pyfunc
+
+    from app.services.forest import CompiledForest
+
+    row = np.ones((1, len(settings.FEATURE_ORDER)))
+    baseline = _memory_kb()
+    started_at = time.perf_counter()
+    if mode == "pyfunc":
+        model = mlflow.pyfunc.load_model(model_path)
+        model.predict(pd.DataFrame(row, columns=settings.FEATURE_ORDER))
+    else:
+        forest = CompiledForest.load(model_path)
+        forest.predict(row)
+    load_seconds = time.perf_counter() - started_at
+
+    barrier.wait()
+    loaded = _memory_kb()
+    results.put(
+        {
+            "load_ms": 1000 * load_seconds,
+            "rss_kb": loaded["Rss"] - baseline["Rss"],
+            "pss_kb": loaded["Pss"] - baseline["Pss"],
+        }
+    )
+    barrier.wait()
+
+
+def _run_mode(mode: str, model_path: str, workers: int) -> list[dict[str, float]]:
+    """
+    Sobe os workers de um modo e coleta as medições.
+
+    Args:
+        mode: ``pyfunc`` ou ``mmap``.
+        model_path: Caminho do modelo para o modo.
+        workers: Quantidade de processos.
+
+    Returns:
+        list[dict[str, float]]: Medições de cada worker.
+    """
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_worker, args=(mode, model_path, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    measurements = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return measurements
+
+
+def main() -> None:
+    """
+    Treina um modelo sintético, exporta os artefatos e compara os modos.
+    """
+    import mlflow.sklearn
+
+    from app.services.forest import compile_pipeline
+    from scripts.dataset import synthetic_dataset
+    from scripts.train import build_pipeline
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--max-depth", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    features, target = synthetic_dataset(args.rows)
+    pipeline = build_pipeline(n_estimators=args.n_estimators, max_depth=args.max_depth)
+    pipeline.fit(features, target)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        model_path = f"{workdir}/model"
+        mlflow.sklearn.save_model(pipeline, model_path)
+        forest = compile_pipeline(pipeline, settings.FEATURE_ORDER)
+        forest_path = str(forest.save(f"{workdir}/forest"))
+
+        print(f"workers={args.workers} | floresta={forest.nbytes / 1024:.0f} kB")
+        print(f"{'modo':<8}{'load ms':>10}{'RSS kB':>10}{'PSS kB':>10}{'ΣPSS kB':>10}")
+        for mode, path in (("pyfunc", model_path), ("mmap", forest_path)):
+            measurements = _run_mode(mode, path, args.workers)
+            mean = {
+                key: sum(item[key] for item in measurements) / len(measurements)
+                for key in measurements[0]
+            }
+            total_pss = sum(item["pss_kb"] for item in measurements)
+            print(
+                f"{mode:<8}{mean['load_ms']:>10.1f}{mean['rss_kb']:>10.0f}"
+                f"{mean['pss_kb']:>10.0f}{total_pss:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,484 @@
+"""
+Gerador de carga reprodutível para os endpoints de predição.
+
+Reproduz corpos de requisição gravados em JSONL (um corpo de ``/predict`` ou
+de ``/predict/batch`` por linha) ou sintetiza registros a partir do exemplo do
+schema, e os envia para a aplicação em um de três alvos:
+
+- inprocess: ``app.main:app`` no mesmo processo, via ``httpx.ASGITransport``
+  (sem rede; gerador e aplicação dividem o event loop).
+- spawn: uma instância local do uvicorn iniciada pelo próprio benchmark,
+  usada assim que ``/health/ready`` responde 200.
+- url: um servidor já em execução.
+
+A carga pode ser em malha fechada (``--concurrency`` clientes enviando em
+sequência) ou aberta (``--rate`` requisições/s com chegadas de Poisson). Na
+malha aberta a latência é medida a partir do instante agendado da chegada, de
+modo que filas no servidor aparecem na latência em vez de reduzir a carga.
+
+O relatório é impresso em JSON para que execuções possam ser comparadas.
+
+Uso:
+    python -m benchmarks.loadtest --mode single --concurrency 16 --duration 30
+    python -m benchmarks.loadtest --mode batch --batch-size 500 --rate 20
+    python -m benchmarks.loadtest --target url --url http://localhost:8000 \\
+        --payloads corpos.jsonl --output resultado.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+import numpy as np
+
+from app.schemas.prediction import PredictionInput
+from app.services.startup import read_payload_rows
+
+MODES: tuple[str, ...] = ("single", "batch", "stream")
+TARGETS: tuple[str, ...] = ("inprocess", "spawn", "url")
+ENDPOINTS: dict[str, str] = {
+    "single": "/predict/",
+    "batch": "/predict/batch",
+    "stream": "/predict/stream",
+}
+CONTENT_TYPES: dict[str, str] = {
+    "single": "application/json",
+    "batch": "application/json",
+    "stream": "application/x-ndjson",
+}
+PERCENTILES: tuple[float, ...] = (50, 95, 99, 99.9)
+
+
+@dataclass(frozen=True)
+class PreparedRequest:
+    """
+    Corpo de requisição já serializado.
+
+    Attributes:
+        body: Corpo da requisição.
+        rows: Quantidade de registros no corpo.
+    """
+
+    body: bytes
+    rows: int
+
+
+@dataclass(frozen=True)
+class RequestResult:
+    """
+    Resultado de uma requisição enviada.
+
+    Attributes:
+        latency_seconds: Latência medida, em segundos.
+        status_code: Status HTTP, ou 0 em falha de conexão.
+        rows: Quantidade de registros enviados.
+        row_errors: Registros com erro reportado na resposta.
+    """
+
+    latency_seconds: float
+    status_code: int
+    rows: int
+    row_errors: int = 0
+
+
+def synthesize_records(n_records: int, seed: int) -> list[dict[str, float]]:
+    """
+    Gera registros válidos variando o exemplo do schema em até ±20%.
+
+    Args:
+        n_records: Quantidade de registros.
+        seed: Semente aleatória.
+
+    Returns:
+        list[dict[str, float]]: Registros no formato de PredictionInput.
+    """
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+    rng = np.random.default_rng(seed)
+    factors = rng.uniform(0.8, 1.2, size=(n_records, len(example)))
+    return [
+        {
+            name: round(value * factor, 6)
+            for (name, value), factor in zip(example.items(), row, strict=True)
+        }
+        for row in factors
+    ]
+
+
+def prepare_requests(
+    mode: str, records: list[Any], batch_size: int
+) -> list[PreparedRequest]:
+    """
+    Serializa os registros nos corpos do endpoint de cada modo.
+
+    Args:
+        mode: Modo do benchmark (single, batch ou stream).
+        records: Registros reproduzidos.
+        batch_size: Registros por requisição nos modos batch e stream.
+
+    Returns:
+        list[PreparedRequest]: Corpos prontos, enviados em ciclo.
+    """
+    if mode == "single":
+        return [PreparedRequest(json.dumps(record).encode(), 1) for record in records]
+
+    prepared = []
+    for start in range(0, len(records), batch_size):
+        chunk = records[start : start + batch_size]
+        if mode == "batch":
+            body = json.dumps({"instances": chunk}).encode()
+        else:
+            body = "".join(json.dumps(record) + "\n" for record in chunk).encode()
+        prepared.append(PreparedRequest(body, len(chunk)))
+    return prepared
+
+
+def _count_row_errors(mode: str, content: bytes) -> int:
+    """
+    Conta os registros com erro em uma resposta de lote ou streaming.
+
+    Args:
+        mode: Modo do benchmark.
+        content: Corpo da resposta.
+
+    Returns:
+        int: Registros com erro.
+    """
+    if mode == "batch":
+        items = json.loads(content)["predictions"]
+    elif mode == "stream":
+        items = [json.loads(line) for line in content.splitlines() if line]
+    else:
+        return 0
+    return sum(item.get("error") is not None for item in items)
+
+
+async def send_request(
+    client: httpx.AsyncClient, mode: str, request: PreparedRequest, started_at: float
+) -> RequestResult:
+    """
+    Envia uma requisição e mede a latência a partir de ``started_at``.
+
+    Args:
+        client: Cliente HTTP.
+        mode: Modo do benchmark.
+        request: Corpo serializado.
+        started_at: Instante de referência (``time.perf_counter``).
+
+    Returns:
+        RequestResult: Resultado da requisição.
+    """
+    try:
+        response = await client.post(
+            ENDPOINTS[mode],
+            content=request.body,
+            headers={"content-type": CONTENT_TYPES[mode]},
+        )
+        content = response.content
+    except httpx.HTTPError:
+        return RequestResult(time.perf_counter() - started_at, 0, request.rows)
+    latency = time.perf_counter() - started_at
+    row_errors = (
+        _count_row_errors(mode, content) if response.status_code == 200 else 0
+    )
+    return RequestResult(latency, response.status_code, request.rows, row_errors)
+
+
+async def run_closed_loop(
+    client: httpx.AsyncClient,
+    mode: str,
+    requests: list[PreparedRequest],
+    concurrency: int,
+    duration: float,
+) -> list[RequestResult]:
+    """
+    Executa carga em malha fechada: cada cliente envia ao receber a resposta.
+
+    Args:
+        client: Cliente HTTP.
+        mode: Modo do benchmark.
+        requests: Corpos enviados em ciclo.
+        concurrency: Quantidade de clientes simultâneos.
+        duration: Duração da medição, em segundos.
+
+    Returns:
+        list[RequestResult]: Resultados de todas as requisições.
+    """
+    results: list[RequestResult] = []
+    deadline = time.perf_counter() + duration
+
+    async def worker(offset: int) -> None:
+        position = offset
+        while time.perf_counter() < deadline:
+            request = requests[position % len(requests)]
+            results.append(
+                await send_request(client, mode, request, time.perf_counter())
+            )
+            position += concurrency
+
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    return results
+
+
+async def run_open_loop(
+    client: httpx.AsyncClient,
+    mode: str,
+    requests: list[PreparedRequest],
+    rate: float,
+    duration: float,
+    seed: int,
+) -> list[RequestResult]:
+    """
+    Executa carga em malha aberta, com chegadas de Poisson à taxa indicada.
+
+    Args:
+        client: Cliente HTTP.
+        mode: Modo do benchmark.
+        requests: Corpos enviados em ciclo.
+        rate: Requisições por segundo.
+        duration: Duração das chegadas, em segundos.
+        seed: Semente das chegadas.
+
+    Returns:
+        list[RequestResult]: Resultados de todas as requisições.
+    """
+    rng = np.random.default_rng(seed)
+    arrivals = np.cumsum(rng.exponential(1 / rate, size=int(rate * duration * 2) + 1))
+    arrivals = arrivals[arrivals < duration]
+
+    started_at = time.perf_counter()
+    tasks = []
+    for position, offset in enumerate(arrivals.tolist()):
+        delay = started_at + offset - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        request = requests[position % len(requests)]
+        tasks.append(
+            asyncio.create_task(
+                send_request(client, mode, request, started_at + offset)
+            )
+        )
+    return list(await asyncio.gather(*tasks))
+
+
+def summarize(results: list[RequestResult], elapsed: float) -> dict[str, Any]:
+    """
+    Consolida os resultados em throughput, latências e taxas de erro.
+
+    Args:
+        results: Resultados das requisições medidas.
+        elapsed: Duração total da medição, em segundos.
+
+    Returns:
+        dict[str, Any]: Métricas do teste de carga.
+    """
+    latencies_ms = np.array([result.latency_seconds for result in results]) * 1000
+    statuses = Counter(result.status_code for result in results)
+    failed = sum(count for status, count in statuses.items() if status != 200)
+    rows = sum(result.rows for result in results)
+    row_errors = sum(result.row_errors for result in results)
+    latency: dict[str, float | None] = {
+        f"p{percentile:g}": (
+            float(np.percentile(latencies_ms, percentile)) if len(results) else None
+        )
+        for percentile in PERCENTILES
+    }
+    latency["mean"] = float(latencies_ms.mean()) if len(results) else None
+    latency["max"] = float(latencies_ms.max()) if len(results) else None
+    return {
+        "requests": len(results),
+        "elapsed_seconds": elapsed,
+        "throughput_rps": len(results) / elapsed if elapsed else 0.0,
+        "rows_per_second": rows / elapsed if elapsed else 0.0,
+        "latency_ms": latency,
+        "status_codes": {str(status): count for status, count in statuses.items()},
+        "error_rate": failed / len(results) if results else 0.0,
+        "row_error_rate": row_errors / rows if rows else 0.0,
+    }
+
+
+async def _wait_until_ready(client: httpx.AsyncClient, timeout: float) -> None:
+    """
+    Aguarda ``/health/ready`` responder 200.
+
+    Args:
+        client: Cliente HTTP apontando para o servidor.
+        timeout: Tempo máximo de espera, em segundos.
+
+    Raises:
+        TimeoutError: Se o servidor não ficar pronto a tempo.
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError(f"Servidor não ficou pronto em {timeout:.0f}s")
+
+
+@asynccontextmanager
+async def open_client(args: argparse.Namespace) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Abre um cliente HTTP para o alvo escolhido, iniciando-o se necessário.
+
+    Args:
+        args: Argumentos da linha de comando.
+
+    Yields:
+        httpx.AsyncClient: Cliente pronto para enviar a carga.
+    """
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(args.timeout)
+
+    if args.target == "inprocess":
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://loadtest", timeout=timeout
+            ) as client:
+                await _wait_until_ready(client, args.ready_timeout)
+                yield client
+        return
+
+    base_url = args.url
+    server = None
+    if args.target == "spawn":
+        base_url = f"http://127.0.0.1:{args.port}"
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "app.main:app",
+                "--port",
+                str(args.port),
+                "--workers",
+                str(args.server_workers),
+                "--log-level",
+                "warning",
+            ],
+            env=os.environ.copy(),
+        )
+    try:
+        async with httpx.AsyncClient(
+            base_url=base_url, timeout=timeout, limits=limits
+        ) as client:
+            await _wait_until_ready(client, args.ready_timeout)
+            yield client
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+def load_records(args: argparse.Namespace) -> list[Any]:
+    """
+    Carrega os registros gravados ou sintetiza registros novos.
+
+    Args:
+        args: Argumentos da linha de comando.
+
+    Returns:
+        list[Any]: Registros reproduzidos.
+    """
+    if args.payloads:
+        return read_payload_rows(Path(args.payloads))
+    return synthesize_records(args.records, args.seed)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Executa o teste de carga configurado.
+
+    Args:
+        args: Argumentos da linha de comando.
+
+    Returns:
+        dict[str, Any]: Configuração e métricas do teste.
+    """
+    records = load_records(args)
+    requests = prepare_requests(args.mode, records, args.batch_size)
+    async with open_client(args) as client:
+        for position in range(args.warmup_requests):
+            await send_request(
+                client,
+                args.mode,
+                requests[position % len(requests)],
+                time.perf_counter(),
+            )
+
+        started_at = time.perf_counter()
+        if args.rate:
+            results = await run_open_loop(
+                client, args.mode, requests, args.rate, args.duration, args.seed
+            )
+        else:
+            results = await run_closed_loop(
+                client, args.mode, requests, args.concurrency, args.duration
+            )
+        elapsed = time.perf_counter() - started_at
+
+    return {
+        "config": {
+            "mode": args.mode,
+            "target": args.target,
+            "load": "open" if args.rate else "closed",
+            "rate": args.rate,
+            "concurrency": None if args.rate else args.concurrency,
+            "duration_seconds": args.duration,
+            "batch_size": 1 if args.mode == "single" else args.batch_size,
+            "payloads": args.payloads or "synthetic",
+            "records": len(records),
+            "seed": args.seed,
+        },
+        **summarize(results, elapsed),
+    }
+
+
+def main() -> None:
+    """
+    Lê os argumentos, executa o teste e imprime o relatório em JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=MODES, default="single")
+    parser.add_argument("--target", choices=TARGETS, default="inprocess")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--server-workers", type=int, default=1)
+    parser.add_argument("--payloads", help="JSONL com corpos de requisição")
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, help="Requisições/s (malha aberta)")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup-requests", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--ready-timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Arquivo onde gravar o relatório JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Microbenchmarks das etapas do caminho de predição, com baseline e comparação.
+
+Mede isoladamente cada etapa de ``PredictorService.predict`` para lotes de 1
+a 100k linhas:
+
+- validate: ``PredictionInput.model_validate`` por registro.
+- validate_vectorized: ``validate_records`` sobre o lote inteiro.
+- model_dump: ``PredictionInput.model_dump`` por entrada.
+- dataframe: construção do DataFrame de entrada.
+- pyfunc_predict: ``predict`` do modelo carregado via MLflow pyfunc.
+- sklearn_predict: ``Pipeline.predict`` direto sobre o DataFrame.
+- compiled_predict: ``CompiledForest.predict`` sobre a matriz NumPy.
+- output: construção de um ``PredictionOutput`` por predição.
+
+O modelo é treinado localmente com dados sintéticos, então o benchmark roda
+offline. O tempo de cada medição é o mínimo entre repetições, por chamada.
+
+Uso:
+    python -m benchmarks.microbench run --output benchmarks/baselines/microbench.json
+    python -m benchmarks.microbench compare \\
+        --baseline benchmarks/baselines/microbench.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import warnings
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import mlflow.pyfunc
+import mlflow.sklearn
+import numpy as np
+import pandas as pd
+import sklearn
+
+from app.config import settings
+from app.schemas.prediction import PredictionInput, PredictionOutput, validate_records
+from app.services.forest import compile_pipeline
+from scripts.dataset import synthetic_features
+from scripts.train import build_pipeline
+
+BATCH_SIZES: tuple[int, ...] = (1, 10, 100, 1_000, 10_000, 100_000)
+STAGES: tuple[str, ...] = (
+    "validate",
+    "validate_vectorized",
+    "model_dump",
+    "dataframe",
+    "pyfunc_predict",
+    "sklearn_predict",
+    "compiled_predict",
+    "output",
+)
+DEFAULT_BASELINE: Path = Path(__file__).parent / "baselines" / "microbench.json"
+
+
+def _measure(call: Callable[[], object], min_seconds: float, repeat: int) -> float:
+    """
+    Mede o menor tempo por chamada entre repetições.
+
+    Cada repetição executa a chamada quantas vezes forem necessárias para
+    somar ao menos ``min_seconds``.
+
+    Args:
+        call: Função medida.
+        min_seconds: Duração mínima de cada repetição.
+        repeat: Quantidade de repetições.
+
+    Returns:
+        float: Menor tempo por chamada, em segundos.
+    """
+    call()
+    best = float("inf")
+    for _ in range(repeat):
+        calls = 0
+        started_at = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_seconds or not calls:
+            call()
+            calls += 1
+            elapsed = time.perf_counter() - started_at
+        best = min(best, elapsed / calls)
+    return best
+
+
+def build_stages(
+    pipeline: Any, pyfunc_model: Any, features: pd.DataFrame
+) -> dict[str, Callable[[], object]]:
+    """
+    Monta as chamadas de cada etapa para um lote de features.
+
+    As entradas de cada etapa são pré-computadas, de forma que cada medição
+    inclua apenas a própria etapa.
+
+    Args:
+        pipeline: Pipeline Scikit-learn treinado.
+        pyfunc_model: O mesmo pipeline carregado via MLflow pyfunc.
+        features: Lote de features.
+
+    Returns:
+        dict[str, Callable[[], object]]: Chamada de cada etapa.
+    """
+    records = features.to_dict(orient="records")
+    inputs = [PredictionInput.model_validate(record) for record in records]
+    dumps = [item.model_dump() for item in inputs]
+    frame = pd.DataFrame(dumps, columns=settings.FEATURE_ORDER)
+    matrix = frame.to_numpy()
+    predictions = pipeline.predict(frame).tolist()
+    forest = compile_pipeline(pipeline, settings.FEATURE_ORDER)
+
+    return {
+        "validate": lambda: [PredictionInput.model_validate(row) for row in records],
+        "validate_vectorized": lambda: validate_records(
+            records, settings.FEATURE_ORDER
+        ),
+        "model_dump": lambda: [item.model_dump() for item in inputs],
+        "dataframe": lambda: pd.DataFrame(dumps, columns=settings.FEATURE_ORDER),
+        "pyfunc_predict": lambda: pyfunc_model.predict(frame),
+        "sklearn_predict": lambda: pipeline.predict(frame),
+        "compiled_predict": lambda: forest.predict(matrix),
+        "output": lambda: [
+            PredictionOutput(predicted_value=value) for value in predictions
+        ],
+    }
+
+
+def run_benchmarks(
+    batch_sizes: tuple[int, ...],
+    n_estimators: int,
+    max_depth: int,
+    min_seconds: float,
+    repeat: int,
+) -> dict[str, Any]:
+    """
+    Treina o modelo local e mede todas as etapas em todos os tamanhos de lote.
+
+    Args:
+        batch_sizes: Tamanhos de lote medidos.
+        n_estimators: Quantidade de árvores do modelo.
+        max_depth: Profundidade máxima das árvores.
+        min_seconds: Duração mínima de cada repetição.
+        repeat: Quantidade de repetições por medição.
+
+    Returns:
+        dict[str, Any]: Ambiente, parâmetros e segundos por chamada de cada
+            etapa, indexados por etapa e tamanho de lote.
+    """
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    train_features = synthetic_features(2_000, random_state=0)
+    target = 0.4 * train_features["MedInc"] - 0.1 * (train_features["Latitude"] - 36)
+    pipeline = build_pipeline(n_estimators=n_estimators, max_depth=max_depth)
+    pipeline.fit(train_features, target)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        mlflow.sklearn.save_model(
+            pipeline, f"{model_dir}/model", pip_requirements=["scikit-learn"]
+        )
+        pyfunc_model = mlflow.pyfunc.load_model(f"{model_dir}/model")
+
+    results: dict[str, dict[str, float]] = {stage: {} for stage in STAGES}
+    for batch_size in batch_sizes:
+        features = synthetic_features(batch_size, random_state=batch_size)
+        for stage, call in build_stages(pipeline, pyfunc_model, features).items():
+            seconds = _measure(call, min_seconds, repeat)
+            results[stage][str(batch_size)] = seconds
+            print(
+                f"{stage:<20} {batch_size:>7}  {seconds * 1e3:>10.3f} ms  "
+                f"{seconds / batch_size * 1e6:>9.2f} µs/linha",
+                file=sys.stderr,
+            )
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "scikit-learn": sklearn.__version__,
+            "mlflow": mlflow.__version__,
+        },
+        "parameters": {
+            "n_estimators": n_estimators,
+            "max_depth": max_depth,
+            "min_seconds": min_seconds,
+            "repeat": repeat,
+        },
+        "seconds_per_call": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+    min_delta_seconds: float = 0.0,
+) -> list[dict[str, Any]]:
+    """
+    Compara duas execuções etapa a etapa.
+
+    Args:
+        baseline: Execução de referência.
+        current: Execução nova.
+        threshold: Aumento relativo tolerado (0.2 = 20% mais lento).
+        min_delta_seconds: Aumento absoluto mínimo para contar como regressão;
+            evita acusar ruído em etapas de poucos microssegundos.
+
+    Returns:
+        list[dict[str, Any]]: Uma linha por etapa e tamanho presentes nas duas
+            execuções, com a razão atual/baseline e se é uma regressão.
+    """
+    rows = []
+    for stage, sizes in current["seconds_per_call"].items():
+        reference = baseline["seconds_per_call"].get(stage, {})
+        for batch_size, seconds in sizes.items():
+            if batch_size not in reference:
+                continue
+            ratio = seconds / reference[batch_size]
+            delta = seconds - reference[batch_size]
+            rows.append(
+                {
+                    "stage": stage,
+                    "batch_size": int(batch_size),
+                    "baseline_seconds": reference[batch_size],
+                    "current_seconds": seconds,
+                    "ratio": ratio,
+                    "regression": ratio > 1 + threshold
+                    and delta > min_delta_seconds,
+                }
+            )
+    return rows
+
+
+def _parse_sizes(value: str) -> tuple[int, ...]:
+    """
+    Converte uma lista separada por vírgulas em tamanhos de lote.
+
+    Args:
+        value: Tamanhos separados por vírgula (ex.: ``1,100,10000``).
+
+    Returns:
+        tuple[int, ...]: Tamanhos de lote.
+    """
+    return tuple(int(size) for size in value.split(","))
+
+
+def main() -> None:
+    """
+    Executa os subcomandos ``run`` e ``compare``.
+
+    ``compare`` termina com código 1 se alguma etapa ficar mais lenta que o
+    limite, de modo que possa ser usado em CI.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("run", "compare"):
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument("--sizes", type=_parse_sizes, default=BATCH_SIZES)
+        subparser.add_argument("--n-estimators", type=int, default=20)
+        subparser.add_argument("--max-depth", type=int, default=8)
+        subparser.add_argument("--min-seconds", type=float, default=0.2)
+        subparser.add_argument("--repeat", type=int, default=3)
+    subparsers.choices["run"].add_argument("--output", type=Path)
+    compare_parser = subparsers.choices["compare"]
+    compare_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare_parser.add_argument(
+        "--current", type=Path, help="Resultado salvo; executa de novo se omitido"
+    )
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    compare_parser.add_argument("--min-delta-ms", type=float, default=0.05)
+    args = parser.parse_args()
+
+    if args.command == "run" or args.current is None:
+        results = run_benchmarks(
+            args.sizes, args.n_estimators, args.max_depth, args.min_seconds, args.repeat
+        )
+    else:
+        results = json.loads(args.current.read_text())
+
+    if args.command == "run":
+        text = json.dumps(results, indent=2)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(text + "\n")
+        print(text)
+        return
+
+    rows = compare_results(
+        json.loads(args.baseline.read_text()),
+        results,
+        args.threshold,
+        args.min_delta_ms / 1e3,
+    )
+    for row in rows:
+        flag = "REGRESSÃO" if row["regression"] else ""
+        print(
+            f"{row['stage']:<20} {row['batch_size']:>7}  "
+            f"{row['baseline_seconds'] * 1e3:>10.3f} ms -> "
+            f"{row['current_seconds'] * 1e3:>10.3f} ms  "
+            f"x{row['ratio']:.2f}  {flag}"
+        )
+    regressions = [row for row in rows if row["regression"]]
+    print(
+        f"{len(regressions)} regressões acima de {args.threshold:.0%} "
+        f"em {len(rows)} medições"
+    )
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Configuração do gunicorn com o modelo compartilhado entre workers.
+
+O processo mestre exporta a floresta compilada uma única vez para
+``SHARED_MODEL_DIR`` (hook ``on_starting``) e cada worker apenas mapeia os
+arquivos em memória, em modo somente leitura. Assim existe uma única cópia
+física do modelo no page cache e o carregamento por worker é quase imediato.
+
+Uso:
+    gunicorn app.main:app -c gunicorn.conf.py
+"""
+
+import os
+
+# O modo compartilhado depende do backend compilado
+os.environ.setdefault("INFERENCE_BACKEND", "compiled")
+os.environ.setdefault("SHARED_MODEL_DIR", "shared_models")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", str(os.cpu_count() or 1)))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+
+
+def on_starting(server) -> None:
+    """
+    Exporta a floresta compilada antes de criar os workers.
+
+    Args:
+        server: Árbitro do gunicorn.
+    """
+    from app.services.predictor import export_shared_model
+
+    path = export_shared_model()
+    server.log.info("Modelo compartilhado entre workers: %s", path)
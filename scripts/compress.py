@@ -0,0 +1,454 @@
+"""
+Script de compressão da floresta registrada no MLflow.
+
+Compila o pipeline registrado em uma CompiledForest e aplica, nesta ordem:
+
+1. Seleção gulosa de árvores (``--max-trees``): adiciona uma a uma a árvore
+   que mais reduz o RMSE da média no conjunto de seleção e mantém o melhor
+   prefixo.
+2. Limite de profundidade (``--max-depth``): nós nessa profundidade viram
+   folhas com o valor médio do nó.
+3. Fusão de folhas redundantes (``--merge-tolerance``): nós cujos dois filhos
+   são folhas com valores a até essa distância viram folhas.
+4. Quantização (``--dtype``) de thresholds e valores para float32 ou float16.
+
+As métricas são calculadas na parte do conjunto de teste do treinamento não
+usada pela seleção; por isso ``--dataset``, ``--test-size`` e
+``--random-state`` devem ser os mesmos do treinamento. A redução de tamanho e
+a variação das métricas são registradas no MLflow e a floresta comprimida é
+registrada como nova versão do modelo, servível pelo pyfunc ou diretamente
+pelo backend compilado.
+
+Uso:
+    python -m scripts.compress --max-trees 30 --max-depth 8 --dtype float32
+"""
+
+import argparse
+import tempfile
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+import mlflow
+import mlflow.pyfunc
+import mlflow.sklearn
+import numpy as np
+from mlflow import MlflowClient
+from sklearn.model_selection import train_test_split
+
+from app.config import settings
+from app.services.forest import CompiledForest, compile_pipeline
+from app.services.forest_model import FOREST_ARTIFACT, CompiledForestModel
+from scripts.constants import COMPRESS_ARGUMENTS
+from scripts.dataset import load_dataset
+from scripts.score import pin_model_uri
+from scripts.train import evaluate_pipeline
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+QUANTIZATION_DTYPES: dict[str, type[np.floating]] = {
+    "float64": np.float64,
+    "float32": np.float32,
+    "float16": np.float16,
+}
+
+
+@dataclass
+class CompressionReport:
+    """
+    Resumo de uma compressão.
+
+    Attributes:
+        trees_before: Árvores da floresta original.
+        trees_after: Árvores da floresta comprimida.
+        nodes_before: Nós da floresta original.
+        nodes_after: Nós da floresta comprimida.
+        bytes_before: Memória dos arrays da floresta original.
+        bytes_after: Memória dos arrays da floresta comprimida.
+        metrics_before: Métricas da floresta original.
+        metrics_after: Métricas da floresta comprimida.
+    """
+
+    trees_before: int
+    trees_after: int
+    nodes_before: int
+    nodes_after: int
+    bytes_before: int
+    bytes_after: int
+    metrics_before: dict[str, float]
+    metrics_after: dict[str, float]
+
+    @property
+    def size_reduction(self) -> float:
+        """
+        Returns:
+            float: Fração de memória economizada (0.75 = 4x menor).
+        """
+        return 1.0 - self.bytes_after / self.bytes_before
+
+    def as_metrics(self) -> dict[str, float]:
+        """
+        Returns:
+            dict[str, float]: Resumo no formato de métricas do MLflow, com a
+                variação (comprimida - original) de cada métrica.
+        """
+        summary = {
+            name: float(value)
+            for name, value in asdict(self).items()
+            if not isinstance(value, dict)
+        }
+        summary["size_reduction"] = self.size_reduction
+        for name, value in self.metrics_before.items():
+            summary[f"original_{name}"] = value
+            summary[f"compressed_{name}"] = self.metrics_after[name]
+            summary[f"delta_{name}"] = self.metrics_after[name] - value
+        return summary
+
+
+def _is_leaf(forest: CompiledForest) -> np.ndarray:
+    """
+    Args:
+        forest: Floresta compilada.
+
+    Returns:
+        np.ndarray: Máscara dos nós que são folhas (apontam para si mesmos).
+    """
+    return forest.children[:, 0] == np.arange(forest.n_nodes)
+
+
+def _node_depths(forest: CompiledForest, roots: np.ndarray) -> np.ndarray:
+    """
+    Calcula a profundidade de cada nó alcançável a partir das raízes.
+
+    Args:
+        forest: Floresta compilada.
+        roots: Raízes das árvores consideradas.
+
+    Returns:
+        np.ndarray: Profundidade de cada nó; -1 para nós inalcançáveis.
+    """
+    is_leaf = _is_leaf(forest)
+    depths = np.full(forest.n_nodes, -1, dtype=np.intp)
+    frontier = np.asarray(roots, dtype=np.intp)
+    depth = 0
+    while frontier.size:
+        depths[frontier] = depth
+        frontier = forest.children[frontier[~is_leaf[frontier]]].ravel()
+        depth += 1
+    return depths
+
+
+def _rebuild(
+    forest: CompiledForest, roots: np.ndarray | None = None
+) -> CompiledForest:
+    """
+    Remove os nós inalcançáveis e renumera os arrays da floresta.
+
+    Args:
+        forest: Floresta, possivelmente com nós órfãos após uma poda.
+        roots: Raízes mantidas; todas se omitidas.
+
+    Returns:
+        CompiledForest: Floresta compacta, com a profundidade recalculada.
+    """
+    roots = forest.roots if roots is None else np.asarray(roots, dtype=np.intp)
+    depths = _node_depths(forest, roots)
+    keep = np.flatnonzero(depths >= 0)
+    new_index = np.full(forest.n_nodes, -1, dtype=np.intp)
+    new_index[keep] = np.arange(keep.size)
+    return CompiledForest(
+        feature=np.ascontiguousarray(forest.feature[keep]),
+        threshold=np.ascontiguousarray(forest.threshold[keep]),
+        children=np.ascontiguousarray(new_index[forest.children[keep]]),
+        value=np.ascontiguousarray(forest.value[keep]),
+        roots=new_index[roots],
+        max_depth=int(depths.max()) if keep.size else 0,
+        n_features=forest.n_features,
+    )
+
+
+def _make_leaves(forest: CompiledForest, nodes: np.ndarray) -> CompiledForest:
+    """
+    Transforma nós internos em folhas, mantendo o valor médio de cada nó.
+
+    Args:
+        forest: Floresta compilada.
+        nodes: Índices dos nós convertidos.
+
+    Returns:
+        CompiledForest: Floresta com os nós convertidos, ainda com órfãos.
+    """
+    feature = forest.feature.copy()
+    threshold = forest.threshold.copy()
+    children = forest.children.copy()
+    feature[nodes] = 0
+    threshold[nodes] = np.inf
+    children[nodes] = nodes[:, None]
+    return replace(forest, feature=feature, threshold=threshold, children=children)
+
+
+def select_trees(
+    forest: CompiledForest,
+    matrix: np.ndarray,
+    target: np.ndarray,
+    max_trees: int,
+) -> CompiledForest:
+    """
+    Seleciona árvores de forma gulosa pelo RMSE da média do ensemble.
+
+    A cada passo é adicionada a árvore que mais reduz o erro quadrático da
+    média das já escolhidas; ao final, mantém o prefixo com menor erro, de
+    modo que podem restar menos de ``max_trees`` árvores.
+
+    Args:
+        forest: Floresta compilada.
+        matrix: Features do conjunto de seleção.
+        target: Target do conjunto de seleção.
+        max_trees: Quantidade máxima de árvores mantidas.
+
+    Returns:
+        CompiledForest: Floresta com as árvores escolhidas, na ordem de escolha.
+    """
+    per_tree = forest.predict_per_tree(matrix)
+    target = np.asarray(target, dtype=np.float64)
+    remaining = np.ones(forest.n_trees, dtype=bool)
+    total = np.zeros(len(target))
+    chosen: list[int] = []
+    errors: list[float] = []
+    for size in range(1, min(max_trees, forest.n_trees) + 1):
+        candidates = np.flatnonzero(remaining)
+        averages = (total[:, None] + per_tree[:, candidates]) / size
+        squared = ((averages - target[:, None]) ** 2).mean(axis=0)
+        best = candidates[int(np.argmin(squared))]
+        chosen.append(int(best))
+        errors.append(float(squared.min()))
+        remaining[best] = False
+        total += per_tree[:, best]
+
+    best_size = int(np.argmin(errors)) + 1
+    return _rebuild(forest, forest.roots[chosen[:best_size]])
+
+
+def cap_depth(forest: CompiledForest, max_depth: int) -> CompiledForest:
+    """
+    Limita a profundidade das árvores, podando abaixo de ``max_depth``.
+
+    Args:
+        forest: Floresta compilada.
+        max_depth: Profundidade máxima (a raiz tem profundidade 0).
+
+    Returns:
+        CompiledForest: Floresta podada.
+    """
+    depths = _node_depths(forest, forest.roots)
+    cut = np.flatnonzero((depths == max_depth) & ~_is_leaf(forest))
+    return _rebuild(_make_leaves(forest, cut))
+
+
+def merge_leaves(forest: CompiledForest, tolerance: float) -> CompiledForest:
+    """
+    Funde folhas irmãs com valores próximos no nó pai.
+
+    Repete de baixo para cima até que nenhum nó tenha duas folhas com valores
+    a até ``tolerance`` de distância. O nó fundido recebe seu próprio valor
+    médio, que pondera os filhos pelas amostras de treino.
+
+    Args:
+        forest: Floresta compilada.
+        tolerance: Diferença absoluta máxima entre os valores das folhas.
+
+    Returns:
+        CompiledForest: Floresta com as folhas fundidas.
+    """
+    while True:
+        is_leaf = _is_leaf(forest)
+        left, right = forest.children[:, 0], forest.children[:, 1]
+        value = forest.value.astype(np.float64)
+        mergeable = (
+            ~is_leaf
+            & is_leaf[left]
+            & is_leaf[right]
+            & (np.abs(value[left] - value[right]) <= tolerance)
+        )
+        if not mergeable.any():
+            return forest
+        forest = _rebuild(_make_leaves(forest, np.flatnonzero(mergeable)))
+
+
+def quantize(forest: CompiledForest, dtype: str) -> CompiledForest:
+    """
+    Converte thresholds e valores para um tipo de ponto flutuante menor.
+
+    Thresholds finitos fora da faixa do tipo são saturados no maior valor
+    representável, para que não virem infinito e sejam confundidos com folhas.
+
+    Args:
+        forest: Floresta compilada.
+        dtype: ``float64``, ``float32`` ou ``float16``.
+
+    Returns:
+        CompiledForest: Floresta quantizada.
+
+    Raises:
+        ValueError: Se o tipo não for suportado.
+    """
+    if dtype not in QUANTIZATION_DTYPES:
+        raise ValueError(f"Tipo de quantização não suportado: {dtype}")
+    target_type = QUANTIZATION_DTYPES[dtype]
+    limit = np.finfo(target_type).max
+    threshold = forest.threshold.astype(np.float64)
+    finite = np.isfinite(threshold)
+    threshold[finite] = np.clip(threshold[finite], -limit, limit)
+    return replace(
+        forest,
+        threshold=threshold.astype(target_type),
+        value=forest.value.astype(target_type),
+    )
+
+
+def compress_forest(
+    forest: CompiledForest,
+    selection: tuple[np.ndarray, np.ndarray] | None = None,
+    max_trees: int | None = None,
+    max_depth: int | None = None,
+    merge_tolerance: float | None = None,
+    dtype: str = "float64",
+) -> CompiledForest:
+    """
+    Aplica as etapas de compressão configuradas.
+
+    Args:
+        forest: Floresta compilada.
+        selection: Features e target do conjunto de seleção de árvores.
+        max_trees: Árvores mantidas pela seleção gulosa; None desabilita.
+        max_depth: Profundidade máxima; None desabilita.
+        merge_tolerance: Tolerância da fusão de folhas; None desabilita.
+        dtype: Tipo de ponto flutuante de thresholds e valores.
+
+    Returns:
+        CompiledForest: Floresta comprimida.
+
+    Raises:
+        ValueError: Se a seleção de árvores for pedida sem conjunto de seleção.
+    """
+    if max_trees is not None:
+        if selection is None:
+            raise ValueError("A seleção de árvores exige um conjunto de seleção")
+        forest = select_trees(forest, *selection, max_trees)
+    if max_depth is not None:
+        forest = cap_depth(forest, max_depth)
+    if merge_tolerance is not None:
+        forest = merge_leaves(forest, merge_tolerance)
+    return quantize(forest, dtype)
+
+
+def main() -> None:
+    """
+    Função principal do script de compressão.
+    """
+    parser = argparse.ArgumentParser(
+        description="Comprime a floresta registrada e registra a nova versão",
+    )
+
+    # Adicionar argumentos a partir do dicionário de constantes
+    for arg_name, arg_config in COMPRESS_ARGUMENTS.items():
+        parser.add_argument(f"--{arg_name}", **arg_config)
+
+    args = parser.parse_args()
+
+    mlflow.set_tracking_uri(settings.MLFLOW_TRACKING_URI)
+    mlflow.set_experiment(args.experiment_name)
+    model_uri = pin_model_uri(
+        args.model_uri or f"models:/{settings.MODEL_NAME}@{settings.MODEL_STAGE}"
+    )
+    forest = compile_pipeline(
+        mlflow.sklearn.load_model(model_uri), settings.FEATURE_ORDER
+    )
+
+    # Mesma divisão do treinamento; o teste é dividido em seleção e avaliação
+    X, y, dataset = load_dataset(
+        args.dataset, args.dataset_cache_dir, args.target_column
+    )
+    _, X_test, _, y_test = train_test_split(
+        X, y, test_size=args.test_size, random_state=args.random_state
+    )
+    X_select, X_eval, y_select, y_eval = train_test_split(
+        X_test.to_numpy(), y_test.to_numpy(), test_size=0.5, random_state=0
+    )
+
+    compressed = compress_forest(
+        forest,
+        selection=(X_select, y_select),
+        max_trees=args.max_trees,
+        max_depth=args.max_depth,
+        merge_tolerance=args.merge_tolerance,
+        dtype=args.dtype,
+    )
+    report = CompressionReport(
+        trees_before=forest.n_trees,
+        trees_after=compressed.n_trees,
+        nodes_before=forest.n_nodes,
+        nodes_after=compressed.n_nodes,
+        bytes_before=forest.nbytes,
+        bytes_after=compressed.nbytes,
+        metrics_before=evaluate_pipeline(forest, X_eval, y_eval),
+        metrics_after=evaluate_pipeline(compressed, X_eval, y_eval),
+    )
+    log.info(
+        "Compressão | árvores %s -> %s | nós %s -> %s | %.1f MB -> %.1f MB "
+        "(-%.0f%%) | RMSE %.4f -> %.4f",
+        report.trees_before,
+        report.trees_after,
+        report.nodes_before,
+        report.nodes_after,
+        report.bytes_before / 2**20,
+        report.bytes_after / 2**20,
+        100 * report.size_reduction,
+        report.metrics_before["rmse"],
+        report.metrics_after["rmse"],
+    )
+
+    with (
+        mlflow.start_run(run_name="forest-compression"),
+        tempfile.TemporaryDirectory() as staging_dir,
+    ):
+        mlflow.log_params(
+            {
+                "source_model_uri": model_uri,
+                "max_trees": args.max_trees,
+                "max_depth": args.max_depth,
+                "merge_tolerance": args.merge_tolerance,
+                "dtype": args.dtype,
+                "test_size": args.test_size,
+                "random_state": args.random_state,
+            }
+        )
+        mlflow.log_metrics(report.as_metrics())
+        mlflow.set_tags({"variant": "compressed", "dataset_hash": dataset.content_hash})
+
+        forest_dir = compressed.save(Path(staging_dir) / FOREST_ARTIFACT)
+        model_info = mlflow.pyfunc.log_model(
+            artifact_path="property-price-predictor",
+            python_model=CompiledForestModel(),
+            artifacts={FOREST_ARTIFACT: str(forest_dir)},
+            registered_model_name=None if args.no_register else settings.MODEL_NAME,
+        )
+
+    version = model_info.registered_model_version
+    if version is None:
+        log.info("Floresta comprimida registrada apenas como artefato da run")
+        return
+    client = MlflowClient()
+    client.set_model_version_tag(settings.MODEL_NAME, version, "variant", "compressed")
+    client.set_model_version_tag(
+        settings.MODEL_NAME, version, "source_model_uri", model_uri
+    )
+    log.info(
+        "Floresta comprimida registrada como versão %s de %s",
+        version,
+        settings.MODEL_NAME,
+    )
+
+
+if __name__ == "__main__":
+    main()
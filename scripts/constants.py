@@ -36,5 +36,203 @@ TRAIN_ARGUMENTS: dict[str, dict[str, Any]] = {
         "help": "Semente aleatória para reprodutibilidade",
         "required": False,
     },
+    "dataset": {
+        "type": str,
+        "default": "california-housing",
+        "help": "Fonte dos dados: california-housing, synthetic[:N] ou CSV/Parquet",
+        "required": False,
+    },
+    "dataset-cache-dir": {
+        "type": str,
+        "default": "cache/datasets",
+        "help": "Diretório do cache local de datasets",
+        "required": False,
+    },
+    "target-column": {
+        "type": str,
+        "default": "MedHouseVal",
+        "help": "Coluna do target em arquivos CSV/Parquet",
+        "required": False,
+    },
+    "refresh-dataset": {
+        "action": "store_true",
+        "help": "Refaz a materialização do dataset no cache",
+        "required": False,
+    },
+    "max-single-latency-ms": {
+        "type": float,
+        "default": None,
+        "help": "Orçamento do p95 da predição unitária, em ms",
+        "required": False,
+    },
+    "max-batch-latency-ms": {
+        "type": float,
+        "default": None,
+        "help": "Orçamento da predição em lote, em ms",
+        "required": False,
+    },
+    "max-model-size-mb": {
+        "type": float,
+        "default": None,
+        "help": "Orçamento do tamanho serializado do modelo, em MB",
+        "required": False,
+    },
+    "max-model-memory-mb": {
+        "type": float,
+        "default": None,
+        "help": "Orçamento da memória do modelo carregado, em MB",
+        "required": False,
+    },
+    "latency-calls": {
+        "type": int,
+        "default": 50,
+        "help": "Predições unitárias medidas por modelo",
+        "required": False,
+    },
+    "latency-batch-size": {
+        "type": int,
+        "default": 1000,
+        "help": "Linhas do lote usado para medir a latência em lote",
+        "required": False,
+    },
+    "search": {
+        "type": str,
+        "default": None,
+        "help": "Arquivo JSON com a grade ou a busca aleatória de hiperparâmetros",
+        "required": False,
+    },
+    "search-workers": {
+        "type": int,
+        "default": None,
+        "help": "Processos da busca (padrão: CPUs / threads por worker)",
+        "required": False,
+    },
+    "threads-per-worker": {
+        "type": int,
+        "default": 1,
+        "help": "Threads de cada processo da busca",
+        "required": False,
+    },
+    "search-metric": {
+        "type": str,
+        "default": "rmse",
+        "choices": ["rmse", "mae", "r2"],
+        "help": "Métrica usada para escolher o melhor candidato",
+        "required": False,
+    },
+}
+
+
+# Configuração dos argumentos do script de escoragem em lote
+SCORE_ARGUMENTS: dict[str, dict[str, Any]] = {
+    "input": {
+        "type": str,
+        "help": "Arquivo CSV ou Parquet com as features dos imóveis",
+        "required": True,
+    },
+    "output": {
+        "type": str,
+        "help": "Diretório onde as partes Parquet das predições serão escritas",
+        "required": True,
+    },
+    "model-uri": {
+        "type": str,
+        "default": None,
+        "help": "URI do modelo no MLflow (padrão: alias configurado nas settings)",
+        "required": False,
+    },
+    "chunk-size": {
+        "type": int,
+        "default": 100_000,
+        "help": "Quantidade de linhas por pedaço",
+        "required": False,
+    },
+    "workers": {
+        "type": int,
+        "default": None,
+        "help": "Processos de escoragem (padrão: número de CPUs; 1 roda inline)",
+        "required": False,
+    },
+    "overwrite": {
+        "action": "store_true",
+        "help": "Descarta partes existentes em vez de retomar a escoragem",
+        "required": False,
+    },
 }
 
+
+# Configuração dos argumentos do script de compressão da floresta
+COMPRESS_ARGUMENTS: dict[str, dict[str, Any]] = {
+    "experiment-name": {
+        "type": str,
+        "default": "property-pricing",
+        "help": "Nome do experimento no MLflow",
+        "required": False,
+    },
+    "model-uri": {
+        "type": str,
+        "default": None,
+        "help": "URI do modelo no MLflow (padrão: alias configurado nas settings)",
+        "required": False,
+    },
+    "dataset": {
+        "type": str,
+        "default": "california-housing",
+        "help": "Dataset usado no treinamento do modelo",
+        "required": False,
+    },
+    "dataset-cache-dir": {
+        "type": str,
+        "default": "cache/datasets",
+        "help": "Diretório do cache local de datasets",
+        "required": False,
+    },
+    "target-column": {
+        "type": str,
+        "default": "MedHouseVal",
+        "help": "Coluna do target em arquivos CSV/Parquet",
+        "required": False,
+    },
+    "test-size": {
+        "type": float,
+        "default": 0.2,
+        "help": "Proporção de teste usada no treinamento",
+        "required": False,
+    },
+    "random-state": {
+        "type": int,
+        "default": 42,
+        "help": "Semente usada na divisão do treinamento",
+        "required": False,
+    },
+    "max-trees": {
+        "type": int,
+        "default": None,
+        "help": "Árvores mantidas pela seleção gulosa (padrão: todas)",
+        "required": False,
+    },
+    "max-depth": {
+        "type": int,
+        "default": None,
+        "help": "Profundidade máxima das árvores (padrão: sem limite)",
+        "required": False,
+    },
+    "merge-tolerance": {
+        "type": float,
+        "default": None,
+        "help": "Funde folhas irmãs com valores a até essa distância",
+        "required": False,
+    },
+    "dtype": {
+        "type": str,
+        "default": "float32",
+        "choices": ["float64", "float32", "float16"],
+        "help": "Tipo de ponto flutuante de thresholds e valores",
+        "required": False,
+    },
+    "no-register": {
+        "action": "store_true",
+        "help": "Registra a floresta apenas como artefato da run",
+        "required": False,
+    },
+}
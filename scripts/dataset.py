@@ -0,0 +1,350 @@
+"""
+Carregamento de datasets de treino com cache local em formato colunar.
+
+Na primeira execução o dataset é materializado em arquivos ``.npy`` (features
+e target) com um ``metadata.json`` contendo as colunas, a quantidade de linhas
+e o hash SHA-256 do conteúdo. Nas execuções seguintes os arquivos são
+abertos via memory-map, sem download e sem parsing.
+
+Fontes suportadas:
+- ``california-housing``: dataset do Scikit-learn (download só na 1ª vez).
+- ``synthetic`` ou ``synthetic:N``: dados sintéticos nas faixas do California
+  Housing, para testes e uso offline.
+- Caminho de um arquivo CSV ou Parquet local com as colunas de
+  ``FEATURE_ORDER`` e a coluna do target.
+
+O cache é versionado por ``CACHE_FORMAT_VERSION``; mudar o formato descarta as
+materializações antigas.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+CACHE_FORMAT_VERSION: int = 1
+DEFAULT_TARGET_COLUMN: str = "MedHouseVal"
+SYNTHETIC_DEFAULT_ROWS: int = 20_640
+METADATA_FILE: str = "metadata.json"
+FEATURES_FILE: str = "features.npy"
+TARGET_FILE: str = "target.npy"
+
+
+@dataclass
+class DatasetInfo:
+    """
+    Metadados de um dataset materializado no cache.
+
+    Attributes:
+        name: Nome legível do dataset.
+        source: Fonte informada (nome ou caminho resolvido).
+        version: Versão do formato do cache.
+        rows: Quantidade de linhas.
+        columns: Colunas das features, na ordem da matriz.
+        target_column: Nome do target.
+        content_hash: SHA-256 das features e do target.
+    """
+
+    name: str
+    source: str
+    version: int
+    rows: int
+    columns: list[str]
+    target_column: str
+    content_hash: str
+
+
+def synthetic_features(n_rows: int, random_state: int = 0) -> pd.DataFrame:
+    """
+    Gera features sintéticas nas faixas do dataset California Housing.
+
+    Args:
+        n_rows: Quantidade de linhas geradas.
+        random_state: Semente aleatória para reprodutibilidade.
+
+    Returns:
+        pd.DataFrame: Features na ordem de ``settings.FEATURE_ORDER``.
+    """
+    rng = np.random.default_rng(random_state)
+    return pd.DataFrame(
+        {
+            "MedInc": rng.uniform(0.5, 15.0, n_rows),
+            "HouseAge": rng.uniform(1.0, 52.0, n_rows),
+            "AveRooms": rng.uniform(1.0, 10.0, n_rows),
+            "AveBedrms": rng.uniform(0.5, 3.0, n_rows),
+            "Population": rng.uniform(3.0, 5000.0, n_rows),
+            "AveOccup": rng.uniform(1.0, 6.0, n_rows),
+            "Latitude": rng.uniform(32.5, 42.0, n_rows),
+            "Longitude": rng.uniform(-124.3, -114.3, n_rows),
+        },
+        columns=settings.FEATURE_ORDER,
+    )
+
+
+def synthetic_dataset(
+    n_rows: int, random_state: int = 0
+) -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Gera um dataset sintético com target determinístico e ruído leve.
+
+    Args:
+        n_rows: Quantidade de linhas geradas.
+        random_state: Semente aleatória para reprodutibilidade.
+
+    Returns:
+        tuple[pd.DataFrame, pd.Series]: Features e target.
+    """
+    features = synthetic_features(n_rows, random_state)
+    noise = np.random.default_rng(random_state + 1).normal(0.0, 0.05, n_rows)
+    target = (
+        0.4 * features["MedInc"]
+        + 0.01 * features["HouseAge"]
+        - 0.1 * (features["Latitude"] - 36.0)
+        + noise
+    )
+    return features, target.rename(DEFAULT_TARGET_COLUMN)
+
+
+def _fetch_california_housing() -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Busca o dataset California Housing pelo Scikit-learn.
+
+    Returns:
+        tuple[pd.DataFrame, pd.Series]: Features e target.
+    """
+    from sklearn.datasets import fetch_california_housing
+
+    log.info("Carregando dataset California Housing")
+    frame = fetch_california_housing(as_frame=True).frame
+    return frame.drop(columns=[DEFAULT_TARGET_COLUMN]), frame[DEFAULT_TARGET_COLUMN]
+
+
+def _read_local_file(path: Path, target_column: str) -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Lê um arquivo CSV ou Parquet local com o pyarrow.
+
+    Somente as colunas de ``FEATURE_ORDER`` e o target são lidos.
+
+    Args:
+        path: Arquivo CSV ou Parquet.
+        target_column: Nome da coluna do target.
+
+    Returns:
+        tuple[pd.DataFrame, pd.Series]: Features e target.
+
+    Raises:
+        ValueError: Se a extensão não for suportada.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    columns = [*settings.FEATURE_ORDER, target_column]
+    suffix = path.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        table = pq.read_table(path, columns=columns)
+    elif suffix == ".csv":
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={name: pa.float64() for name in columns},
+            ),
+        )
+    else:
+        raise ValueError(f"Formato de dataset não suportado: {path.suffix}")
+    frame = table.to_pandas()
+    return frame[settings.FEATURE_ORDER], frame[target_column]
+
+
+def _resolve_source(
+    source: str, target_column: str
+) -> tuple[str, str, str, Callable[[], tuple[pd.DataFrame, pd.Series]]]:
+    """
+    Identifica a fonte e monta a chave do cache e a função de carregamento.
+
+    Para arquivos locais, a chave inclui caminho, tamanho e data de
+    modificação, de modo que alterar o arquivo gera uma nova materialização.
+
+    Args:
+        source: Nome da fonte ou caminho do arquivo.
+        target_column: Nome da coluna do target em arquivos locais.
+
+    Returns:
+        tuple: Nome do dataset, chave do diretório no cache, descrição da
+            fonte e função que carrega features e target da fonte original.
+
+    Raises:
+        FileNotFoundError: Se a fonte não for conhecida nem um arquivo.
+    """
+    if source == "california-housing":
+        return source, source, source, _fetch_california_housing
+    if source == "synthetic" or source.startswith("synthetic:"):
+        _, _, rows = source.partition(":")
+        n_rows = int(rows) if rows else SYNTHETIC_DEFAULT_ROWS
+        key = f"synthetic-{n_rows}"
+        return "synthetic", key, key, lambda: synthetic_dataset(n_rows)
+
+    path = Path(source).resolve()
+    if not path.is_file():
+        raise FileNotFoundError(f"Dataset não encontrado: {source}")
+    stat = path.stat()
+    fingerprint = f"{path}:{stat.st_size}:{stat.st_mtime_ns}:{target_column}"
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+    return (
+        path.stem,
+        f"{path.stem}-{digest}",
+        str(path),
+        lambda: _read_local_file(path, target_column),
+    )
+
+
+def content_hash(features: np.ndarray, target: np.ndarray) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo de um dataset.
+
+    Args:
+        features: Matriz float64 das features, em ordem de linha.
+        target: Vetor float64 do target.
+
+    Returns:
+        str: Hash hexadecimal.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(features.shape).encode())
+    digest.update(np.ascontiguousarray(features).data)
+    digest.update(np.ascontiguousarray(target).data)
+    return digest.hexdigest()
+
+
+def _materialize(
+    directory: Path,
+    name: str,
+    source: str,
+    target_column: str,
+    loader: Callable[[], tuple[pd.DataFrame, pd.Series]],
+) -> None:
+    """
+    Grava o dataset no cache de forma atômica.
+
+    Os arquivos são escritos em um diretório temporário ao lado do destino e
+    renomeados ao final, então um diretório no cache está sempre completo.
+
+    Args:
+        directory: Diretório de destino no cache.
+        name: Nome do dataset.
+        source: Fonte original.
+        target_column: Nome do target.
+        loader: Função que carrega features e target da fonte original.
+    """
+    features, target = loader()
+    matrix = np.ascontiguousarray(
+        features[settings.FEATURE_ORDER].to_numpy(dtype=np.float64)
+    )
+    values = np.ascontiguousarray(np.asarray(target, dtype=np.float64))
+    info = DatasetInfo(
+        name=name,
+        source=source,
+        version=CACHE_FORMAT_VERSION,
+        rows=len(values),
+        columns=list(settings.FEATURE_ORDER),
+        target_column=target_column,
+        content_hash=content_hash(matrix, values),
+    )
+
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=directory.parent, prefix=".tmp-"))
+    try:
+        np.save(staging / FEATURES_FILE, matrix)
+        np.save(staging / TARGET_FILE, values)
+        (staging / METADATA_FILE).write_text(json.dumps(asdict(info), indent=2))
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging, directory)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    log.info(
+        "Dataset %s materializado em %s | %s linhas | hash=%s",
+        name,
+        directory,
+        info.rows,
+        info.content_hash[:12],
+    )
+
+
+def _read_metadata(directory: Path) -> DatasetInfo | None:
+    """
+    Lê os metadados de uma materialização, se ela for válida.
+
+    Args:
+        directory: Diretório da materialização.
+
+    Returns:
+        DatasetInfo | None: Metadados, ou None se o diretório estiver
+            incompleto, for de outra versão ou tiver outras colunas.
+    """
+    try:
+        info = DatasetInfo(**json.loads((directory / METADATA_FILE).read_text()))
+    except (OSError, ValueError, TypeError):
+        return None
+    files_exist = all(
+        (directory / name).exists() for name in (FEATURES_FILE, TARGET_FILE)
+    )
+    if (
+        not files_exist
+        or info.version != CACHE_FORMAT_VERSION
+        or info.columns != list(settings.FEATURE_ORDER)
+    ):
+        return None
+    return info
+
+
+def load_dataset(
+    source: str = "california-housing",
+    cache_dir: str | Path = "cache/datasets",
+    target_column: str = DEFAULT_TARGET_COLUMN,
+    refresh: bool = False,
+) -> tuple[pd.DataFrame, pd.Series, DatasetInfo]:
+    """
+    Carrega um dataset a partir do cache local, materializando-o se preciso.
+
+    As features e o target são abertos via memory-map (somente leitura); os
+    DataFrames retornados referenciam os arquivos do cache sem copiá-los.
+
+    Args:
+        source: ``california-housing``, ``synthetic[:N]`` ou caminho de um
+            arquivo CSV/Parquet.
+        cache_dir: Diretório raiz do cache.
+        target_column: Coluna do target em arquivos locais.
+        refresh: Refaz a materialização mesmo que o cache seja válido.
+
+    Returns:
+        tuple[pd.DataFrame, pd.Series, DatasetInfo]: Features, target e
+            metadados do dataset.
+    """
+    name, key, origin, loader = _resolve_source(source, target_column)
+    directory = Path(cache_dir) / f"v{CACHE_FORMAT_VERSION}" / key
+
+    info = None if refresh else _read_metadata(directory)
+    if info is None:
+        _materialize(directory, name, origin, target_column, loader)
+        info = _read_metadata(directory)
+    else:
+        log.info("Dataset %s lido do cache %s", name, directory)
+
+    matrix = np.load(directory / FEATURES_FILE, mmap_mode="r")
+    values = np.load(directory / TARGET_FILE, mmap_mode="r")
+    features = pd.DataFrame(matrix, columns=info.columns, copy=False)
+    target = pd.Series(values, name=info.target_column, copy=False)
+    return features, target, info
@@ -0,0 +1,367 @@
+"""
+Script de escoragem em lote de arquivos CSV ou Parquet.
+
+O arquivo de entrada é lido em pedaços de tamanho fixo com o pyarrow e cada
+pedaço é escorado por um pool de processos, que escreve uma parte Parquet
+``part-NNNNNN.parquet`` com as colunas ``row_id`` (posição da linha na
+entrada) e ``prediction``. Lidas em ordem de nome, as partes preservam a ordem
+das linhas de entrada.
+
+Partes já escritas são mantidas em uma nova execução, de modo que uma
+escoragem interrompida é retomada a partir do último pedaço concluído.
+
+Uso:
+    python -m scripts.score --input imoveis.parquet --output predicoes/
+"""
+
+import argparse
+import json
+import os
+import resource
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+import mlflow
+import mlflow.pyfunc
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from mlflow import MlflowClient
+
+from app.config import settings
+from scripts.constants import SCORE_ARGUMENTS
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+MANIFEST_FILE: str = "_manifest.json"
+SUCCESS_FILE: str = "_SUCCESS"
+PART_PATTERN: str = "part-{index:06d}.parquet"
+
+# Modelo carregado uma única vez em cada processo do pool
+_worker_model: Any = None
+
+
+@dataclass
+class ScoreReport:
+    """
+    Resumo de uma execução de escoragem.
+
+    Attributes:
+        rows: Linhas da entrada, incluindo as de pedaços retomados.
+        scored_rows: Linhas escoradas nesta execução.
+        chunks: Quantidade total de pedaços.
+        skipped_chunks: Pedaços já concluídos em uma execução anterior.
+        seconds: Duração da execução.
+        rows_per_second: Vazão das linhas escoradas nesta execução.
+        peak_rss_mb: Pico de memória do processo principal.
+        peak_worker_rss_mb: Pico de memória entre os processos do pool.
+    """
+
+    rows: int
+    scored_rows: int
+    chunks: int
+    skipped_chunks: int
+    seconds: float
+    rows_per_second: float
+    peak_rss_mb: float
+    peak_worker_rss_mb: float
+
+
+def pin_model_uri(model_uri: str) -> str:
+    """
+    Resolve um alias do Model Registry para a versão concreta.
+
+    Fixar a versão garante que uma escoragem retomada use o mesmo modelo,
+    mesmo que o alias tenha sido movido entre as execuções.
+
+    Args:
+        model_uri: URI do modelo (ex.: ``models:/nome@alias``).
+
+    Returns:
+        str: URI ``models:/nome/versão``, ou a própria URI se não for um alias.
+    """
+    if not model_uri.startswith("models:/") or "@" not in model_uri:
+        return model_uri
+    name, alias = model_uri.removeprefix("models:/").split("@", 1)
+    version = MlflowClient().get_model_version_by_alias(name, alias).version
+    log.info("Alias %s resolvido para a versão %s", alias, version)
+    return f"models:/{name}/{version}"
+
+
+def iter_chunks(input_path: Path, chunk_size: int) -> Iterator[pa.Table]:
+    """
+    Lê a entrada em pedaços de exatamente ``chunk_size`` linhas.
+
+    O último pedaço pode ser menor. Somente as colunas de ``FEATURE_ORDER``
+    são lidas, já na ordem esperada pelo modelo.
+
+    Args:
+        input_path: Arquivo CSV ou Parquet.
+        chunk_size: Quantidade de linhas por pedaço.
+
+    Yields:
+        pa.Table: Pedaço da entrada.
+
+    Raises:
+        ValueError: Se a extensão do arquivo não for suportada.
+    """
+    columns = settings.FEATURE_ORDER
+    suffix = input_path.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        batches = pq.ParquetFile(input_path).iter_batches(
+            batch_size=chunk_size, columns=columns
+        )
+    elif suffix == ".csv":
+        batches = pa_csv.open_csv(
+            input_path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={name: pa.float64() for name in columns},
+            ),
+        )
+    else:
+        raise ValueError(f"Formato de entrada não suportado: {input_path.suffix}")
+
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunk_size:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, chunk_size).select(columns)
+            remainder = table.slice(chunk_size)
+            pending = remainder.to_batches()
+            pending_rows = remainder.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending).select(columns)
+
+
+def _init_worker(model_uri: str) -> None:
+    """
+    Carrega o modelo no processo worker.
+
+    Args:
+        model_uri: URI fixada do modelo no MLflow.
+    """
+    global _worker_model
+    mlflow.set_tracking_uri(settings.MLFLOW_TRACKING_URI)
+    _worker_model = mlflow.pyfunc.load_model(model_uri)
+
+
+def _score_chunk(
+    index: int, row_offset: int, chunk: pa.Table, output_dir: str
+) -> int:
+    """
+    Escora um pedaço e escreve a parte Parquet correspondente.
+
+    A parte é escrita em um arquivo temporário e renomeada ao final, então
+    uma parte com o nome definitivo está sempre completa.
+
+    Args:
+        index: Posição do pedaço na entrada.
+        row_offset: Posição da primeira linha do pedaço na entrada.
+        chunk: Linhas do pedaço.
+        output_dir: Diretório de saída.
+
+    Returns:
+        int: Quantidade de linhas escoradas.
+    """
+    predictions = _worker_model.predict(chunk.to_pandas())
+    row_ids = np.arange(row_offset, row_offset + chunk.num_rows, dtype=np.int64)
+    table = pa.table(
+        {"row_id": row_ids, "prediction": np.asarray(predictions, dtype=np.float64)}
+    )
+    part_path = Path(output_dir) / PART_PATTERN.format(index=index)
+    temporary_path = part_path.with_suffix(".tmp")
+    pq.write_table(table, temporary_path)
+    os.replace(temporary_path, part_path)
+    return chunk.num_rows
+
+
+def _prepare_output(
+    output_dir: Path, params: dict[str, Any], overwrite: bool
+) -> tuple[str, set[int]]:
+    """
+    Prepara o diretório de saída e identifica os pedaços já concluídos.
+
+    Ao retomar, reutiliza a versão do modelo fixada na execução anterior.
+
+    Args:
+        output_dir: Diretório de saída.
+        params: Entrada, tamanho do pedaço e URI do modelo solicitada.
+        overwrite: Descarta partes existentes em vez de retomar.
+
+    Returns:
+        tuple[str, set[int]]: URI fixada do modelo e índices dos pedaços com
+            parte já escrita.
+
+    Raises:
+        ValueError: Se existir uma execução anterior com outros parâmetros.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST_FILE
+    if overwrite:
+        for path in output_dir.glob("part-*"):
+            path.unlink()
+        (output_dir / SUCCESS_FILE).unlink(missing_ok=True)
+        manifest_path.unlink(missing_ok=True)
+
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        if {name: manifest.get(name) for name in params} != params:
+            raise ValueError(
+                f"Execução anterior em {output_dir} usou parâmetros diferentes "
+                f"({manifest}); use --overwrite para descartá-la."
+            )
+    else:
+        manifest = {**params, "model_uri": pin_model_uri(params["requested_uri"])}
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+
+    for path in output_dir.glob("part-*.tmp"):
+        path.unlink()
+    completed = {
+        int(path.stem.split("-")[1]) for path in output_dir.glob("part-*.parquet")
+    }
+    return manifest["model_uri"], completed
+
+
+def score_file(
+    input_path: str | Path,
+    output_dir: str | Path,
+    model_uri: str | None = None,
+    chunk_size: int = 100_000,
+    workers: int | None = None,
+    overwrite: bool = False,
+) -> ScoreReport:
+    """
+    Escora um arquivo CSV ou Parquet, escrevendo partes Parquet ordenadas.
+
+    A leitura é sequencial no processo principal e no máximo ``2 * workers``
+    pedaços ficam em processamento ao mesmo tempo, limitando a memória.
+
+    Args:
+        input_path: Arquivo CSV ou Parquet com as features.
+        output_dir: Diretório das partes Parquet.
+        model_uri: URI do modelo; usa o alias das settings se omitido.
+        chunk_size: Quantidade de linhas por pedaço.
+        workers: Processos do pool; 1 escora no próprio processo.
+        overwrite: Descarta partes existentes em vez de retomar.
+
+    Returns:
+        ScoreReport: Resumo da execução.
+    """
+    started_at = time.perf_counter()
+    input_path, output_dir = Path(input_path), Path(output_dir)
+    workers = max(1, workers or os.cpu_count() or 1)
+    mlflow.set_tracking_uri(settings.MLFLOW_TRACKING_URI)
+    params = {
+        "input": str(input_path.resolve()),
+        "chunk_size": chunk_size,
+        "requested_uri": model_uri
+        or f"models:/{settings.MODEL_NAME}@{settings.MODEL_STAGE}",
+    }
+    pinned_uri, completed = _prepare_output(output_dir, params, overwrite)
+    if completed:
+        log.info("Retomando escoragem: %s pedaços já concluídos", len(completed))
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(pinned_uri,),
+        )
+    else:
+        _init_worker(pinned_uri)
+
+    rows = scored_rows = chunks = 0
+    pending: set[Future] = set()
+    try:
+        for index, chunk in enumerate(iter_chunks(input_path, chunk_size)):
+            chunks += 1
+            row_offset = rows
+            rows += chunk.num_rows
+            if index in completed:
+                continue
+            if pool is None:
+                scored_rows += _score_chunk(index, row_offset, chunk, str(output_dir))
+                continue
+            pending.add(
+                pool.submit(_score_chunk, index, row_offset, chunk, str(output_dir))
+            )
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                scored_rows += sum(future.result() for future in done)
+        scored_rows += sum(future.result() for future in wait(pending).done)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    seconds = time.perf_counter() - started_at
+    # ru_maxrss é reportado em kB no Linux
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_worker_rss_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    report = ScoreReport(
+        rows=rows,
+        scored_rows=scored_rows,
+        chunks=chunks,
+        skipped_chunks=len(completed),
+        seconds=seconds,
+        rows_per_second=scored_rows / seconds if seconds else 0.0,
+        peak_rss_mb=peak_rss_kb / 1024,
+        peak_worker_rss_mb=peak_worker_rss_kb / 1024,
+    )
+    (output_dir / SUCCESS_FILE).write_text(json.dumps(asdict(report), indent=2))
+    return report
+
+
+def main() -> None:
+    """
+    Função principal do script de escoragem em lote.
+    """
+    parser = argparse.ArgumentParser(
+        description="Escora em lote um arquivo CSV ou Parquet de imóveis",
+    )
+
+    # Adicionar argumentos a partir do dicionário de constantes
+    for arg_name, arg_config in SCORE_ARGUMENTS.items():
+        parser.add_argument(f"--{arg_name}", **arg_config)
+
+    args = parser.parse_args()
+
+    report = score_file(
+        input_path=args.input,
+        output_dir=args.output,
+        model_uri=args.model_uri,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        overwrite=args.overwrite,
+    )
+    log.info(
+        "Escoragem concluída | linhas=%s | escoradas=%s | pedaços=%s "
+        "(retomados=%s) | %.1fs | %.0f linhas/s",
+        report.rows,
+        report.scored_rows,
+        report.chunks,
+        report.skipped_chunks,
+        report.seconds,
+        report.rows_per_second,
+    )
+    log.info(
+        "Pico de memória | principal=%.0f MB | workers=%.0f MB",
+        report.peak_rss_mb,
+        report.peak_worker_rss_mb,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Medição do custo de servir um modelo e orçamentos de serving.
+
+O treinamento mede, para cada modelo candidato, a latência de predições
+unitárias e em lote, o tamanho do artefato serializado e a memória ocupada
+pelo modelo carregado. Esses valores são comparados com orçamentos
+configuráveis antes do registro no Model Registry.
+"""
+
+import pickle
+import time
+import tracemalloc
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class ServingCost:
+    """
+    Custo de servir um modelo.
+
+    Attributes:
+        single_p50_ms: Mediana da latência de uma predição unitária.
+        single_p95_ms: Percentil 95 da latência de uma predição unitária.
+        batch_ms: Latência de uma predição em lote (melhor de 3).
+        batch_rows: Quantidade de linhas do lote medido.
+        model_size_mb: Tamanho do modelo serializado com pickle.
+        model_memory_mb: Memória ocupada pelo modelo desserializado.
+    """
+
+    single_p50_ms: float
+    single_p95_ms: float
+    batch_ms: float
+    batch_rows: int
+    model_size_mb: float
+    model_memory_mb: float
+
+    def as_metrics(self) -> dict[str, float]:
+        """
+        Returns:
+            dict[str, float]: Custos no formato de métricas do MLflow.
+        """
+        return {name: float(value) for name, value in asdict(self).items()}
+
+
+@dataclass
+class ServingBudget:
+    """
+    Limites de custo aceitos para registrar um modelo.
+
+    Limites None não são verificados.
+
+    Attributes:
+        max_single_latency_ms: Limite do p95 da predição unitária.
+        max_batch_latency_ms: Limite da predição em lote.
+        max_model_size_mb: Limite do tamanho serializado.
+        max_model_memory_mb: Limite da memória do modelo carregado.
+    """
+
+    max_single_latency_ms: float | None = None
+    max_batch_latency_ms: float | None = None
+    max_model_size_mb: float | None = None
+    max_model_memory_mb: float | None = None
+
+    def violations(self, cost: ServingCost) -> list[str]:
+        """
+        Lista os limites ultrapassados por um modelo.
+
+        Args:
+            cost: Custo medido do modelo.
+
+        Returns:
+            list[str]: Descrição de cada limite ultrapassado; vazia se o
+                modelo couber no orçamento.
+        """
+        checks = (
+            ("latência unitária p95", cost.single_p95_ms, self.max_single_latency_ms),
+            ("latência em lote", cost.batch_ms, self.max_batch_latency_ms),
+            ("tamanho do modelo", cost.model_size_mb, self.max_model_size_mb),
+            ("memória do modelo", cost.model_memory_mb, self.max_model_memory_mb),
+        )
+        return [
+            f"{name} {value:.2f} > {limit:.2f}"
+            for name, value, limit in checks
+            if limit is not None and value > limit
+        ]
+
+
+def _native_tree_bytes(model: Any) -> int:
+    """
+    Soma a memória dos nós de árvores Scikit-learn alocada fora do Python.
+
+    As árvores guardam nós e valores em buffers C que o ``tracemalloc`` não
+    enxerga; sem essa soma, a memória de uma floresta seria quase nula.
+
+    Args:
+        model: Pipeline, ensemble ou árvore Scikit-learn.
+
+    Returns:
+        int: Bytes dos buffers de nós e valores de todas as árvores.
+    """
+    from sklearn.tree._tree import NODE_DTYPE
+
+    steps = [step for _, step in getattr(model, "steps", [(None, model)])]
+    total = 0
+    for step in steps:
+        for estimator in getattr(step, "estimators_", [step]):
+            tree = getattr(estimator, "tree_", None)
+            if tree is None:
+                continue
+            value_bytes = tree.value.itemsize * tree.n_outputs * tree.max_n_classes
+            total += tree.capacity * (NODE_DTYPE.itemsize + value_bytes)
+    return total
+
+
+def measure_serving_cost(
+    model: Any,
+    features: pd.DataFrame,
+    single_calls: int = 50,
+    batch_size: int = 1000,
+) -> ServingCost:
+    """
+    Mede latência, tamanho e memória de um modelo treinado.
+
+    As predições unitárias usam linhas distintas de ``features``, como no
+    endpoint ``/predict``; o lote usa as primeiras ``batch_size`` linhas. A
+    memória é a alocada pelo Python ao desserializar o modelo mais os buffers
+    nativos das árvores.
+
+    Args:
+        model: Modelo com método ``predict`` (ex.: Pipeline Scikit-learn).
+        features: Features usadas nas predições de medição.
+        single_calls: Quantidade de predições unitárias medidas.
+        batch_size: Quantidade de linhas do lote medido.
+
+    Returns:
+        ServingCost: Custos medidos.
+    """
+    rows = [features.iloc[[index % len(features)]] for index in range(single_calls)]
+    model.predict(rows[0])
+    timings = []
+    for row in rows:
+        started_at = time.perf_counter()
+        model.predict(row)
+        timings.append(time.perf_counter() - started_at)
+
+    batch = features.iloc[:batch_size]
+    batch_seconds = float("inf")
+    for _ in range(3):
+        started_at = time.perf_counter()
+        model.predict(batch)
+        batch_seconds = min(batch_seconds, time.perf_counter() - started_at)
+
+    serialized = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+    tracemalloc.start()
+    try:
+        loaded = pickle.loads(serialized)
+        loaded_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    loaded_bytes += _native_tree_bytes(loaded)
+    del loaded
+
+    timings_ms = np.asarray(timings) * 1e3
+    return ServingCost(
+        single_p50_ms=float(np.percentile(timings_ms, 50)),
+        single_p95_ms=float(np.percentile(timings_ms, 95)),
+        batch_ms=batch_seconds * 1e3,
+        batch_rows=len(batch),
+        model_size_mb=len(serialized) / 2**20,
+        model_memory_mb=loaded_bytes / 2**20,
+    )
+
+
+def pareto_front(points: Sequence[tuple[float, float]]) -> list[int]:
+    """
+    Encontra os pontos não dominados quando os dois eixos são minimizados.
+
+    Um ponto é dominado se outro é tão bom quanto ele nos dois eixos e
+    estritamente melhor em pelo menos um. Pontos repetidos não dominam uns aos
+    outros e entram todos na fronteira.
+
+    Args:
+        points: Pares (erro, custo); métricas em que maior é melhor devem ser
+            negadas antes.
+
+    Returns:
+        list[int]: Índices dos pontos da fronteira, em ordem crescente de custo.
+    """
+    order = sorted(range(len(points)), key=lambda index: points[index][::-1])
+    front: list[int] = []
+    best_error = float("inf")
+    last_point: tuple[float, float] | None = None
+    for index in order:
+        point = tuple(points[index])
+        if point[0] < best_error or point == last_point:
+            front.append(index)
+            best_error = point[0]
+            last_point = point
+    return front
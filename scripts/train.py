@@ -1,51 +1,158 @@
 """
 Script de treinamento do modelo de precificação de imóveis.
+
+Sem ``--search``, treina uma única configuração com os hiperparâmetros da
+linha de comando. Com ``--search``, avalia em paralelo os candidatos de uma
+grade ou busca aleatória, registra cada um como run aninhada no MLflow e
+registra no Model Registry apenas o melhor modelo.
+
+Exemplo de especificação de busca (JSON):
+    {"grid": {"n_estimators": [100, 200], "max_depth": [8, 12, null]}}
+    {"random": {"n_estimators": {"low": 50, "high": 400},
+                "min_samples_leaf": [1, 2, 4]}, "n_iter": 20}
+
+Uso:
+    python -m scripts.train --search busca.json --threads-per-worker 1
 """
 
 import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from math import sqrt
+from multiprocessing import get_context
+from pathlib import Path
 from typing import Any
 
 import mlflow
 import mlflow.sklearn
 import numpy as np
 import pandas as pd
-from sklearn.datasets import fetch_california_housing
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import ParameterGrid, ParameterSampler, train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
+from threadpoolctl import threadpool_limits
 
 from scripts.constants import TRAIN_ARGUMENTS
+from scripts.dataset import DEFAULT_TARGET_COLUMN, DatasetInfo, load_dataset
+from scripts.serving_cost import (
+    ServingBudget,
+    ServingCost,
+    measure_serving_cost,
+    pareto_front,
+)
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Indica, para cada métrica de seleção, se valores maiores são melhores
+SEARCH_METRICS: dict[str, bool] = {"r2": True, "mae": False, "rmse": False}
+
+# Dados de treino e teste carregados uma única vez em cada processo do pool
+_worker_data: tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series] | None = None
+_worker_threads: int = 1
+_worker_cost_options: dict[str, int] = {}
+
 
-def load_data() -> tuple[pd.DataFrame, pd.Series]:
+@dataclass
+class CandidateResult:
+    """
+    Resultado da avaliação de um candidato da busca.
+
+    Attributes:
+        index: Posição do candidato na busca.
+        params: Hiperparâmetros do regressor.
+        metrics: Métricas no conjunto de teste.
+        fit_seconds: Duração do treinamento e da avaliação.
+        cost: Custo de servir o modelo treinado.
+        violations: Limites do orçamento de serving ultrapassados.
+        run_id: Run aninhada do candidato no MLflow.
     """
-    Carrega o dataset California Housing do Scikit-learn.
 
-    Returns:
-        Tuple[pd.DataFrame, pd.Series]: Tupla contendo features (X) e target (y)
-            como DataFrames/Series do Pandas.
+    index: int
+    params: dict[str, Any]
+    metrics: dict[str, float]
+    fit_seconds: float
+    cost: ServingCost | None = None
+    violations: list[str] = field(default_factory=list)
+    run_id: str | None = None
+
+
+@dataclass
+class SearchResult:
+    """
+    Resultado de uma busca de hiperparâmetros.
+
+    Attributes:
+        best: Melhor candidato dentro do orçamento segundo a métrica de
+            seleção, ou None se nenhum couber no orçamento.
+        best_pipeline: Pipeline treinado do melhor candidato.
+        candidates: Todos os candidatos, na ordem da busca.
+        pareto: Índices dos candidatos na fronteira de Pareto entre a
+            métrica de seleção e a latência unitária p95.
+        seconds: Duração total da busca.
     """
-    log.info("Carregando dataset California Housing")
-    california_housing = fetch_california_housing(as_frame=True)
 
-    # Converter para DataFrames do Pandas
-    X = california_housing.frame.drop(columns=["MedHouseVal"])
-    y = california_housing.frame["MedHouseVal"]
+    best: CandidateResult | None
+    best_pipeline: Pipeline | None
+    candidates: list[CandidateResult] = field(default_factory=list)
+    pareto: list[int] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def load_data(
+    source: str = "california-housing",
+    cache_dir: str = "cache/datasets",
+    target_column: str = DEFAULT_TARGET_COLUMN,
+    refresh: bool = False,
+) -> tuple[pd.DataFrame, pd.Series, DatasetInfo]:
+    """
+    Carrega o dataset de treino a partir do cache local.
+
+    Args:
+        source: ``california-housing``, ``synthetic[:N]`` ou caminho de um
+            arquivo CSV/Parquet.
+        cache_dir: Diretório raiz do cache de datasets.
+        target_column: Coluna do target em arquivos locais.
+        refresh: Refaz a materialização do cache.
+
+    Returns:
+        tuple[pd.DataFrame, pd.Series, DatasetInfo]: Features (X), target (y)
+            e metadados do dataset.
+    """
+    X, y, info = load_dataset(source, cache_dir, target_column, refresh)
     log.debug("Dados carregados com %s amostras e %s features", X.shape[0], X.shape[1])
 
-    return X, y
+    return X, y, info
+
+
+def log_dataset(info: DatasetInfo) -> None:
+    """
+    Registra a origem e o hash do dataset na run ativa do MLflow.
+
+    Args:
+        info: Metadados do dataset.
+    """
+    mlflow.set_tags(
+        {
+            "dataset": info.name,
+            "dataset_source": info.source,
+            "dataset_version": info.version,
+            "dataset_hash": info.content_hash,
+        }
+    )
+    mlflow.log_param("dataset_rows", info.rows)
 
 
 def build_pipeline(
     n_estimators: int = 100,
     max_depth: int = 10,
     random_state: int = 42,
+    n_jobs: int | None = None,
 ) -> Pipeline:
     """
     Cria um pipeline de pré-processamento e modelagem.
@@ -58,6 +165,7 @@ def build_pipeline(
         n_estimators: Número de árvores na floresta.
         max_depth: Profundidade máxima das árvores.
         random_state: Semente aleatória para reprodutibilidade.
+        n_jobs: Threads usadas pelo RandomForest no treino e na predição.
 
     Returns:
         Pipeline: Pipeline do Scikit-learn com pré-processamento e modelo.
@@ -71,6 +179,7 @@ def build_pipeline(
                     n_estimators=n_estimators,
                     max_depth=max_depth,
                     random_state=random_state,
+                    n_jobs=n_jobs,
                 ),
             ),
         ]
@@ -79,12 +188,479 @@ def build_pipeline(
     return pipeline
 
 
+def evaluate_pipeline(
+    pipeline: Pipeline, features: pd.DataFrame, target: pd.Series
+) -> dict[str, float]:
+    """
+    Calcula as métricas de regressão de um pipeline treinado.
+
+    Args:
+        pipeline: Pipeline treinado.
+        features: Features do conjunto de teste.
+        target: Target do conjunto de teste.
+
+    Returns:
+        dict[str, float]: Métricas r2, mae e rmse.
+    """
+    predictions = pipeline.predict(features)
+    return {
+        "r2": r2_score(target, predictions),
+        "mae": mean_absolute_error(target, predictions),
+        "rmse": sqrt(mean_squared_error(target, predictions)),
+    }
+
+
+def _regressor_params(params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Prefixa hiperparâmetros do regressor para ``Pipeline.set_params``.
+
+    Args:
+        params: Hiperparâmetros do RandomForestRegressor.
+
+    Returns:
+        dict[str, Any]: Hiperparâmetros com o prefixo da etapa do pipeline.
+    """
+    return {f"regressor__{name}": value for name, value in params.items()}
+
+
+def _parse_distribution(values: Any) -> Any:
+    """
+    Converte a especificação de um hiperparâmetro da busca aleatória.
+
+    Args:
+        values: Lista de valores ou faixa ``{"low": ..., "high": ...}``,
+            inclusiva; faixas com limites inteiros sorteiam inteiros.
+
+    Returns:
+        Any: Lista de valores ou distribuição do SciPy.
+
+    Raises:
+        ValueError: Se a especificação não for uma lista nem uma faixa.
+    """
+    from scipy.stats import randint, uniform
+
+    if isinstance(values, list):
+        return values
+    if isinstance(values, dict) and {"low", "high"} <= values.keys():
+        low, high = values["low"], values["high"]
+        if isinstance(low, int) and isinstance(high, int):
+            return randint(low, high + 1)
+        return uniform(low, high - low)
+    raise ValueError(f"Especificação de hiperparâmetro inválida: {values!r}")
+
+
+def build_candidates(
+    spec: dict[str, Any],
+    random_state: int,
+    base_params: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Expande a especificação de busca na lista de candidatos.
+
+    Args:
+        spec: ``{"grid": {...}}`` para busca em grade ou ``{"random": {...},
+            "n_iter": N}`` para busca aleatória.
+        random_state: Semente do sorteio da busca aleatória.
+        base_params: Hiperparâmetros usados quando a busca não os varia.
+
+    Returns:
+        list[dict[str, Any]]: Hiperparâmetros do regressor de cada candidato,
+            já combinados com ``base_params``.
+
+    Raises:
+        ValueError: Se a especificação ou algum hiperparâmetro for inválido.
+    """
+    if "grid" in spec:
+        candidates = list(ParameterGrid(spec["grid"]))
+    elif "random" in spec:
+        distributions = {
+            name: _parse_distribution(values)
+            for name, values in spec["random"].items()
+        }
+        sampler = ParameterSampler(
+            distributions, n_iter=spec.get("n_iter", 10), random_state=random_state
+        )
+        # Converte escalares NumPy para que os parâmetros sejam serializáveis
+        candidates = [
+            {
+                name: value.item() if isinstance(value, np.generic) else value
+                for name, value in params.items()
+            }
+            for params in sampler
+        ]
+    else:
+        raise ValueError("A especificação de busca deve conter 'grid' ou 'random'")
+
+    candidates = [{**(base_params or {}), **params} for params in candidates]
+    # Valida os nomes antes de iniciar o pool
+    for params in candidates:
+        build_pipeline().set_params(**_regressor_params(params))
+    return candidates
+
+
+def budget_from_args(args: argparse.Namespace) -> ServingBudget:
+    """
+    Monta o orçamento de serving a partir da linha de comando.
+
+    Args:
+        args: Argumentos da linha de comando.
+
+    Returns:
+        ServingBudget: Orçamento configurado.
+    """
+    return ServingBudget(
+        max_single_latency_ms=args.max_single_latency_ms,
+        max_batch_latency_ms=args.max_batch_latency_ms,
+        max_model_size_mb=args.max_model_size_mb,
+        max_model_memory_mb=args.max_model_memory_mb,
+    )
+
+
+def _init_worker(
+    data: tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series],
+    threads: int,
+    cost_options: dict[str, int],
+) -> None:
+    """
+    Recebe os dados e limita as threads no processo worker.
+
+    Args:
+        data: Features e target de treino e teste.
+        threads: Threads permitidas por worker.
+        cost_options: Argumentos de ``measure_serving_cost``.
+    """
+    global _worker_data, _worker_threads, _worker_cost_options
+    _worker_data = data
+    _worker_threads = threads
+    _worker_cost_options = cost_options
+    threadpool_limits(limits=threads)
+
+
+def _fit_candidate(
+    index: int, params: dict[str, Any], random_state: int
+) -> tuple[CandidateResult, Pipeline]:
+    """
+    Treina e avalia um candidato com os dados do processo.
+
+    O custo de serving é medido com ``n_jobs`` desfeito, como o modelo seria
+    servido, e usando as features de teste.
+
+    Args:
+        index: Posição do candidato na busca.
+        params: Hiperparâmetros do regressor.
+        random_state: Semente aleatória do regressor.
+
+    Returns:
+        tuple[CandidateResult, Pipeline]: Resultado e pipeline treinado.
+    """
+    X_train, X_test, y_train, y_test = _worker_data
+    started_at = time.perf_counter()
+    pipeline = build_pipeline(random_state=random_state, n_jobs=_worker_threads)
+    pipeline.set_params(**_regressor_params(params))
+    pipeline.fit(X_train, y_train)
+    metrics = evaluate_pipeline(pipeline, X_test, y_test)
+    fit_seconds = time.perf_counter() - started_at
+
+    # O modelo servido não herda o limite de threads usado na busca
+    pipeline.set_params(regressor__n_jobs=None)
+    cost = measure_serving_cost(pipeline, X_test, **_worker_cost_options)
+    result = CandidateResult(
+        index=index,
+        params=params,
+        metrics=metrics,
+        fit_seconds=fit_seconds,
+        cost=cost,
+    )
+    return result, pipeline
+
+
+def run_search(
+    candidates: list[dict[str, Any]],
+    data: tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series],
+    workers: int | None = None,
+    threads_per_worker: int = 1,
+    metric: str = "rmse",
+    random_state: int = 42,
+    budget: ServingBudget | None = None,
+    latency_calls: int = 50,
+    latency_batch_size: int = 1000,
+) -> SearchResult:
+    """
+    Avalia os candidatos em paralelo, cada um como run aninhada no MLflow.
+
+    Cada processo do pool usa no máximo ``threads_per_worker`` threads, tanto
+    no RandomForest quanto nas bibliotecas nativas, evitando que
+    ``workers * threads_per_worker`` ultrapasse os núcleos disponíveis. As
+    runs aninhadas são registradas pelo processo principal, sob a run ativa,
+    à medida que os candidatos terminam, com as métricas de qualidade e de
+    custo de serving. Apenas o melhor pipeline dentro do orçamento é mantido
+    em memória.
+
+    Como os candidatos são medidos em paralelo, as latências têm ruído de
+    vizinhança; a comparação entre candidatos é justa, mas o valor absoluto
+    tende a ser pessimista.
+
+    Args:
+        candidates: Hiperparâmetros do regressor de cada candidato.
+        data: Features e target de treino e teste.
+        workers: Processos do pool; padrão é o número de CPUs dividido por
+            ``threads_per_worker``. 1 avalia no próprio processo.
+        threads_per_worker: Threads permitidas por processo.
+        metric: Métrica usada para escolher o melhor candidato.
+        random_state: Semente aleatória dos regressores.
+        budget: Orçamento de serving; candidatos acima dele não são elegíveis.
+        latency_calls: Predições unitárias medidas por candidato.
+        latency_batch_size: Linhas do lote medido por candidato.
+
+    Returns:
+        SearchResult: Melhor candidato, resultados de todos eles e fronteira
+            de Pareto.
+
+    Raises:
+        ValueError: Se a lista de candidatos estiver vazia ou a métrica não
+            for suportada.
+    """
+    if not candidates:
+        raise ValueError("A busca não possui candidatos")
+    if metric not in SEARCH_METRICS:
+        raise ValueError(f"Métrica de seleção não suportada: {metric}")
+    threads_per_worker = max(1, threads_per_worker)
+    workers = max(1, workers or (os.cpu_count() or 1) // threads_per_worker)
+    workers = min(workers, len(candidates))
+    log.info(
+        "Busca com %s candidatos | %s workers x %s threads",
+        len(candidates),
+        workers,
+        threads_per_worker,
+    )
+
+    sign = -1.0 if SEARCH_METRICS[metric] else 1.0
+    budget = budget or ServingBudget()
+    cost_options = {"single_calls": latency_calls, "batch_size": latency_batch_size}
+    results: list[CandidateResult] = []
+    best: tuple[CandidateResult, Pipeline] | None = None
+
+    def record(result: CandidateResult, pipeline: Pipeline) -> None:
+        nonlocal best
+        result.violations = budget.violations(result.cost)
+        with mlflow.start_run(
+            run_name=f"candidate-{result.index:03d}", nested=True
+        ) as run:
+            mlflow.log_params(result.params)
+            mlflow.log_metrics(
+                {
+                    **result.metrics,
+                    **result.cost.as_metrics(),
+                    "fit_seconds": result.fit_seconds,
+                }
+            )
+            mlflow.set_tag("within_budget", str(not result.violations).lower())
+            result.run_id = run.info.run_id
+        log.info(
+            "Candidato %s | %s | %s=%.4f | p95=%.2fms | %.1fMB | %.1fs%s",
+            result.index,
+            result.params,
+            metric,
+            result.metrics[metric],
+            result.cost.single_p95_ms,
+            result.cost.model_size_mb,
+            result.fit_seconds,
+            f" | fora do orçamento: {'; '.join(result.violations)}"
+            if result.violations
+            else "",
+        )
+        results.append(result)
+        if result.violations:
+            return
+        if best is None or sign * result.metrics[metric] < sign * best[0].metrics[
+            metric
+        ]:
+            best = (result, pipeline)
+
+    started_at = time.perf_counter()
+    if workers == 1:
+        _init_worker(data, threads_per_worker, cost_options)
+        for index, params in enumerate(candidates):
+            record(*_fit_candidate(index, params, random_state))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(data, threads_per_worker, cost_options),
+        ) as pool:
+            futures = [
+                pool.submit(_fit_candidate, index, params, random_state)
+                for index, params in enumerate(candidates)
+            ]
+            for future in as_completed(futures):
+                record(*future.result())
+
+    results.sort(key=lambda result: result.index)
+    front = pareto_front(
+        [
+            (sign * result.metrics[metric], result.cost.single_p95_ms)
+            for result in results
+        ]
+    )
+    client = mlflow.MlflowClient()
+    for position in front:
+        client.set_tag(results[position].run_id, "pareto_front", "true")
+
+    best_result, best_pipeline = best or (None, None)
+    return SearchResult(
+        best=best_result,
+        best_pipeline=best_pipeline,
+        candidates=results,
+        pareto=[results[position].index for position in front],
+        seconds=time.perf_counter() - started_at,
+    )
+
+
+def _log_pareto_front(result: SearchResult, metric: str) -> None:
+    """
+    Exibe e registra como artefato a fronteira de Pareto da busca.
+
+    Args:
+        result: Resultado da busca.
+        metric: Métrica de seleção.
+    """
+    rows = []
+    for index in result.pareto:
+        candidate = result.candidates[index]
+        rows.append(
+            {
+                "candidate": candidate.index,
+                "params": candidate.params,
+                metric: candidate.metrics[metric],
+                **candidate.cost.as_metrics(),
+                "within_budget": not candidate.violations,
+            }
+        )
+        log.info(
+            "Pareto | candidato %s | %s=%.4f | p95=%.2fms | lote=%.1fms | %.1fMB",
+            candidate.index,
+            metric,
+            candidate.metrics[metric],
+            candidate.cost.single_p95_ms,
+            candidate.cost.batch_ms,
+            candidate.cost.model_size_mb,
+        )
+    mlflow.log_dict(rows, "pareto_front.json")
+
+
+def _log_budget(budget: ServingBudget) -> None:
+    """
+    Registra os limites configurados do orçamento como parâmetros da run.
+
+    Args:
+        budget: Orçamento de serving.
+    """
+    mlflow.log_params(
+        {
+            f"budget_{name}": value
+            for name, value in asdict(budget).items()
+            if value is not None
+        }
+    )
+
+
+def train_with_search(
+    args: argparse.Namespace,
+    data: tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series],
+    dataset: DatasetInfo,
+) -> SearchResult:
+    """
+    Executa a busca sob uma run pai e registra apenas o melhor modelo.
+
+    Args:
+        args: Argumentos da linha de comando.
+        data: Features e target de treino e teste.
+        dataset: Metadados do dataset.
+
+    Returns:
+        SearchResult: Resultado da busca; ``best`` é None se nenhum candidato
+            couber no orçamento e, nesse caso, nada é registrado.
+    """
+    spec = json.loads(Path(args.search).read_text())
+    candidates = build_candidates(
+        spec,
+        args.random_state,
+        base_params={"n_estimators": args.n_estimators, "max_depth": args.max_depth},
+    )
+
+    budget = budget_from_args(args)
+    with mlflow.start_run(run_name="hyperparameter-search"):
+        mlflow.log_dict(spec, "search_spec.json")
+        log_dataset(dataset)
+        mlflow.log_params(
+            {
+                "search_strategy": "grid" if "grid" in spec else "random",
+                "search_candidates": len(candidates),
+                "search_metric": args.search_metric,
+                "threads_per_worker": args.threads_per_worker,
+                "random_state": args.random_state,
+                "test_size": args.test_size,
+            }
+        )
+        _log_budget(budget)
+
+        result = run_search(
+            candidates,
+            data,
+            workers=args.search_workers,
+            threads_per_worker=args.threads_per_worker,
+            metric=args.search_metric,
+            random_state=args.random_state,
+            budget=budget,
+            latency_calls=args.latency_calls,
+            latency_batch_size=args.latency_batch_size,
+        )
+        _log_pareto_front(result, args.search_metric)
+        if result.best is None:
+            mlflow.set_tag("registered", "false")
+            log.error(
+                "Nenhum candidato dentro do orçamento de serving; modelo não registrado"
+            )
+            return result
+
+        log.info(
+            "Busca concluída em %.1fs | melhor candidato %s | %s | %s=%.4f",
+            result.seconds,
+            result.best.index,
+            result.best.params,
+            args.search_metric,
+            result.best.metrics[args.search_metric],
+        )
+
+        mlflow.log_params(result.best.params)
+        mlflow.log_metrics(
+            {
+                **result.best.metrics,
+                **result.best.cost.as_metrics(),
+                "search_seconds": result.seconds,
+            }
+        )
+        mlflow.set_tag("best_candidate", f"candidate-{result.best.index:03d}")
+        mlflow.set_tag("registered", "true")
+        mlflow.set_tag("pipeline_description", "StandardScaler + RandomForest")
+
+        log.info("Registrando o melhor pipeline no MLflow")
+        mlflow.sklearn.log_model(
+            sk_model=result.best_pipeline,
+            artifact_path="property-price-predictor",
+            registered_model_name="property-price-predictor",
+        )
+    return result
+
+
 def main() -> None:
     """
     Função principal do script de treinamento.
 
     Orquestra todo o fluxo: carregamento de dados, divisão train/test,
-    treinamento do pipeline, avaliação e registro no MLflow.
+    treinamento do pipeline, avaliação e registro no MLflow. Com ``--search``,
+    o treinamento único é substituído pela busca de hiperparâmetros.
     """
     parser = argparse.ArgumentParser(
         description="Treina modelo de precificação de imóveis",
@@ -92,13 +668,7 @@ def main() -> None:
 
     # Adicionar argumentos a partir do dicionário de constantes
     for arg_name, arg_config in TRAIN_ARGUMENTS.items():
-        parser.add_argument(
-            f"--{arg_name}",
-            type=arg_config["type"],
-            default=arg_config["default"],
-            help=arg_config["help"],
-            required=arg_config.get("required", False),
-        )
+        parser.add_argument(f"--{arg_name}", **arg_config)
 
     args = parser.parse_args()
 
@@ -111,7 +681,9 @@ def main() -> None:
     log.info("Experimento do MLflow definido: %s", args.experiment_name)
 
     # Carregar dados
-    X, y = load_data()
+    X, y, dataset = load_data(
+        args.dataset, args.dataset_cache_dir, args.target_column, args.refresh_dataset
+    )
     log.info("Dados carregados: %s amostras | %s features", X.shape[0], X.shape[1])
 
     # Dividir dados em treino e teste
@@ -127,6 +699,14 @@ def main() -> None:
         X_test.shape[0],
     )
 
+    if args.search:
+        result = train_with_search(args, (X_train, X_test, y_train, y_test), dataset)
+        if result.best is None:
+            raise SystemExit(1)
+        return
+
+    budget = budget_from_args(args)
+
     # Iniciar run do MLflow
     with mlflow.start_run():
         # Definir hiperparâmetros
@@ -141,6 +721,8 @@ def main() -> None:
         log.debug("Hiperparâmetros utilizados: %s", hyperparameters)
         mlflow.log_params(hyperparameters)
         mlflow.log_param("test_size", args.test_size)
+        log_dataset(dataset)
+        _log_budget(budget)
 
         # Criar pipeline
         pipeline = build_pipeline(
@@ -172,25 +754,57 @@ def main() -> None:
 
         log.info("Métricas calculadas | R²=%.4f | MAE=%.4f | RMSE=%.4f", r2, mae, rmse)
 
+        # Medir custo de serving
+        cost = measure_serving_cost(
+            pipeline,
+            X_test,
+            single_calls=args.latency_calls,
+            batch_size=args.latency_batch_size,
+        )
+        violations = budget.violations(cost)
+        log.info(
+            "Custo de serving | p50=%.2fms | p95=%.2fms | lote(%s)=%.1fms | "
+            "tamanho=%.1fMB | memória=%.1fMB",
+            cost.single_p50_ms,
+            cost.single_p95_ms,
+            cost.batch_rows,
+            cost.batch_ms,
+            cost.model_size_mb,
+            cost.model_memory_mb,
+        )
+
         # Log de métricas
         log.info("Registrando métricas no MLflow")
-        mlflow.log_metrics(metrics)
+        mlflow.log_metrics({**metrics, **cost.as_metrics()})
 
         # Log de tags
         log.debug("Registrando tags no MLflow")
         mlflow.set_tag("pipeline_description", "StandardScaler + RandomForest")
-        mlflow.set_tag("dataset", "California Housing")
-
-        # Log do modelo (pipeline completo)
-        log.info("Registrando pipeline completo no MLflow")
-        mlflow.sklearn.log_model(
-            sk_model=pipeline,
-            artifact_path="property-price-predictor",
-            registered_model_name="property-price-predictor",
-        )
+        mlflow.set_tag("registered", str(not violations).lower())
+
+        # Log do modelo (pipeline completo); fora do orçamento, não é registrado
+        if violations:
+            log.error(
+                "Modelo fora do orçamento de serving, não registrado: %s",
+                "; ".join(violations),
+            )
+            mlflow.sklearn.log_model(
+                sk_model=pipeline, artifact_path="property-price-predictor"
+            )
+        else:
+            log.info("Registrando pipeline completo no MLflow")
+            mlflow.sklearn.log_model(
+                sk_model=pipeline,
+                artifact_path="property-price-predictor",
+                registered_model_name="property-price-predictor",
+            )
 
         run_id = mlflow.active_run().info.run_id if mlflow.active_run() else "unknown"
-        log.info("Modelo registrado com sucesso no MLflow | Run ID: %s", run_id)
+        if not violations:
+            log.info("Modelo registrado com sucesso no MLflow | Run ID: %s", run_id)
+
+    if violations:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""
+Fixtures compartilhadas entre os módulos de teste.
+"""
+
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+
+from scripts.dataset import synthetic_features
+from scripts.train import build_pipeline
+
+
+def build_synthetic_features(n_rows: int, random_state: int = 0) -> pd.DataFrame:
+    """
+    Gera features sintéticas nas faixas do dataset California Housing.
+
+    Args:
+        n_rows: Quantidade de linhas geradas.
+        random_state: Semente aleatória para reprodutibilidade.
+
+    Returns:
+        pd.DataFrame: Features na ordem de ``settings.FEATURE_ORDER``.
+    """
+    return synthetic_features(n_rows, random_state)
+
+
+@pytest.fixture(scope="session")
+def trained_pipeline() -> Pipeline:
+    """
+    Fixture que treina um pipeline pequeno com dados sintéticos.
+
+    Returns:
+        Pipeline: Pipeline StandardScaler + RandomForest treinado.
+    """
+    features = build_synthetic_features(500)
+    target = (
+        0.4 * features["MedInc"]
+        + 0.01 * features["HouseAge"]
+        - 0.1 * (features["Latitude"] - 36.0)
+    )
+    pipeline = build_pipeline(n_estimators=10, max_depth=6, random_state=0)
+    pipeline.fit(features, target)
+    return pipeline
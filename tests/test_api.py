@@ -2,13 +2,21 @@
 Testes para os endpoints da API.
 """
 
+import json
+import threading
+import time
 from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
+import pyarrow as pa
 import pytest
 from fastapi.testclient import TestClient
 
+from app.config import settings
 from app.schemas.prediction import PredictionInput, PredictionOutput
+from app.services.arrow import ARROW_STREAM_MEDIA_TYPE
 from app.services.predictor import PredictorService, get_predictor_service
 
 
@@ -24,18 +32,26 @@ def predictor_service_mock() -> MagicMock:
 
 
 @pytest.fixture
-def client(predictor_service_mock: MagicMock) -> Generator[TestClient, None, None]:
+def client(
+    predictor_service_mock: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> Generator[TestClient, None, None]:
     """
     Fixture para criar uma instância do TestClient com serviço de predição mockado.
 
+    O carregamento na inicialização é desabilitado para que o aquecimento não
+    conte como chamada ao mock.
+
     Args:
         predictor_service_mock: Mock do serviço de predição.
+        monkeypatch: Fixture para alterar as settings.
 
     Yields:
         TestClient: Cliente de teste do FastAPI.
     """
     from app.main import app
 
+    monkeypatch.setattr(settings, "STARTUP_LOAD_ENABLED", False)
+
     app.dependency_overrides[get_predictor_service] = lambda: predictor_service_mock
 
     with TestClient(app) as test_client:
@@ -258,3 +274,646 @@ def test_predict_endpoint_value_error(
     # Assert
     assert response.status_code == 500  # Internal Server Error
     assert "Erro ao carregar modelo" in response.json()["detail"]
+
+
+def test_predict_batch_endpoint_reports_errors_per_row(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que o lote prediz as linhas válidas e reporta erros por linha.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    # Arrange
+    valid_row = {
+        "MedInc": 8.3252,
+        "HouseAge": 41.0,
+        "AveRooms": 6.984127,
+        "AveBedrms": 1.023810,
+        "Population": 322.0,
+        "AveOccup": 2.555556,
+        "Latitude": 37.88,
+        "Longitude": -122.23,
+    }
+    invalid_row = {**valid_row, "AveRooms": -1.0}
+    predictor_service_mock.predict_matrix.return_value = np.array([1.5, 2.5])
+
+    # Act
+    response = client.post(
+        "/predict/batch", json={"instances": [valid_row, invalid_row, valid_row]}
+    )
+
+    # Assert
+    assert response.status_code == 200
+    predictions = response.json()["predictions"]
+    assert [item["index"] for item in predictions] == [0, 1, 2]
+    assert predictions[0]["predicted_value"] == 1.5
+    assert predictions[1]["predicted_value"] is None
+    assert predictions[1]["error"] == "AveRooms: Input should be greater than 0"
+    assert predictions[2]["predicted_value"] == 2.5
+    called_matrix = predictor_service_mock.predict_matrix.call_args[0][0]
+    assert called_matrix.shape == (2, len(settings.FEATURE_ORDER))
+
+
+def test_predict_endpoints_return_intervals_when_requested(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa o intervalo opcional nos endpoints individual e em lote.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    row = PredictionInput.model_config["json_schema_extra"]["example"]
+    predictor_service_mock.predict.return_value = PredictionOutput(predicted_value=2.0)
+    predictor_service_mock.predict_intervals.side_effect = lambda matrix, *_: (
+        np.tile([2.0, 1.5, 2.5], (len(matrix), 1))
+    )
+
+    plain = client.post("/predict/", json=row)
+    single = client.post("/predict/?interval=std&coverage=0.8", json=row)
+    batch = client.post(
+        "/predict/batch?interval=quantile",
+        json={"instances": [row, {**row, "AveRooms": -1.0}]},
+    )
+
+    assert plain.json() == {"predicted_value": 2.0}
+    assert single.json() == {
+        "predicted_value": 2.0,
+        "interval": {"lower": 1.5, "upper": 2.5},
+    }
+    first_call, batch_call = predictor_service_mock.predict_intervals.call_args_list
+    matrix, method, coverage = first_call.args
+    assert matrix.shape == (1, len(settings.FEATURE_ORDER))
+    assert (method, coverage) == ("std", 0.8)
+    predictions = batch.json()["predictions"]
+    assert predictions[0]["interval"] == {"lower": 1.5, "upper": 2.5}
+    assert predictions[1]["interval"] is None
+    assert batch_call.args[1:] == ("quantile", 0.9)
+    predictor_service_mock.predict_matrix.assert_not_called()
+
+
+def test_predict_endpoint_rejects_intervals_without_trees(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa o erro 501 quando o modelo não expõe as predições por árvore e a
+    validação da cobertura.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    row = PredictionInput.model_config["json_schema_extra"]["example"]
+    predictor_service_mock.predict_intervals.side_effect = NotImplementedError(
+        "sem árvores"
+    )
+
+    response = client.post("/predict/?interval=quantile", json=row)
+    invalid = client.post("/predict/?interval=quantile&coverage=1.5", json=row)
+
+    assert response.status_code == 501
+    assert response.json()["detail"] == "sem árvores"
+    assert invalid.status_code == 422
+
+
+def test_explain_endpoint_returns_contributions_per_feature(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que o /predict/explain devolve as contribuições nomeadas por feature
+    e reporta 501 quando o modelo não suporta explicações.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    row = PredictionInput.model_config["json_schema_extra"]["example"]
+    contributions = np.arange(len(settings.FEATURE_ORDER)) / 10
+    predictor_service_mock.explain_matrix.return_value = np.array(
+        [[2.0 + contributions.sum(), 2.0, *contributions]] * 2
+    )
+
+    response = client.post("/predict/explain", json={"instances": [row, row]})
+
+    assert response.status_code == 200
+    explanations = response.json()["explanations"]
+    assert len(explanations) == 2
+    assert explanations[0]["base_value"] == 2.0
+    assert list(explanations[0]["contributions"]) == settings.FEATURE_ORDER
+    assert explanations[0]["contributions"]["HouseAge"] == 0.1
+    called_matrix = predictor_service_mock.explain_matrix.call_args[0][0]
+    assert called_matrix.shape == (2, len(settings.FEATURE_ORDER))
+
+    predictor_service_mock.explain_matrix.side_effect = NotImplementedError("off")
+    assert client.post("/predict/explain", json={"instances": [row]}).status_code == 501
+    invalid = client.post(
+        "/predict/explain", json={"instances": [{**row, "AveRooms": -1}]}
+    )
+    assert invalid.status_code == 422
+
+
+def test_sweep_endpoint_scores_grid_in_one_call(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que a curva e a superfície são preditas em uma única chamada, sem
+    cache, com as demais features fixas.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    base = PredictionInput.model_config["json_schema_extra"]["example"]
+    predictor_service_mock.predict_matrix.side_effect = lambda matrix, _: (
+        matrix[:, 0] + matrix[:, 1] / 100
+    )
+
+    curve = client.post(
+        "/predict/sweep",
+        json={"base": base, "axes": [{"feature": "MedInc", "values": [2, 4]}]},
+    )
+    surface = client.post(
+        "/predict/sweep",
+        json={
+            "base": base,
+            "axes": [
+                {"feature": "MedInc", "start": 2, "stop": 12, "num": 3},
+                {"feature": "HouseAge", "values": [10, 50]},
+            ],
+        },
+    )
+
+    assert curve.status_code == 200
+    assert curve.json() == {
+        "features": ["MedInc"],
+        "grids": [[2.0, 4.0]],
+        "predicted_values": [2.41, 4.41],
+    }
+    body = surface.json()
+    assert body["grids"] == [[2.0, 7.0, 12.0], [10.0, 50.0]]
+    np.testing.assert_allclose(
+        body["predicted_values"], [[2.1, 2.5], [7.1, 7.5], [12.1, 12.5]]
+    )
+    matrix, use_cache = predictor_service_mock.predict_matrix.call_args[0]
+    assert matrix.shape == (6, len(settings.FEATURE_ORDER))
+    assert use_cache is False
+    np.testing.assert_array_equal(matrix[:, 2], base["AveRooms"])
+
+
+@pytest.mark.parametrize(
+    "axes",
+    [
+        [{"feature": "MedInc", "start": 0, "stop": 1, "num": 10_001}],
+        [{"feature": "AveRooms", "values": [-1.0, 2.0]}],
+        [{"feature": "Bairro", "values": [1.0]}],
+        [{"feature": "MedInc", "values": [1.0], "num": 3}],
+        [{"feature": "MedInc", "values": [1.0]}, {"feature": "MedInc", "values": [2]}],
+    ],
+)
+def test_sweep_endpoint_rejects_invalid_grids(
+    client: TestClient, predictor_service_mock: MagicMock, axes: list[dict]
+) -> None:
+    """
+    Testa o limite de pontos e a validação dos eixos e dos imóveis gerados.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+        axes: Eixos inválidos.
+    """
+    base = PredictionInput.model_config["json_schema_extra"]["example"]
+
+    response = client.post("/predict/sweep", json={"base": base, "axes": axes})
+
+    assert response.status_code == 422
+    predictor_service_mock.predict_matrix.assert_not_called()
+
+
+def test_predict_batch_endpoint_rejects_oversized_batch(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que lotes acima do limite configurado são rejeitados.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    from app.config import settings
+
+    instances = [{"MedInc": 1.0}] * (settings.MAX_BATCH_SIZE + 1)
+
+    response = client.post("/predict/batch", json={"instances": instances})
+
+    assert response.status_code == 413
+    predictor_service_mock.predict_matrix.assert_not_called()
+
+
+def test_predict_endpoint_with_micro_batching(
+    client: TestClient,
+    predictor_service_mock: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que o endpoint usa o micro-batcher quando habilitado.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+        monkeypatch: Fixture para alterar as configurações.
+    """
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "MICRO_BATCHING_ENABLED", True)
+    monkeypatch.setattr(settings, "MICRO_BATCH_MAX_WAIT_MS", 0.0)
+    predictor_service_mock.predict_batch.return_value = [
+        PredictionOutput(predicted_value=7.5)
+    ]
+    input_data = {
+        "MedInc": 8.3252,
+        "HouseAge": 41.0,
+        "AveRooms": 6.984127,
+        "AveBedrms": 1.023810,
+        "Population": 322.0,
+        "AveOccup": 2.555556,
+        "Latitude": 37.88,
+        "Longitude": -122.23,
+    }
+
+    response = client.post("/predict/", json=input_data)
+
+    assert response.status_code == 200
+    assert response.json()["predicted_value"] == 7.5
+    predictor_service_mock.predict.assert_not_called()
+    predictor_service_mock.predict_batch.assert_called_once()
+    assert "micro_batching" in client.get("/health").json()
+
+
+def test_health_endpoint_responsive_during_prediction(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que o health check responde enquanto uma predição está em execução.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_predict(_: PredictionInput) -> PredictionOutput:
+        started.set()
+        release.wait(timeout=5)
+        return PredictionOutput(predicted_value=1.0)
+
+    predictor_service_mock.predict.side_effect = slow_predict
+    input_data = {
+        "MedInc": 8.3252,
+        "HouseAge": 41.0,
+        "AveRooms": 6.984127,
+        "AveBedrms": 1.023810,
+        "Population": 322.0,
+        "AveOccup": 2.555556,
+        "Latitude": 37.88,
+        "Longitude": -122.23,
+    }
+    responses = {}
+
+    def send_prediction() -> None:
+        responses["predict"] = client.post("/predict/", json=input_data)
+
+    request_thread = threading.Thread(target=send_prediction)
+    request_thread.start()
+
+    try:
+        assert started.wait(timeout=5)
+        assert client.get("/health").status_code == 200
+        assert "predict" not in responses
+    finally:
+        release.set()
+        request_thread.join(timeout=5)
+
+    assert responses["predict"].status_code == 200
+
+
+def test_model_info_endpoint(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que o endpoint de modelo expõe a versão ativa e a última troca.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    predictor_service_mock.model_version = "3"
+    predictor_service_mock.model_uri = "models:/property-price-predictor/3"
+    predictor_service_mock.forest = None
+    predictor_service_mock.sklearn_model = None
+    predictor_service_mock.loaded_at = 1_700_000_000.0
+    predictor_service_mock.last_swap_at = None
+
+    response = client.get("/model/")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["version"] == "3"
+    assert data["backend"] == "pyfunc"
+    assert data["last_swap_at"] is None
+
+
+def test_metrics_endpoint_exposes_stage_histograms(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que /metrics expõe histogramas por etapa e contadores de requisição.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    predictor_service_mock.predict.return_value = PredictionOutput(predicted_value=1.0)
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+
+    client.post("/predict/", json=example)
+    client.post("/predict/", json={**example, "AveRooms": -1.0})
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    for stage in ("parse", "validate", "serialize"):
+        assert f'prediction_stage_duration_seconds_count{{stage="{stage}"}}' in body
+    assert 'http_requests_total{route="/predict/",status="200"}' in body
+    assert 'http_request_errors_total{route="/predict/",status="422"}' in body
+    assert 'quantile="0.99"' in body
+
+
+def test_metrics_endpoint_disabled(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Testa que a instrumentação pode ser desligada por completo.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        monkeypatch: Fixture para alterar as settings.
+    """
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 404
+
+
+def test_predict_stream_endpoint_scores_chunks_with_inline_errors(
+    client: TestClient,
+    predictor_service_mock: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa o streaming NDJSON em pedaços, com erros reportados por linha.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+        monkeypatch: Fixture para alterar as settings.
+    """
+    monkeypatch.setattr(settings, "STREAM_CHUNK_SIZE", 2)
+    predictor_service_mock.predict_matrix.side_effect = lambda matrix: matrix[:, 0]
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+    lines = [
+        json.dumps({**example, "MedInc": 1.0}),
+        "{json inválido",
+        "",
+        json.dumps({**example, "AveRooms": -1.0}),
+        json.dumps({**example, "MedInc": 2.0}),
+    ]
+    body = ("\n".join(lines) + "\n").encode()
+
+    def body_chunks() -> Generator[bytes, None, None]:
+        for start in range(0, len(body), 7):
+            yield body[start : start + 7]
+
+    response = client.post(
+        "/predict/stream",
+        content=body_chunks(),
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [item["index"] for item in results] == [0, 1, 3, 4]
+    assert results[0]["predicted_value"] == 1.0
+    assert "Invalid JSON" in results[1]["error"]
+    assert results[2]["error"].startswith("AveRooms:")
+    assert results[3]["predicted_value"] == 2.0
+    assert predictor_service_mock.predict_matrix.call_count == 2
+
+
+def test_predict_stream_endpoint_rejects_oversized_line(
+    client: TestClient,
+    predictor_service_mock: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que linhas acima do limite viram erro sem acumular o conteúdo.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+        monkeypatch: Fixture para alterar as settings.
+    """
+    monkeypatch.setattr(settings, "STREAM_MAX_LINE_BYTES", 512)
+    predictor_service_mock.predict_matrix.return_value = np.array([1.0])
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+    body = ("x" * 2_000 + "\n" + json.dumps(example) + "\n").encode()
+
+    response = client.post(
+        "/predict/stream",
+        content=[body[:600], body[600:1_200], body[1_200:]],
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert "excede o limite" in results[0]["error"]
+    assert results[1] == {
+        "index": 1,
+        "predicted_value": 1.0,
+        "error": None,
+        "interval": None,
+    }
+
+
+def _arrow_body(columns: dict[str, list[float | None]]) -> bytes:
+    """
+    Serializa colunas como stream Arrow IPC.
+
+    Args:
+        columns: Valores por nome de coluna.
+
+    Returns:
+        bytes: Corpo Arrow da requisição.
+    """
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_predict_batch_endpoint_with_arrow_body(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que corpos Arrow são preditos e respondidos com um stream Arrow.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+    columns: dict[str, list[float | None]] = {
+        name: [value] * 4 for name, value in example.items()
+    }
+    columns["AveRooms"][1] = -1.0
+    columns["MedInc"][2] = None
+    predictor_service_mock.predict_matrix.side_effect = lambda matrix: matrix[:, 1]
+
+    response = client.post(
+        "/predict/batch",
+        content=_arrow_body(columns),
+        headers={"content-type": ARROW_STREAM_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    result = pa.ipc.open_stream(response.content).read_all().to_pydict()
+    assert result["index"] == [0, 1, 2, 3]
+    assert result["predicted_value"] == [41.0, None, None, 41.0]
+    assert result["error"] == [
+        None,
+        "AveRooms: Input should be greater than 0",
+        "MedInc: Input should be a valid number",
+        None,
+    ]
+    called_matrix = predictor_service_mock.predict_matrix.call_args[0][0]
+    assert called_matrix.shape == (2, len(settings.FEATURE_ORDER))
+
+
+def test_predict_batch_endpoint_rejects_arrow_without_feature_columns(
+    client: TestClient, predictor_service_mock: MagicMock
+) -> None:
+    """
+    Testa que corpos Arrow sem todas as features são rejeitados.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+    """
+    response = client.post(
+        "/predict/batch",
+        content=_arrow_body({"MedInc": [1.0]}),
+        headers={"content-type": ARROW_STREAM_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 422
+    assert "HouseAge" in response.json()["detail"]
+    predictor_service_mock.predict_matrix.assert_not_called()
+
+
+def _wait_until_ready(client: TestClient) -> dict:
+    """
+    Aguarda o carregamento em segundo plano terminar.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+
+    Returns:
+        dict: Corpo da última resposta de /health/ready.
+    """
+    for _ in range(200):
+        body = client.get("/health/ready").json()
+        if body["status"] != "loading":
+            return body
+        time.sleep(0.01)
+    raise AssertionError("Carregamento não terminou")
+
+
+def test_startup_loads_and_warms_up_before_ready(
+    client: TestClient,
+    predictor_service_mock: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Testa que a prontidão só é reportada após carregar e aquecer o modelo.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        predictor_service_mock: Mock do serviço de predição.
+        monkeypatch: Fixture para alterar as settings.
+        tmp_path: Diretório temporário para os corpos gravados.
+    """
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+    payloads = tmp_path / "payloads.jsonl"
+    payloads.write_text(
+        json.dumps({**example, "MedInc": 1.0})
+        + "\n"
+        + json.dumps({"instances": [{**example, "MedInc": 2.0}, {"MedInc": "x"}]})
+        + "\n"
+    )
+    monkeypatch.setattr(settings, "STARTUP_LOAD_ENABLED", True)
+    monkeypatch.setattr(settings, "STARTUP_WARMUP_CALLS", 3)
+    monkeypatch.setattr(settings, "STARTUP_WARMUP_PAYLOADS", str(payloads))
+    predictor_service_mock.model_version = "7"
+    started = threading.Event()
+    predictor_service_mock.warm_up.side_effect = lambda inputs: started.wait(5)
+
+    with TestClient(client.app) as startup_client:
+        assert startup_client.get("/health/live").status_code == 200
+        assert startup_client.get("/health/ready").status_code == 503
+        started.set()
+        body = _wait_until_ready(startup_client)
+        response = startup_client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert body["status"] == "ready"
+    assert body["model_version"] == "7"
+    assert body["warmup_calls"] == 3
+    warmup_inputs = predictor_service_mock.warm_up.call_args[0][0]
+    assert [item.MedInc for item in warmup_inputs] == [1.0, 2.0, 1.0]
+
+
+def test_startup_failure_keeps_pod_not_ready(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Testa que uma falha no carregamento mantém o readiness em 503.
+
+    Args:
+        client: Cliente de teste do FastAPI.
+        monkeypatch: Fixture para alterar as settings.
+    """
+
+    def failing_provider() -> PredictorService:
+        raise RuntimeError("registry indisponível")
+
+    monkeypatch.setattr(settings, "STARTUP_LOAD_ENABLED", True)
+    client.app.dependency_overrides[get_predictor_service] = failing_provider
+
+    with TestClient(client.app) as startup_client:
+        body = _wait_until_ready(startup_client)
+        response = startup_client.get("/health/ready")
+        live_response = startup_client.get("/health/live")
+
+    assert response.status_code == 503
+    assert body["status"] == "failed"
+    assert "registry indisponível" in body["error"]
+    assert live_response.status_code == 200
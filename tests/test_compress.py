@@ -0,0 +1,224 @@
+"""
+Testes para a compressão da floresta compilada.
+"""
+
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import mlflow
+import mlflow.pyfunc
+import mlflow.sklearn
+import numpy as np
+import pytest
+from sklearn.pipeline import Pipeline
+
+from app.config import settings
+from app.services.forest import CompiledForest, compile_pipeline
+from app.services.forest_model import FOREST_ARTIFACT, CompiledForestModel
+from app.services.predictor import _unwrap_packaged_forest
+from scripts.compress import (
+    cap_depth,
+    compress_forest,
+    main,
+    merge_leaves,
+    quantize,
+    select_trees,
+)
+from tests.conftest import build_synthetic_features
+
+
+@pytest.fixture()
+def forest(trained_pipeline: Pipeline) -> CompiledForest:
+    """
+    Fixture com o pipeline sintético compilado.
+
+    Returns:
+        CompiledForest: Floresta compilada.
+    """
+    return compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+
+
+@pytest.fixture()
+def tracking_uri(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """
+    Fixture que aponta o MLflow para um diretório temporário.
+
+    A URI e o experimento ativo anteriores são restaurados ao final para não
+    vazarem para outros testes.
+
+    Yields:
+        str: URI do tracking temporário.
+    """
+    previous_uri = mlflow.get_tracking_uri()
+    previous_experiment = os.environ.get("MLFLOW_EXPERIMENT_ID")
+    uri = (tmp_path / "mlruns").as_uri()
+    monkeypatch.setattr(settings, "MLFLOW_TRACKING_URI", uri)
+    # ``mlflow.set_tracking_uri`` também exporta a URI no ambiente
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", uri)
+    monkeypatch.setattr(mlflow.tracking.fluent, "_active_experiment_id", None)
+    mlflow.set_tracking_uri(uri)
+    yield uri
+    mlflow.set_tracking_uri(previous_uri)
+    # ``mlflow.set_experiment`` exporta o experimento ativo da mesma forma
+    if previous_experiment is None:
+        os.environ.pop("MLFLOW_EXPERIMENT_ID", None)
+    else:
+        os.environ["MLFLOW_EXPERIMENT_ID"] = previous_experiment
+
+
+@pytest.fixture(scope="module")
+def matrix() -> np.ndarray:
+    """
+    Fixture com linhas de avaliação.
+
+    Returns:
+        np.ndarray: Matriz na ordem de ``FEATURE_ORDER``.
+    """
+    return build_synthetic_features(400, random_state=5).to_numpy()
+
+
+def test_select_trees_keeps_best_prefix(
+    forest: CompiledForest, matrix: np.ndarray
+) -> None:
+    """
+    Testa que a seleção não piora o erro do ensemble completo na seleção.
+    """
+    target = forest.predict(matrix) + np.random.default_rng(0).normal(0, 0.1, 400)
+
+    selected = select_trees(forest, matrix, target, max_trees=forest.n_trees)
+
+    def mse(model: CompiledForest) -> float:
+        return float(np.mean((model.predict(matrix) - target) ** 2))
+
+    assert 1 <= selected.n_trees <= forest.n_trees
+    assert mse(selected) <= mse(forest) + 1e-12
+    assert select_trees(forest, matrix, target, max_trees=3).n_trees <= 3
+
+
+def test_cap_depth_limits_depth(forest: CompiledForest, matrix: np.ndarray) -> None:
+    """
+    Testa a poda por profundidade e que o limite atual não altera a floresta.
+    """
+    capped = cap_depth(forest, 2)
+    unchanged = cap_depth(forest, forest.max_depth)
+
+    assert capped.max_depth == 2
+    assert capped.n_nodes <= 7 * forest.n_trees
+    np.testing.assert_allclose(unchanged.predict(matrix), forest.predict(matrix))
+    assert unchanged.n_nodes == forest.n_nodes
+
+
+def test_merge_leaves(forest: CompiledForest, matrix: np.ndarray) -> None:
+    """
+    Testa que tolerância zero preserva as predições e uma grande colapsa tudo.
+    """
+    exact = merge_leaves(forest, 0.0)
+    collapsed = merge_leaves(forest, np.inf)
+
+    np.testing.assert_allclose(exact.predict(matrix), forest.predict(matrix))
+    assert exact.n_nodes <= forest.n_nodes
+    assert collapsed.n_nodes == collapsed.n_trees == forest.n_trees
+    np.testing.assert_allclose(
+        collapsed.predict(matrix), forest.value[forest.roots].mean()
+    )
+
+
+@pytest.mark.parametrize(("dtype", "atol"), [("float32", 1e-4), ("float16", 0.5)])
+def test_quantize(
+    forest: CompiledForest, matrix: np.ndarray, dtype: str, atol: float
+) -> None:
+    """
+    Testa que a quantização reduz a memória e preserva as folhas.
+    """
+    quantized = quantize(forest, dtype)
+
+    assert quantized.threshold.dtype == np.dtype(dtype)
+    assert quantized.nbytes < forest.nbytes
+    assert np.array_equal(
+        np.isinf(quantized.threshold), np.isinf(forest.threshold)
+    )
+    predictions = quantized.predict(matrix)
+    assert predictions.dtype == np.float64
+    np.testing.assert_allclose(predictions, forest.predict(matrix), atol=atol)
+
+
+def test_compressed_forest_served_through_pyfunc(
+    forest: CompiledForest,
+    matrix: np.ndarray,
+    tmp_path: Path,
+    tracking_uri: str,
+) -> None:
+    """
+    Testa que a floresta comprimida salva como pyfunc prediz e é reconhecida
+    pelo serviço como backend compilado.
+    """
+    compressed = compress_forest(forest, max_depth=4, dtype="float32")
+    forest_dir = compressed.save(tmp_path / FOREST_ARTIFACT)
+    # Requisitos explícitos evitam a inferência lenta feita pelo MLflow
+    mlflow.pyfunc.save_model(
+        tmp_path / "model",
+        python_model=CompiledForestModel(),
+        artifacts={FOREST_ARTIFACT: str(forest_dir)},
+        pip_requirements=["numpy"],
+    )
+
+    model = mlflow.pyfunc.load_model(str(tmp_path / "model"))
+    frame = build_synthetic_features(400, random_state=5)
+
+    np.testing.assert_allclose(model.predict(frame), compressed.predict(matrix))
+    packaged = _unwrap_packaged_forest(model)
+    assert packaged is not None
+    assert packaged.threshold.dtype == np.float32
+
+
+def test_main_registers_compressed_version(
+    trained_pipeline: Pipeline,
+    tmp_path: Path,
+    tracking_uri: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa o script de ponta a ponta: a floresta comprimida vira uma nova versão
+    do modelo, marcada com a variante e a origem.
+    """
+    mlflow.set_experiment("compress-test")
+    with mlflow.start_run():
+        mlflow.sklearn.log_model(
+            sk_model=trained_pipeline,
+            artifact_path="property-price-predictor",
+            registered_model_name=settings.MODEL_NAME,
+            pip_requirements=["scikit-learn"],
+        )
+    source_uri = f"models:/{settings.MODEL_NAME}/1"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "compress.py",
+            "--experiment-name",
+            "compress-test",
+            "--model-uri",
+            source_uri,
+            "--dataset",
+            "synthetic:400",
+            "--dataset-cache-dir",
+            str(tmp_path / "datasets"),
+            "--max-trees",
+            "3",
+            "--max-depth",
+            "4",
+        ],
+    )
+
+    main()
+
+    version = mlflow.MlflowClient().get_model_version(settings.MODEL_NAME, "2")
+    assert version.tags["variant"] == "compressed"
+    assert version.tags["source_model_uri"] == source_uri
+    model = mlflow.pyfunc.load_model(f"models:/{settings.MODEL_NAME}/2")
+    packaged = _unwrap_packaged_forest(model)
+    assert packaged is not None
+    assert packaged.n_trees <= 3
+    assert packaged.max_depth <= 4
@@ -0,0 +1,112 @@
+"""
+Testes para o cache local de datasets de treino.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from scripts import dataset
+from scripts.dataset import load_dataset, synthetic_dataset
+
+
+def _memmap_base(array: np.ndarray) -> np.ndarray | None:
+    """
+    Percorre as bases de uma view NumPy até encontrar um memmap.
+
+    Args:
+        array: Array possivelmente derivado de um memmap.
+
+    Returns:
+        np.ndarray | None: O memmap de origem, ou None.
+    """
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array
+
+
+def test_load_dataset_materializes_once_and_memory_maps(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Testa que a segunda carga lê o cache via memory-map, sem a fonte original.
+    """
+    features, target, info = load_dataset("synthetic:300", tmp_path)
+
+    def fail() -> None:
+        raise AssertionError("a fonte original não deveria ser lida")
+
+    monkeypatch.setattr(dataset, "synthetic_dataset", fail)
+    cached_features, cached_target, cached_info = load_dataset(
+        "synthetic:300", tmp_path
+    )
+
+    expected_features, expected_target = synthetic_dataset(300)
+    assert cached_info == info
+    assert info.rows == 300
+    assert list(cached_features.columns) == settings.FEATURE_ORDER
+    np.testing.assert_array_equal(cached_features, expected_features)
+    np.testing.assert_array_equal(cached_target, expected_target)
+    assert _memmap_base(cached_features.to_numpy()) is not None
+
+
+def test_load_dataset_hash_tracks_content(tmp_path: Path) -> None:
+    """
+    Testa que o hash é estável para o mesmo conteúdo e muda com ele.
+    """
+    *_, first = load_dataset("synthetic:200", tmp_path / "a")
+    *_, second = load_dataset("synthetic:200", tmp_path / "b")
+    *_, other = load_dataset("synthetic:201", tmp_path / "a")
+
+    assert first.content_hash == second.content_hash
+    assert first.content_hash != other.content_hash
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv"])
+def test_load_dataset_reads_local_files(tmp_path: Path, suffix: str) -> None:
+    """
+    Testa a carga de arquivos locais, com colunas extras e fora de ordem.
+    """
+    features, target = synthetic_dataset(150, random_state=4)
+    frame = features.assign(price=target.to_numpy(), extra="x")
+    frame = frame[list(reversed(frame.columns))]
+    path = tmp_path / f"imoveis{suffix}"
+    if suffix == ".csv":
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_parquet(path)
+
+    loaded_features, loaded_target, info = load_dataset(
+        str(path), tmp_path / "cache", target_column="price"
+    )
+
+    assert info.name == "imoveis"
+    assert info.source == str(path.resolve())
+    np.testing.assert_allclose(loaded_features, features)
+    np.testing.assert_allclose(loaded_target, target)
+
+
+def test_load_dataset_refreshes_when_file_changes(tmp_path: Path) -> None:
+    """
+    Testa que alterar o arquivo local gera uma nova materialização.
+    """
+    features, target = synthetic_dataset(50)
+    path = tmp_path / "imoveis.parquet"
+    features.assign(MedHouseVal=target).to_parquet(path)
+    *_, before = load_dataset(str(path), tmp_path / "cache")
+
+    features.assign(MedHouseVal=target + 1).to_parquet(path)
+    _, loaded_target, after = load_dataset(str(path), tmp_path / "cache")
+
+    assert after.content_hash != before.content_hash
+    np.testing.assert_allclose(loaded_target, target + 1)
+
+
+def test_load_dataset_rejects_unknown_source(tmp_path: Path) -> None:
+    """
+    Testa o erro para fontes que não existem.
+    """
+    with pytest.raises(FileNotFoundError):
+        load_dataset(str(tmp_path / "ausente.csv"), tmp_path)
@@ -0,0 +1,178 @@
+"""
+Testes para o motor de inferência compilado.
+"""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+
+from app.config import settings
+from app.services.forest import (
+    CompiledForest,
+    ForestExplainer,
+    build_parity_rows,
+    check_parity,
+    compile_pipeline,
+    is_exported_forest,
+    prediction_intervals,
+)
+from scripts.train import build_pipeline
+from tests.conftest import build_synthetic_features
+
+
+def test_compiled_forest_matches_pipeline(trained_pipeline: Pipeline) -> None:
+    """
+    Testa que a floresta compilada reproduz as predições do pipeline.
+    """
+    forest = compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+    features = build_synthetic_features(200, random_state=1)
+
+    expected = trained_pipeline.predict(features)
+    result = forest.predict(features.to_numpy())
+
+    assert forest.n_trees == 10
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize(
+    ("with_mean", "with_std"), [(False, True), (True, False), (False, False)]
+)
+def test_compiled_forest_matches_partial_scaler(
+    with_mean: bool, with_std: bool
+) -> None:
+    """
+    Testa a paridade com StandardScaler sem centralização ou sem escala.
+    """
+    features = build_synthetic_features(300, random_state=2)
+    target = 0.4 * features["MedInc"] - 0.1 * (features["Latitude"] - 36.0)
+    pipeline = build_pipeline(n_estimators=5, max_depth=6, random_state=0)
+    pipeline.set_params(scaler__with_mean=with_mean, scaler__with_std=with_std)
+    pipeline.fit(features, target)
+    rows = build_synthetic_features(200, random_state=3)
+
+    forest = compile_pipeline(pipeline, settings.FEATURE_ORDER)
+
+    np.testing.assert_allclose(
+        forest.predict(rows.to_numpy()), pipeline.predict(rows), rtol=0, atol=1e-9
+    )
+
+
+def test_compiled_forest_per_tree_shape(trained_pipeline: Pipeline) -> None:
+    """
+    Testa que as predições por árvore possuem formato (linhas, árvores).
+    """
+    forest = compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+    rows = build_parity_rows(forest, n_rows=7)
+
+    per_tree = forest.predict_per_tree(rows)
+
+    assert per_tree.shape == (7, forest.n_trees)
+    np.testing.assert_allclose(per_tree.mean(axis=1), forest.predict(rows))
+
+
+def test_prediction_intervals_match_sklearn_trees(trained_pipeline: Pipeline) -> None:
+    """
+    Testa os intervalos contra as predições de cada árvore do Scikit-learn.
+    """
+    forest = compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+    features = build_synthetic_features(20, random_state=3)
+    scaled = trained_pipeline[:-1].transform(features)
+    expected = np.column_stack(
+        [tree.predict(scaled) for tree in trained_pipeline[-1].estimators_]
+    )
+
+    per_tree = forest.predict_per_tree(features.to_numpy())
+    quantile = prediction_intervals(per_tree, "quantile", 0.8)
+    std = prediction_intervals(per_tree, "std", 0.95)
+
+    np.testing.assert_allclose(quantile[:, 0], trained_pipeline.predict(features))
+    np.testing.assert_allclose(
+        quantile[:, 1:], np.quantile(expected, [0.1, 0.9], axis=1).T
+    )
+    np.testing.assert_allclose(
+        std[:, 2] - std[:, 0], 1.959964 * expected.std(axis=1), rtol=1e-6
+    )
+    assert np.all(std[:, 1] <= std[:, 0])
+    with pytest.raises(ValueError):
+        prediction_intervals(per_tree, "bootstrap", 0.9)
+    with pytest.raises(ValueError):
+        prediction_intervals(per_tree, "std", 1.0)
+
+
+def test_forest_explainer_matches_per_tree_paths(trained_pipeline: Pipeline) -> None:
+    """
+    Testa a decomposição vetorizada contra uma travessia árvore a árvore.
+    """
+    forest = compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+    rows = build_parity_rows(forest, n_rows=5)
+    explainer = ForestExplainer.from_forest(forest)
+
+    results = explainer.explain(rows)
+
+    expected = np.zeros((len(rows), forest.n_features))
+    for row, features in enumerate(rows):
+        for root in forest.roots:
+            node = root
+            while forest.children[node, 0] != node:
+                column = forest.feature[node]
+                go_right = int(features[column] > forest.threshold[node])
+                child = forest.children[node, go_right]
+                expected[row, column] += forest.value[child] - forest.value[node]
+                node = child
+    expected /= forest.n_trees
+    np.testing.assert_allclose(results[:, 0], forest.predict(rows))
+    np.testing.assert_allclose(results[:, 1], forest.value[forest.roots].mean())
+    np.testing.assert_allclose(results[:, 2:], expected, atol=1e-12)
+
+
+def test_compiled_forest_remaps_feature_order(trained_pipeline: Pipeline) -> None:
+    """
+    Testa que a ordem das colunas de entrada pode diferir da ordem de treino.
+    """
+    reversed_order = list(reversed(settings.FEATURE_ORDER))
+    forest = compile_pipeline(trained_pipeline, reversed_order)
+    features = build_synthetic_features(50, random_state=2)
+
+    result = forest.predict(features[reversed_order].to_numpy())
+
+    np.testing.assert_allclose(result, trained_pipeline.predict(features), atol=1e-9)
+
+
+def test_compile_pipeline_rejects_unsupported_estimator() -> None:
+    """
+    Testa que estimadores que não são árvores são rejeitados.
+    """
+    features = build_synthetic_features(20)
+    model = LinearRegression().fit(features, features["MedInc"])
+
+    with pytest.raises(ValueError, match="não suportado"):
+        compile_pipeline(model)
+
+
+def test_check_parity_detects_divergence(trained_pipeline: Pipeline) -> None:
+    """
+    Testa que a verificação de paridade falha quando as predições divergem.
+    """
+    forest = compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+
+    with pytest.raises(ValueError, match="diverge"):
+        check_parity(forest, lambda rows: forest.predict(rows) + 1.0)
+
+
+def test_compiled_forest_save_and_mmap_load(
+    trained_pipeline: Pipeline, tmp_path
+) -> None:
+    """
+    Testa que a floresta exportada é recarregada via mmap com as mesmas predições.
+    """
+    forest = compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+    rows = build_parity_rows(forest, n_rows=32)
+
+    path = forest.save(tmp_path / "forest")
+    loaded = CompiledForest.load(path)
+
+    assert is_exported_forest(path)
+    assert isinstance(loaded.threshold, np.memmap)
+    assert not loaded.threshold.flags.writeable
+    np.testing.assert_array_equal(loaded.predict(rows), forest.predict(rows))
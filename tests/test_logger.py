@@ -0,0 +1,64 @@
+"""
+Testes para a configuração de log da aplicação.
+"""
+
+import logging
+import queue
+
+from utils.logger import (
+    SAMPLED,
+    BoundedQueueHandler,
+    RequestSamplingFilter,
+    get_logger,
+)
+
+
+def _make_record(level: int, sampled: bool) -> logging.LogRecord:
+    """
+    Cria um registro de log para os testes.
+
+    Args:
+        level: Nível do registro.
+        sampled: Se o registro é um log de requisição.
+
+    Returns:
+        logging.LogRecord: Registro de log.
+    """
+    record = logging.LogRecord("test", level, __file__, 1, "mensagem", None, None)
+    if sampled:
+        record.__dict__.update(SAMPLED)
+    return record
+
+
+def test_get_logger_shares_handlers_between_modules() -> None:
+    """
+    Testa que loggers de módulos diferentes usam os mesmos handlers.
+    """
+    first = get_logger("tests.logger.first")
+    second = get_logger("tests.logger.second")
+
+    assert first.handlers == second.handlers
+
+
+def test_bounded_queue_handler_drops_when_full() -> None:
+    """
+    Testa que a política drop descarta registros sem bloquear com a fila cheia.
+    """
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2), policy="drop")
+
+    for _ in range(5):
+        handler.emit(_make_record(logging.INFO, sampled=False))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_request_sampling_filter_keeps_warnings_and_unmarked_logs() -> None:
+    """
+    Testa que a amostragem só descarta logs de requisição abaixo de WARNING.
+    """
+    sampling_filter = RequestSamplingFilter(rate=0.0)
+
+    assert not sampling_filter.filter(_make_record(logging.INFO, sampled=True))
+    assert sampling_filter.filter(_make_record(logging.INFO, sampled=False))
+    assert sampling_filter.filter(_make_record(logging.WARNING, sampled=True))
@@ -0,0 +1,57 @@
+"""
+Testes para o registro de métricas.
+"""
+
+import math
+
+from app.services.metrics import Counter, Histogram
+
+
+def test_histogram_estimates_quantiles_within_bucket() -> None:
+    """
+    Testa que os quantis são estimados dentro do bucket correto.
+    """
+    histogram = Histogram("latency_seconds", "Latência.", (0.001, 0.01, 0.1))
+    series = histogram.labels(stage="predict")
+
+    for _ in range(90):
+        series.observe(0.0005)
+    for _ in range(10):
+        series.observe(0.05)
+
+    assert series.quantile(0.5) <= 0.001
+    assert 0.01 < series.quantile(0.99) <= 0.1
+    assert math.isnan(histogram.labels(stage="vazio").quantile(0.5))
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    """
+    Testa o formato texto do Prometheus com buckets cumulativos.
+    """
+    histogram = Histogram("batch_size", "Tamanho do lote.", (1.0, 8.0))
+    series = histogram.labels()
+    for value in (1, 4, 100):
+        series.observe(value)
+
+    lines = histogram.render()
+
+    assert "# TYPE batch_size histogram" in lines
+    assert 'batch_size_bucket{le="1.0"} 1' in lines
+    assert 'batch_size_bucket{le="8.0"} 2' in lines
+    assert 'batch_size_bucket{le="+Inf"} 3' in lines
+    assert "batch_size_count 3" in lines
+    assert "batch_size_sum 105.0" in lines
+
+
+def test_counter_accumulates_per_label_set() -> None:
+    """
+    Testa que o contador separa séries por labels.
+    """
+    counter = Counter("requests_total", "Requisições.")
+
+    counter.inc(route="/a", status="200")
+    counter.inc(route="/a", status="200")
+    counter.inc(route="/a", status="500")
+
+    assert counter.value(route="/a", status="200") == 2
+    assert 'requests_total{route="/a",status="500"} 1.0' in counter.render()
@@ -4,15 +4,35 @@ Testes para o modelo de Machine Learning e serviços relacionados.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import warnings
 from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
 
 from app.config import settings
 from app.schemas.prediction import PredictionInput, PredictionOutput
-from app.services.predictor import PredictorService, reset_predictor_service_cache
+from app.services.cache import (
+    InMemoryCacheBackend,
+    PredictionCache,
+    SQLiteCacheBackend,
+)
+from app.services.executor import InferenceExecutor
+from app.services.forest import compile_pipeline
+from app.services.predictor import (
+    MicroBatcher,
+    PredictorService,
+    reset_predictor_service_cache,
+)
+from app.services.reloader import ModelReloader, start_model_reloader
+from tests.conftest import build_synthetic_features
 
 
 def _build_valid_input() -> dict[str, float]:
@@ -42,11 +62,12 @@ def mlflow_model_mock() -> Generator[MagicMock, None, None]:
     Yields:
         MagicMock: Mock do modelo carregado.
     """
-    with patch("app.services.predictor.mlflow.set_tracking_uri") as set_uri_mock, patch(
-        "app.services.predictor.mlflow.pyfunc.load_model"
-    ) as load_model_mock:
+    with patch("mlflow.set_tracking_uri") as set_uri_mock, patch(
+        "mlflow.pyfunc.load_model"
+    ) as load_model_mock, patch("mlflow.MlflowClient") as client_mock:
         model_mock = MagicMock()
         load_model_mock.return_value = model_mock
+        client_mock.return_value.get_model_version_by_alias.return_value.version = "1"
         yield model_mock
         set_uri_mock.assert_called_once_with(settings.MLFLOW_TRACKING_URI)
         load_model_mock.assert_called_once_with(
@@ -97,6 +118,26 @@ def test_predictor_service_initialization(mlflow_model_mock: MagicMock) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("run_id", "expected"), [("abc123", "run:abc123"), (None, "unknown")]
+)
+def test_predictor_service_version_falls_back_to_run_id(
+    mlflow_model_mock: MagicMock, run_id: str | None, expected: str
+) -> None:
+    """
+    Testa a versão reportada quando o alias não pode ser resolvido no registry.
+    """
+    mlflow_model_mock.metadata.run_id = run_id
+
+    with patch(
+        "app.services.predictor.resolve_registry_version",
+        side_effect=RuntimeError("registry indisponível"),
+    ):
+        service = PredictorService()
+
+    assert service.model_version == expected
+
+
 def test_predictor_service_predict(mlflow_model_mock: MagicMock) -> None:
     """
     Testa que o serviço de predição retorna valores esperados.
@@ -128,3 +169,554 @@ def test_predictor_service_predict_without_model(mlflow_model_mock: MagicMock) -
     with pytest.raises(ValueError, match="Modelo não foi carregado corretamente"):
         service.predict(input_data)
 
+
+
+def test_predictor_service_predict_batch(mlflow_model_mock: MagicMock) -> None:
+    """
+    Testa que o lote é predito com uma única chamada ao modelo e mantém a ordem.
+    """
+    mlflow_model_mock.predict.return_value = [1.0, 2.0, 3.0]
+
+    service = PredictorService()
+    rows = []
+    for offset in range(3):
+        row = _build_valid_input()
+        row["MedInc"] += offset
+        rows.append(PredictionInput(**row))
+
+    results = service.predict_batch(rows)
+
+    assert [result.predicted_value for result in results] == [1.0, 2.0, 3.0]
+    mlflow_model_mock.predict.assert_called_once()
+    called_df: pd.DataFrame = mlflow_model_mock.predict.call_args.args[0]
+    assert list(called_df.columns) == settings.FEATURE_ORDER
+    assert called_df["MedInc"].tolist() == [row.MedInc for row in rows]
+
+
+def test_micro_batcher_groups_concurrent_requests() -> None:
+    """
+    Testa que solicitações concorrentes são resolvidas por um único lote.
+    """
+    service_mock = MagicMock(spec=PredictorService)
+    service_mock.predict_batch.side_effect = lambda inputs: [
+        PredictionOutput(predicted_value=item.MedInc) for item in inputs
+    ]
+    batcher = MicroBatcher(service_mock, max_batch_size=8, max_wait_ms=50)
+
+    async def run() -> list[PredictionOutput]:
+        inputs = []
+        for offset in range(5):
+            row = _build_valid_input()
+            row["MedInc"] = float(offset)
+            inputs.append(PredictionInput(**row))
+        results = await asyncio.gather(*(batcher.submit(item) for item in inputs))
+        await batcher.close()
+        return results
+
+    results = asyncio.run(run())
+
+    assert [result.predicted_value for result in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    service_mock.predict_batch.assert_called_once()
+    assert batcher.stats.batches == 1
+    assert batcher.stats.max_batch_size == 5
+
+
+def test_micro_batcher_propagates_errors() -> None:
+    """
+    Testa que uma falha do lote é repassada a todos os chamadores.
+    """
+    service_mock = MagicMock(spec=PredictorService)
+    service_mock.predict_batch.side_effect = ValueError("falha no modelo")
+    batcher = MicroBatcher(service_mock, max_batch_size=2, max_wait_ms=1)
+
+    async def run() -> None:
+        try:
+            await batcher.submit(PredictionInput(**_build_valid_input()))
+        finally:
+            await batcher.close()
+
+    with pytest.raises(ValueError, match="falha no modelo"):
+        asyncio.run(run())
+
+
+def test_micro_batcher_close_fails_batch_being_collected() -> None:
+    """
+    Testa que fechar o batcher durante a coleta falha as solicitações do lote.
+    """
+    service_mock = MagicMock(spec=PredictorService)
+    batcher = MicroBatcher(service_mock, max_batch_size=8, max_wait_ms=10_000)
+
+    async def run() -> None:
+        pending = asyncio.ensure_future(
+            batcher.submit(PredictionInput(**_build_valid_input()))
+        )
+        # Deixa o worker retirar a solicitação da fila e aguardar o lote encher
+        while batcher._queue is None or not batcher._queue.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await asyncio.wait_for(batcher.close(), timeout=1)
+        await asyncio.wait_for(pending, timeout=1)
+
+    with pytest.raises(RuntimeError, match="Micro-batcher encerrado"):
+        asyncio.run(run())
+    service_mock.predict_batch.assert_not_called()
+
+
+def test_inference_executor_runs_off_event_loop_thread() -> None:
+    """
+    Testa que o modo thread executa a inferência fora da thread do event loop.
+    """
+    service_mock = MagicMock(spec=PredictorService)
+    service_mock.predict.side_effect = lambda _: threading.current_thread().name
+    executor = InferenceExecutor(mode="thread", max_workers=2)
+
+    async def run() -> tuple[str, str]:
+        worker_thread = await executor.run(service_mock, "predict", None)
+        return worker_thread, threading.current_thread().name
+
+    try:
+        worker_thread, loop_thread = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert worker_thread != loop_thread
+    assert worker_thread.startswith("inference")
+
+
+def test_inference_executor_rejects_unknown_mode() -> None:
+    """
+    Testa que modos de execução desconhecidos são rejeitados.
+    """
+    with pytest.raises(ValueError, match="Modo de executor inválido"):
+        InferenceExecutor(mode="gpu", max_workers=1)
+
+
+def test_inference_executor_runs_once_in_each_process_worker(
+    trained_pipeline: Pipeline,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que o modo process aquece cada processo do pool exatamente uma vez.
+    """
+    import mlflow
+    import mlflow.sklearn
+
+    previous_uri = mlflow.get_tracking_uri()
+    uri = (tmp_path / "mlruns").as_uri()
+    # Os processos do pool herdam o tracking URI pelo ambiente
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", uri)
+    mlflow.set_tracking_uri(uri)
+    executor = InferenceExecutor(mode="process", max_workers=2)
+    inputs = [PredictionInput(**_build_valid_input())]
+
+    async def run() -> list[None]:
+        return await asyncio.wait_for(
+            executor.run_on_each_worker(None, "warm_up", inputs), timeout=120
+        )
+
+    try:
+        with mlflow.start_run():
+            mlflow.sklearn.log_model(
+                sk_model=trained_pipeline,
+                artifact_path="property-price-predictor",
+                registered_model_name=settings.MODEL_NAME,
+                pip_requirements=["scikit-learn"],
+            )
+        mlflow.MlflowClient().set_registered_model_alias(
+            settings.MODEL_NAME, settings.MODEL_STAGE, "1"
+        )
+        results = asyncio.run(run())
+        processes = len(executor._pool._processes)
+    finally:
+        executor.shutdown()
+        mlflow.set_tracking_uri(previous_uri)
+
+    assert results == [None, None]
+    assert processes == 2
+
+
+def test_predictor_service_compiled_backend(
+    mlflow_model_mock: MagicMock,
+    trained_pipeline: Pipeline,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que o backend compilado é usado quando habilitado e em paridade.
+    """
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "compiled")
+    mlflow_model_mock.get_raw_model.return_value = trained_pipeline
+    mlflow_model_mock.predict.side_effect = trained_pipeline.predict
+
+    service = PredictorService()
+    mlflow_model_mock.predict.reset_mock()
+    input_data = PredictionInput(**_build_valid_input())
+
+    result = service.predict(input_data)
+
+    assert service.forest is not None
+    expected = trained_pipeline.predict(
+        pd.DataFrame([_build_valid_input()], columns=settings.FEATURE_ORDER)
+    )
+    np.testing.assert_allclose(result.predicted_value, expected[0])
+    mlflow_model_mock.predict.assert_not_called()
+
+
+def test_predictor_service_compiled_backend_falls_back_on_divergence(
+    mlflow_model_mock: MagicMock,
+    trained_pipeline: Pipeline,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que o serviço mantém o pyfunc quando a paridade falha.
+    """
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "compiled")
+    mlflow_model_mock.get_raw_model.return_value = trained_pipeline
+    mlflow_model_mock.predict.side_effect = lambda df: trained_pipeline.predict(df) + 1
+
+    service = PredictorService()
+
+    assert service.forest is None
+
+
+def test_predictor_service_shared_mode_maps_exported_forest(
+    trained_pipeline: Pipeline,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    """
+    Testa que, no modo compartilhado, o worker mapeia a floresta sem o pyfunc.
+    """
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "compiled")
+    monkeypatch.setattr(settings, "SHARED_MODEL_DIR", str(tmp_path))
+    forest = compile_pipeline(trained_pipeline, settings.FEATURE_ORDER)
+    forest.save(tmp_path / settings.MODEL_NAME / "1")
+
+    with patch("mlflow.set_tracking_uri"), patch(
+        "mlflow.pyfunc.load_model"
+    ) as load_model_mock, patch("mlflow.MlflowClient") as client_mock:
+        client_mock.return_value.get_model_version_by_alias.return_value.version = "1"
+        service = PredictorService()
+
+    result = service.predict(PredictionInput(**_build_valid_input()))
+
+    load_model_mock.assert_not_called()
+    assert service.model is None
+    assert service.model_version == "1"
+    assert isinstance(service.forest.threshold, np.memmap)
+    expected = trained_pipeline.predict(
+        pd.DataFrame([_build_valid_input()], columns=settings.FEATURE_ORDER)
+    )
+    np.testing.assert_allclose(result.predicted_value, expected[0])
+
+
+def test_predictor_service_fast_path_skips_pandas(
+    mlflow_model_mock: MagicMock,
+    trained_pipeline: Pipeline,
+) -> None:
+    """
+    Testa que o caminho rápido envia um array NumPy direto ao Scikit-learn, sem
+    avisos de nomes de features e sem alterar os filtros globais de avisos.
+    """
+    mlflow_model_mock.get_raw_model.return_value = trained_pipeline
+    filters = list(warnings.filters)
+
+    service = PredictorService()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        result = service.predict(PredictionInput(**_build_valid_input()))
+
+    assert not [item for item in caught if "feature names" in str(item.message)]
+    assert warnings.filters == filters
+    fast_model = service.sklearn_model
+    assert not hasattr(fast_model, "feature_names_in_")
+    assert list(trained_pipeline.feature_names_in_) == settings.FEATURE_ORDER
+    assert fast_model[-1].estimators_ is trained_pipeline[-1].estimators_
+    expected = trained_pipeline.predict(
+        pd.DataFrame([_build_valid_input()], columns=settings.FEATURE_ORDER)
+    )
+    np.testing.assert_allclose(result.predicted_value, expected[0])
+    mlflow_model_mock.predict.assert_not_called()
+
+
+def test_predictor_service_fast_path_disabled(
+    mlflow_model_mock: MagicMock,
+    trained_pipeline: Pipeline,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que o caminho via DataFrame é mantido quando o atalho é desabilitado.
+    """
+    monkeypatch.setattr(settings, "INPUT_FAST_PATH_ENABLED", False)
+    mlflow_model_mock.get_raw_model.return_value = trained_pipeline
+    mlflow_model_mock.predict.return_value = [1.0]
+
+    service = PredictorService()
+    service.predict(PredictionInput(**_build_valid_input()))
+
+    assert service.sklearn_model is None
+    mlflow_model_mock.predict.assert_called_once()
+
+
+def test_predictor_service_fast_path_requires_feature_order(
+    mlflow_model_mock: MagicMock,
+    trained_pipeline: Pipeline,
+) -> None:
+    """
+    Testa que o caminho rápido é desabilitado se o modelo usa outra ordem de
+    colunas, já que o array não carrega os nomes.
+    """
+    features = build_synthetic_features(100)[settings.FEATURE_ORDER[::-1]]
+    pipeline = clone(trained_pipeline).fit(features, features["MedInc"])
+    mlflow_model_mock.get_raw_model.return_value = pipeline
+
+    service = PredictorService()
+
+    assert service.sklearn_model is None
+
+
+def test_predictor_service_uses_prediction_cache(mlflow_model_mock: MagicMock) -> None:
+    """
+    Testa que predições repetidas são atendidas pelo cache da versão ativa.
+    """
+    mlflow_model_mock.predict.return_value = [2.5]
+    service = PredictorService()
+    service.cache = PredictionCache(InMemoryCacheBackend(max_size=10, ttl_seconds=0))
+    input_data = PredictionInput(**_build_valid_input())
+
+    first = service.predict(input_data)
+    second = service.predict(input_data)
+    batch = service.predict_batch([input_data])
+
+    assert first.predicted_value == second.predicted_value == 2.5
+    assert batch[0].predicted_value == 2.5
+    mlflow_model_mock.predict.assert_called_once()
+    assert service.cache.snapshot()["hits"] == 2
+
+    service.model_version = "2"
+    service.predict(input_data)
+    assert mlflow_model_mock.predict.call_count == 2
+
+
+def test_predictor_service_intervals_compile_forest_on_demand(
+    mlflow_model_mock: MagicMock, trained_pipeline: Pipeline
+) -> None:
+    """
+    Testa que intervalos compilam a floresta apenas quando solicitados e usam
+    o cache em um namespace próprio.
+    """
+    mlflow_model_mock.get_raw_model.return_value = trained_pipeline
+    service = PredictorService()
+    service.cache = PredictionCache(InMemoryCacheBackend(max_size=10, ttl_seconds=0))
+    input_data = PredictionInput(**_build_valid_input())
+    matrix = np.array([list(_build_valid_input().values())])
+
+    value = service.predict(input_data).predicted_value
+    assert "tree_forest" not in vars(service._active)
+
+    first = service.predict_intervals(matrix, "quantile", 0.9)
+    second = service.predict_intervals(matrix, "quantile", 0.9)
+
+    assert first.shape == (1, 3)
+    np.testing.assert_allclose(first[0, 0], value)
+    assert first[0, 1] <= value <= first[0, 2]
+    np.testing.assert_array_equal(first, second)
+    assert service.cache.snapshot()["hits"] == 1
+
+
+def test_predictor_service_intervals_require_tree_model(
+    mlflow_model_mock: MagicMock,
+) -> None:
+    """
+    Testa que intervalos são recusados quando o modelo não expõe as árvores.
+    """
+    service = PredictorService()
+
+    with pytest.raises(NotImplementedError):
+        service.predict_intervals(np.ones((1, 8)), "std", 0.9)
+
+
+def test_predictor_service_explains_with_precomputed_paths(
+    mlflow_model_mock: MagicMock,
+    trained_pipeline: Pipeline,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que o explicador é pré-calculado no carregamento, quando habilitado,
+    e que as contribuições somam a predição.
+    """
+    monkeypatch.setattr(settings, "EXPLANATIONS_PRECOMPUTE", True)
+    mlflow_model_mock.get_raw_model.return_value = trained_pipeline
+    service = PredictorService()
+    assert "explainer" in vars(service._active)
+    features = pd.DataFrame(
+        [_build_valid_input(), {**_build_valid_input(), "MedInc": 1.5}],
+        columns=settings.FEATURE_ORDER,
+    )
+
+    results = service.explain_matrix(features.to_numpy())
+
+    assert results.shape == (2, 2 + len(settings.FEATURE_ORDER))
+    np.testing.assert_allclose(results[:, 0], trained_pipeline.predict(features))
+    totals = results[:, 1] + results[:, 2:].sum(axis=1)
+    np.testing.assert_allclose(totals, results[:, 0])
+
+
+def test_predictor_service_explainer_built_on_first_explanation(
+    mlflow_model_mock: MagicMock, trained_pipeline: Pipeline
+) -> None:
+    """
+    Testa que, por padrão, o carregamento não compila a floresta nem o
+    explicador, que são criados na primeira explicação.
+    """
+    mlflow_model_mock.get_raw_model.return_value = trained_pipeline
+    service = PredictorService()
+
+    assert "tree_forest" not in vars(service._active)
+    assert "explainer" not in vars(service._active)
+    results = service.explain_matrix(np.ones((1, len(settings.FEATURE_ORDER))))
+
+    assert "explainer" in vars(service._active)
+    assert results.shape == (1, 2 + len(settings.FEATURE_ORDER))
+
+
+def test_predictor_service_explain_requires_tree_model(
+    mlflow_model_mock: MagicMock,
+) -> None:
+    """
+    Testa que explicações são recusadas quando o modelo não expõe as árvores.
+    """
+    service = PredictorService()
+
+    with pytest.raises(NotImplementedError):
+        service.explain_matrix(np.ones((1, len(settings.FEATURE_ORDER))))
+
+
+def test_predictor_service_predict_matrix_can_skip_cache(
+    mlflow_model_mock: MagicMock,
+) -> None:
+    """
+    Testa que linhas sintéticas podem ser preditas sem passar pelo cache.
+    """
+    mlflow_model_mock.predict.return_value = [1.0, 2.0]
+    service = PredictorService()
+    service.cache = PredictionCache(InMemoryCacheBackend(max_size=10, ttl_seconds=0))
+
+    values = service.predict_matrix(np.ones((2, 8)), use_cache=False)
+
+    np.testing.assert_array_equal(values, [1.0, 2.0])
+    assert len(service.cache.backend) == 0
+    assert service.cache.snapshot()["misses"] == 0
+
+
+def test_in_memory_cache_backend_evicts_lru_and_expired() -> None:
+    """
+    Testa a evicção por LRU e por TTL do cache em memória.
+    """
+    backend = InMemoryCacheBackend(max_size=2, ttl_seconds=0)
+    backend.set("a", 1.0)
+    backend.set("b", 2.0)
+    backend.get("a")
+    backend.set("c", 3.0)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1.0
+    assert backend.stats.evictions == 1
+
+    expiring = InMemoryCacheBackend(max_size=2, ttl_seconds=-1)
+    expiring.set("a", 1.0)
+    assert expiring.get("a") is None
+    assert expiring.stats.evictions == 1
+
+
+def test_prediction_cache_quantizes_keys(tmp_path) -> None:
+    """
+    Testa que a quantização agrupa entradas próximas na mesma chave.
+    """
+    cache = PredictionCache(
+        SQLiteCacheBackend(tmp_path / "cache.sqlite3", max_size=10, ttl_seconds=60),
+        quantization_decimals=2,
+    )
+    original = PredictionInput(**_build_valid_input())
+    nearby = original.model_copy(update={"MedInc": original.MedInc + 0.0001})
+
+    cache.set("predict", "1", original, 4.2)
+
+    assert cache.get("predict", "1", nearby) == 4.2
+    assert cache.get("predict", "2", nearby) is None
+    assert cache.snapshot() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_predictor_service_reload_swaps_after_in_flight_prediction() -> None:
+    """
+    Testa que a troca de versão não interrompe predições em andamento.
+    """
+    old_model, new_model = MagicMock(), MagicMock()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_predict(_: pd.DataFrame) -> list[float]:
+        started.set()
+        release.wait(timeout=5)
+        return [1.0]
+
+    old_model.predict.side_effect = slow_predict
+    new_model.predict.return_value = [2.0]
+
+    with patch("mlflow.set_tracking_uri"), patch(
+        "mlflow.pyfunc.load_model",
+        side_effect=[old_model, new_model],
+    ) as load_model_mock, patch("mlflow.MlflowClient") as client_mock:
+        client_mock.return_value.get_model_version_by_alias.return_value.version = "1"
+        service = PredictorService()
+        input_data = PredictionInput(**_build_valid_input())
+
+        results = {}
+        in_flight = threading.Thread(
+            target=lambda: results.update(old=service.predict(input_data))
+        )
+        in_flight.start()
+        assert started.wait(timeout=5)
+
+        assert service.reload("2") is True
+        release.set()
+        in_flight.join(timeout=5)
+
+        assert results["old"].predicted_value == 1.0
+        assert service.predict(input_data).predicted_value == 2.0
+        assert service.model_version == "2"
+        assert service.last_swap_at is not None
+        assert service.reload("2") is False
+        load_model_mock.assert_called_with(f"models:/{settings.MODEL_NAME}/2")
+
+
+def test_model_reloader_check_once_reloads_new_version() -> None:
+    """
+    Testa que o monitor repassa a versão resolvida ao serviço.
+    """
+    service_mock = MagicMock(spec=PredictorService)
+    service_mock.reload.return_value = True
+    reloader = ModelReloader(
+        lambda: service_mock, interval_seconds=60, version_resolver=lambda: "7"
+    )
+
+    assert reloader.check_once() is True
+    service_mock.reload.assert_called_once_with("7")
+
+    service_mock.reload.side_effect = RuntimeError("registry indisponível")
+    assert reloader.check_once() is False
+    assert reloader.last_error == "registry indisponível"
+
+
+def test_start_model_reloader_rejects_process_executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Testa que o monitor não é iniciado quando os workers não veriam a troca.
+    """
+    monkeypatch.setattr(settings, "MODEL_RELOAD_ENABLED", True)
+    monkeypatch.setattr(settings, "INFERENCE_EXECUTOR", "process")
+    service_provider = MagicMock()
+
+    with pytest.raises(ValueError, match="INFERENCE_EXECUTOR=process"):
+        start_model_reloader(service_provider)
+    service_provider.assert_not_called()
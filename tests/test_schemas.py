@@ -0,0 +1,101 @@
+"""
+Testes para a validação das entradas de predição.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.config import settings
+from app.schemas.prediction import (
+    PredictionInput,
+    format_validation_error,
+    validate_feature_matrix,
+    validate_records,
+)
+
+EXAMPLE = PredictionInput.model_config["json_schema_extra"]["example"]
+
+
+def _schema_error(record: object) -> str | None:
+    """
+    Valida um registro pelo schema, linha a linha.
+
+    Args:
+        record: Registro bruto.
+
+    Returns:
+        str | None: Mensagem de erro do schema, ou None se o registro for válido.
+    """
+    try:
+        PredictionInput.model_validate(record)
+    except ValidationError as error:
+        return format_validation_error(error)
+    return None
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"AveRooms": 0.0},
+        {"AveRooms": -1, "AveOccup": 0},
+        {"AveBedrms": -0.5, "Population": -1.0},
+        {"MedInc": math.nan},
+        {"HouseAge": math.inf, "AveRooms": -math.inf},
+        {"Population": 0, "AveBedrms": 0.0},
+    ],
+)
+def test_validate_records_matches_schema_for_numbers(changes: dict) -> None:
+    """
+    Testa que o caminho vetorizado reporta os mesmos erros do schema.
+    """
+    records = [EXAMPLE, {**EXAMPLE, **changes}]
+
+    _, errors = validate_records(records, settings.FEATURE_ORDER)
+
+    assert errors.get(1) == _schema_error(records[1])
+    assert 0 not in errors
+
+
+def test_validate_records_falls_back_to_schema_for_other_types() -> None:
+    """
+    Testa que tipos convertidos, campos ausentes e não objetos usam o schema.
+    """
+    missing_field = dict(EXAMPLE)
+    del missing_field["Latitude"]
+    records = [
+        {**EXAMPLE, "MedInc": "1.5"},
+        {**EXAMPLE, "MedInc": "abc", "AveRooms": -1.0},
+        {**EXAMPLE, "Population": None},
+        missing_field,
+        5,
+        {**EXAMPLE, "HouseAge": True},
+    ]
+
+    matrix, errors = validate_records(records, settings.FEATURE_ORDER)
+
+    assert errors == {
+        position: message
+        for position, record in enumerate(records)
+        if (message := _schema_error(record)) is not None
+    }
+    assert sorted(errors) == [1, 2, 3, 4]
+    assert matrix[0, 0] == 1.5
+    assert matrix[5, 1] == 1.0
+
+
+def test_validate_feature_matrix_reports_nulls() -> None:
+    """
+    Testa que valores ausentes recebem a mensagem de tipo do schema.
+    """
+    matrix = np.array([list(EXAMPLE.values())] * 2)
+    nulls = np.zeros_like(matrix, dtype=bool)
+    matrix[1, 2] = np.nan
+    nulls[1, 2] = True
+
+    errors = validate_feature_matrix(matrix, settings.FEATURE_ORDER, nulls)
+
+    assert errors == {1: "AveRooms: Input should be a valid number"}
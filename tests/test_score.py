@@ -0,0 +1,101 @@
+"""
+Testes para o script de escoragem em lote.
+"""
+
+from pathlib import Path
+
+import mlflow.sklearn
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+from sklearn.pipeline import Pipeline
+
+from app.config import settings
+from scripts.score import score_file
+from tests.conftest import build_synthetic_features
+
+
+@pytest.fixture(scope="module")
+def model_dir(
+    trained_pipeline: Pipeline, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """
+    Fixture que salva o pipeline sintético como modelo MLflow local.
+
+    Returns:
+        Path: Diretório do modelo salvo.
+    """
+    model_path = tmp_path_factory.mktemp("score") / "model"
+    # Requisitos explícitos evitam a inferência lenta feita pelo MLflow
+    mlflow.sklearn.save_model(
+        trained_pipeline, model_path, pip_requirements=["scikit-learn"]
+    )
+    return model_path
+
+
+@pytest.fixture()
+def saved_model_uri(model_dir: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """
+    Fixture que aponta o tracking URI para o diretório temporário.
+
+    Assim o carregamento do modelo não cria ``mlruns`` no repositório.
+
+    Returns:
+        str: URI do modelo salvo.
+    """
+    monkeypatch.setattr(
+        settings, "MLFLOW_TRACKING_URI", (model_dir.parent / "mlruns").as_uri()
+    )
+    return str(model_dir)
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv"])
+def test_score_file_preserves_row_order(
+    trained_pipeline: Pipeline, saved_model_uri: str, tmp_path: Path, suffix: str
+) -> None:
+    """
+    Testa que as partes escritas reproduzem as predições na ordem da entrada.
+    """
+    features = build_synthetic_features(250, random_state=3)
+    input_path = tmp_path / f"imoveis{suffix}"
+    # Colunas fora de ordem e extras não afetam a escoragem
+    shuffled = features[list(reversed(features.columns))].assign(extra="x")
+    if suffix == ".csv":
+        shuffled.to_csv(input_path, index=False)
+    else:
+        shuffled.to_parquet(input_path, row_group_size=70)
+
+    report = score_file(
+        input_path, tmp_path / "out", saved_model_uri, chunk_size=100, workers=1
+    )
+
+    result = pq.read_table(tmp_path / "out").to_pandas()
+    assert report.rows == report.scored_rows == 250
+    assert report.chunks == 3
+    np.testing.assert_array_equal(result["row_id"], np.arange(250))
+    np.testing.assert_allclose(
+        result["prediction"], trained_pipeline.predict(features)
+    )
+
+
+def test_score_file_resumes_missing_chunks(
+    saved_model_uri: str, tmp_path: Path
+) -> None:
+    """
+    Testa que uma nova execução escora apenas os pedaços sem parte escrita.
+    """
+    input_path = tmp_path / "imoveis.parquet"
+    build_synthetic_features(250).to_parquet(input_path)
+    output_dir = tmp_path / "out"
+    score_file(input_path, output_dir, saved_model_uri, chunk_size=100, workers=1)
+    (output_dir / "part-000001.parquet").unlink()
+
+    report = score_file(
+        input_path, output_dir, saved_model_uri, chunk_size=100, workers=1
+    )
+
+    assert report.skipped_chunks == 2
+    assert report.scored_rows == 100
+    assert pq.read_table(output_dir).num_rows == 250
+    with pytest.raises(ValueError, match="parâmetros diferentes"):
+        score_file(input_path, output_dir, saved_model_uri, chunk_size=50, workers=1)
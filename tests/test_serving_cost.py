@@ -0,0 +1,78 @@
+"""
+Testes para a medição do custo de serving e os orçamentos de registro.
+"""
+
+import pytest
+from sklearn.pipeline import Pipeline
+
+from scripts.serving_cost import (
+    ServingBudget,
+    ServingCost,
+    measure_serving_cost,
+    pareto_front,
+)
+from tests.conftest import build_synthetic_features
+
+
+def _cost(**overrides: float) -> ServingCost:
+    """
+    Monta um custo de serving com valores padrão.
+
+    Returns:
+        ServingCost: Custo com os campos sobrescritos.
+    """
+    values = {
+        "single_p50_ms": 1.0,
+        "single_p95_ms": 2.0,
+        "batch_ms": 10.0,
+        "batch_rows": 1000,
+        "model_size_mb": 5.0,
+        "model_memory_mb": 6.0,
+    }
+    return ServingCost(**{**values, **overrides})
+
+
+def test_measure_serving_cost(trained_pipeline: Pipeline) -> None:
+    """
+    Testa que todas as medidas são positivas e o lote respeita o tamanho.
+    """
+    features = build_synthetic_features(300, random_state=2)
+
+    cost = measure_serving_cost(
+        trained_pipeline, features, single_calls=5, batch_size=200
+    )
+
+    assert cost.batch_rows == 200
+    assert 0 < cost.single_p50_ms <= cost.single_p95_ms
+    assert cost.batch_ms > 0
+    assert cost.model_size_mb > 0
+    assert cost.model_memory_mb > 0
+
+
+def test_budget_violations() -> None:
+    """
+    Testa que apenas os limites configurados e ultrapassados são reportados.
+    """
+    budget = ServingBudget(max_single_latency_ms=1.5, max_model_size_mb=10.0)
+
+    assert budget.violations(_cost(single_p95_ms=1.0)) == []
+    violations = budget.violations(_cost(single_p95_ms=3.0, batch_ms=1e6))
+    assert len(violations) == 1
+    assert violations[0].startswith("latência unitária p95")
+    assert ServingBudget().violations(_cost(model_size_mb=1e6)) == []
+
+
+@pytest.mark.parametrize(
+    ("points", "expected"),
+    [
+        ([(0.5, 1.0), (0.4, 2.0), (0.45, 3.0), (0.3, 4.0)], [0, 1, 3]),
+        ([(0.2, 1.0), (0.3, 1.0), (0.1, 5.0), (0.1, 6.0)], [0, 2]),
+        ([(0.5, 1.0)], [0]),
+        ([(0.2, 1.0), (0.1, 2.0), (0.2, 1.0), (0.1, 2.0), (0.1, 3.0)], [0, 2, 1, 3]),
+    ],
+)
+def test_pareto_front(points: list[tuple[float, float]], expected: list[int]) -> None:
+    """
+    Testa que a fronteira mantém só os pontos não dominados.
+    """
+    assert pareto_front(points) == expected
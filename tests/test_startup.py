@@ -0,0 +1,93 @@
+"""
+Testes para o tempo de importação da aplicação.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Orçamento do ``import app.main``, em milissegundos. Medidas de tempo oscilam
+# em runners compartilhados, então o teste só roda com o orçamento definido.
+IMPORT_TIME_BUDGET_MS = os.getenv("IMPORT_TIME_BUDGET_MS")
+
+# Dependências carregadas só ao carregar o modelo ou usar um formato específico
+LAZY_MODULES = ("mlflow", "pandas", "pyarrow", "sklearn")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    """
+    Executa um interpretador Python novo na raiz do projeto.
+
+    Args:
+        *args: Argumentos do interpretador.
+
+    Returns:
+        subprocess.CompletedProcess: Processo finalizado, com a saída capturada.
+    """
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _import_times_ms(module: str) -> dict[str, float]:
+    """
+    Mede o tempo acumulado de importação de cada módulo via ``-X importtime``.
+
+    Args:
+        module: Módulo importado.
+
+    Returns:
+        dict[str, float]: Tempo acumulado por módulo, em milissegundos.
+    """
+    result = _run_python("-X", "importtime", "-c", f"import {module}")
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def test_app_import_does_not_load_heavy_dependencies() -> None:
+    """
+    Testa que importar a aplicação não carrega MLflow, pandas e afins.
+    """
+    code = (
+        "import json, sys, app.main; "
+        f"print(json.dumps([name for name in {LAZY_MODULES!r} "
+        "if name in sys.modules]))"
+    )
+
+    result = _run_python("-c", code)
+
+    assert json.loads(result.stdout.splitlines()[-1]) == []
+
+
+@pytest.mark.skipif(
+    IMPORT_TIME_BUDGET_MS is None, reason="IMPORT_TIME_BUDGET_MS não definido"
+)
+def test_app_import_time_within_budget() -> None:
+    """
+    Testa que o ``import app.main`` cabe no orçamento configurado.
+    """
+    budget_ms = float(IMPORT_TIME_BUDGET_MS)
+    # Primeira execução compila os .pyc, que não fazem parte do cold start
+    _run_python("-c", "import app.main")
+
+    import_time_ms = _import_times_ms("app.main")["app.main"]
+
+    assert import_time_ms <= budget_ms, (
+        f"import app.main levou {import_time_ms:.0f} ms "
+        f"(orçamento: {budget_ms:.0f} ms)"
+    )
@@ -0,0 +1,148 @@
+"""
+Testes para a busca de hiperparâmetros do script de treinamento.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import mlflow
+import pandas as pd
+import pytest
+
+from scripts.serving_cost import ServingBudget
+from scripts.train import build_candidates, run_search
+from tests.conftest import build_synthetic_features
+
+
+@pytest.fixture(scope="module")
+def search_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    """
+    Fixture com conjuntos sintéticos de treino e teste.
+
+    Returns:
+        tuple: Features e target de treino e teste.
+    """
+    features = build_synthetic_features(400, random_state=1)
+    target = 0.4 * features["MedInc"] - 0.1 * (features["Latitude"] - 36.0)
+    return features[:300], features[300:], target[:300], target[300:]
+
+
+@pytest.fixture()
+def tracking_uri(tmp_path: Path) -> Iterator[str]:
+    """
+    Fixture que aponta o MLflow para um diretório temporário.
+
+    Yields:
+        str: Tracking URI usado no teste.
+    """
+    uri = (tmp_path / "mlruns").as_uri()
+    mlflow.set_tracking_uri(uri)
+    yield uri
+    mlflow.set_tracking_uri(None)
+
+
+def test_build_candidates_grid_merges_base_params() -> None:
+    """
+    Testa a expansão da grade combinada com os hiperparâmetros base.
+    """
+    spec = {"grid": {"n_estimators": [5, 10], "max_depth": [2, 4, None]}}
+
+    candidates = build_candidates(spec, 0, base_params={"min_samples_leaf": 2})
+
+    assert len(candidates) == 6
+    assert all(params["min_samples_leaf"] == 2 for params in candidates)
+    assert {(params["n_estimators"], params["max_depth"]) for params in candidates} == {
+        (n, d) for n in (5, 10) for d in (2, 4, None)
+    }
+
+
+def test_build_candidates_random_is_reproducible() -> None:
+    """
+    Testa que a busca aleatória respeita a semente e as faixas.
+    """
+    spec = {
+        "random": {"n_estimators": {"low": 5, "high": 20}, "max_depth": [3, 6]},
+        "n_iter": 8,
+    }
+
+    candidates = build_candidates(spec, 7)
+
+    assert candidates == build_candidates(spec, 7)
+    assert len(candidates) == 8
+    assert all(type(params["n_estimators"]) is int for params in candidates)
+    assert all(5 <= params["n_estimators"] <= 20 for params in candidates)
+
+
+def test_build_candidates_rejects_unknown_param() -> None:
+    """
+    Testa que hiperparâmetros inexistentes falham antes da busca.
+    """
+    with pytest.raises(ValueError):
+        build_candidates({"grid": {"n_trees": [10]}}, 0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_search_logs_nested_runs_and_picks_best(
+    search_data: tuple, tracking_uri: str, workers: int
+) -> None:
+    """
+    Testa que cada candidato vira uma run aninhada e o melhor é escolhido.
+    """
+    candidates = build_candidates(
+        {"grid": {"max_depth": [1, 6]}}, 0, base_params={"n_estimators": 5}
+    )
+
+    with mlflow.start_run() as parent:
+        result = run_search(
+            candidates, search_data, workers=workers, metric="rmse", latency_calls=5
+        )
+
+    children = mlflow.search_runs(
+        filter_string=f"tags.mlflow.parentRunId = '{parent.info.run_id}'"
+    )
+    assert len(children) == 2
+    assert "metrics.single_p95_ms" in children
+    assert "metrics.model_size_mb" in children
+    assert [candidate.index for candidate in result.candidates] == [0, 1]
+    assert result.best.params["max_depth"] == 6
+    assert result.best.metrics["rmse"] == min(
+        candidate.metrics["rmse"] for candidate in result.candidates
+    )
+    assert result.best_pipeline.get_params()["regressor__n_jobs"] is None
+
+
+def test_run_search_respects_serving_budget(
+    search_data: tuple, tracking_uri: str
+) -> None:
+    """
+    Testa que candidatos fora do orçamento não são escolhidos.
+    """
+    candidates = build_candidates(
+        {"grid": {"n_estimators": [2, 40]}}, 0, base_params={"max_depth": 8}
+    )
+    with mlflow.start_run():
+        unrestricted = run_search(candidates, search_data, workers=1, latency_calls=5)
+    small_model_mb = min(c.cost.model_size_mb for c in unrestricted.candidates)
+
+    with mlflow.start_run():
+        budgeted = run_search(
+            candidates,
+            search_data,
+            workers=1,
+            latency_calls=5,
+            budget=ServingBudget(max_model_size_mb=small_model_mb * 1.5),
+        )
+        impossible = run_search(
+            candidates,
+            search_data,
+            workers=1,
+            latency_calls=5,
+            budget=ServingBudget(max_model_size_mb=small_model_mb / 2),
+        )
+
+    assert unrestricted.best.params["n_estimators"] == 40
+    assert budgeted.best.params["n_estimators"] == 2
+    assert budgeted.candidates[1].violations
+    assert budgeted.pareto
+    assert impossible.best is None
+    assert impossible.best_pipeline is None
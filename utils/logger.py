@@ -1,20 +1,49 @@
 """
 Ferramentas utilitárias para configuração de log da aplicação.
+
+Por padrão os loggers escrevem de forma assíncrona: cada logger recebe apenas
+um ``QueueHandler`` que enfileira os registros em uma fila limitada, e um
+``QueueListener`` em thread dedicada repassa os registros ao arquivo
+compartilhado do processo e ao console. Assim a thread que atende a
+requisição não faz I/O de disco.
+
+Variáveis de ambiente (lidas uma única vez, no primeiro ``get_logger``):
+    LOG_LEVEL: Nível de log (padrão INFO).
+    LOG_DIR: Diretório dos arquivos de log (padrão logs).
+    LOG_FILE: Nome do arquivo de log do processo; aceita ``{pid}``
+        (padrão app.log).
+    LOG_ASYNC: Escreve via fila e thread dedicada (padrão true).
+    LOG_QUEUE_SIZE: Capacidade da fila de registros (padrão 10000).
+    LOG_QUEUE_POLICY: O que fazer com a fila cheia: ``drop`` descarta o
+        registro e ``block`` aguarda espaço (padrão drop).
+    LOG_SAMPLE_RATE: Fração dos logs de requisição mantida, entre 0 e 1
+        (padrão 1.0). Só afeta registros marcados com ``extra=SAMPLED``
+        abaixo de WARNING.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Final
 
 from dotenv import load_dotenv
 
-load_dotenv()
-
 DEFAULT_LOG_LEVEL: Final[str] = "INFO"
 DEFAULT_LOG_DIR: Final[str] = "logs"
+DEFAULT_LOG_FILE: Final[str] = "app.log"
+DEFAULT_QUEUE_SIZE: Final[int] = 10_000
+QUEUE_POLICIES: Final[tuple[str, ...]] = ("drop", "block")
+
+# Marcador para logs emitidos a cada requisição, sujeitos a amostragem
+SAMPLED: Final[dict[str, bool]] = {"sampled": True}
 
 
 class CenteredLevelFormatter(logging.Formatter):
@@ -36,6 +65,103 @@ class CenteredLevelFormatter(logging.Formatter):
         return super().format(record)
 
 
+class RequestSamplingFilter(logging.Filter):
+    """
+    Mantém apenas uma fração dos logs de requisição.
+
+    Registros marcados com ``extra=SAMPLED`` e nível abaixo de WARNING passam
+    com probabilidade ``rate``; os demais registros passam sempre.
+
+    Attributes:
+        rate: Fração dos logs de requisição mantida, entre 0 e 1.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Inicializa o filtro de amostragem.
+
+        Args:
+            rate: Fração dos logs de requisição mantida, entre 0 e 1.
+        """
+        super().__init__()
+        self.rate = min(max(rate, 0.0), 1.0)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide se o registro deve ser emitido.
+
+        Args:
+            record: Registro de log.
+
+        Returns:
+            bool: True se o registro deve ser emitido.
+        """
+        if self.rate >= 1.0 or record.levelno >= logging.WARNING:
+            return True
+        if not getattr(record, "sampled", False):
+            return True
+        return random.random() < self.rate
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler com política para fila cheia.
+
+    Attributes:
+        policy: ``drop`` descarta o registro; ``block`` aguarda espaço na fila.
+        dropped: Quantidade de registros descartados com a fila cheia.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str) -> None:
+        """
+        Inicializa o handler.
+
+        Args:
+            log_queue: Fila limitada de registros.
+            policy: Política para fila cheia (drop ou block).
+        """
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Enfileira o registro respeitando a política configurada.
+
+        Args:
+            record: Registro já preparado para a fila.
+        """
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+@dataclass(frozen=True)
+class LogConfig:
+    """
+    Configuração de log resolvida a partir das variáveis de ambiente.
+
+    Attributes:
+        level: Nível de log.
+        log_file: Caminho do arquivo de log do processo.
+        async_enabled: Escreve via fila e thread dedicada.
+        queue_size: Capacidade da fila de registros.
+        queue_policy: Política para fila cheia (drop ou block).
+        sample_rate: Fração dos logs de requisição mantida.
+    """
+
+    level: str
+    log_file: Path
+    async_enabled: bool
+    queue_size: int
+    queue_policy: str
+    sample_rate: float
+
+
 def _resolve_log_level() -> str:
     """
     Recupera o nível de log da aplicação.
@@ -61,10 +187,113 @@ def _resolve_log_dir() -> Path:
     return log_dir
 
 
+@lru_cache
+def get_log_config() -> LogConfig:
+    """
+    Resolve a configuração de log uma única vez por processo.
+
+    Returns:
+        LogConfig: Configuração de log.
+    """
+    load_dotenv()
+    policy = os.getenv("LOG_QUEUE_POLICY", "drop").lower()
+    file_name = os.getenv("LOG_FILE", DEFAULT_LOG_FILE).format(pid=os.getpid())
+    return LogConfig(
+        level=_resolve_log_level(),
+        log_file=_resolve_log_dir() / file_name,
+        async_enabled=os.getenv("LOG_ASYNC", "true").lower() in ("1", "true", "yes"),
+        queue_size=max(1, int(os.getenv("LOG_QUEUE_SIZE", str(DEFAULT_QUEUE_SIZE)))),
+        queue_policy=policy if policy in QUEUE_POLICIES else "drop",
+        sample_rate=float(os.getenv("LOG_SAMPLE_RATE", "1.0")),
+    )
+
+
+_listener: QueueListener | None = None
+
+
+def _start_listener(
+    handler: BoundedQueueHandler, targets: list[logging.Handler]
+) -> None:
+    """
+    Cria uma fila nova para o handler e inicia a thread que a consome.
+
+    Também chamado no processo filho após um ``fork`` (ex.: gunicorn com
+    ``preload_app``), já que a thread do processo pai não é herdada.
+
+    Args:
+        handler: Handler que enfileira os registros.
+        targets: Handlers que efetivamente escrevem os registros.
+    """
+    global _listener
+    handler.queue = queue.Queue(maxsize=get_log_config().queue_size)
+    _listener = QueueListener(handler.queue, *targets, respect_handler_level=True)
+    _listener.start()
+
+
+@lru_cache
+def _shared_handlers() -> tuple[logging.Handler, ...]:
+    """
+    Cria os handlers compartilhados por todos os loggers do processo.
+
+    Returns:
+        tuple[logging.Handler, ...]: Handlers a anexar em cada logger.
+    """
+    config = get_log_config()
+    formatter = CenteredLevelFormatter("%(asctime)s [%(levelname)s] %(message)s")
+
+    file_handler = logging.FileHandler(config.log_file)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    targets: list[logging.Handler] = [file_handler, console_handler]
+    sampling_filter = RequestSamplingFilter(config.sample_rate)
+
+    if not config.async_enabled:
+        for handler in targets:
+            handler.addFilter(sampling_filter)
+        return tuple(targets)
+
+    queue_handler = BoundedQueueHandler(queue.Queue(), config.queue_policy)
+    queue_handler.addFilter(sampling_filter)
+    _start_listener(queue_handler, targets)
+    os.register_at_fork(after_in_child=lambda: _start_listener(queue_handler, targets))
+    atexit.register(stop_log_listener)
+    return (queue_handler,)
+
+
+def stop_log_listener() -> None:
+    """
+    Esvazia a fila de registros e encerra a thread de escrita, se existir.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_dropped_log_count() -> int:
+    """
+    Retorna quantos registros foram descartados com a fila cheia.
+
+    Returns:
+        int: Quantidade de registros descartados no processo.
+    """
+    if not _shared_handlers.cache_info().currsize:
+        return 0
+    return sum(
+        handler.dropped
+        for handler in _shared_handlers()
+        if isinstance(handler, BoundedQueueHandler)
+    )
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Retorna um logger configurado com nome e nível padrão.
 
+    Todos os loggers do processo compartilham os mesmos handlers e, portanto,
+    o mesmo arquivo de log.
+
     Args:
         name: Nome do logger.
 
@@ -72,21 +301,10 @@ def get_logger(name: str) -> logging.Logger:
         logging.Logger: Instância configurada de logger.
     """
     logger = logging.getLogger(name)
-    log_level = _resolve_log_level()
-    log_dir = _resolve_log_dir()
-
-    logger.setLevel(log_level)
+    logger.setLevel(get_log_config().level)
 
     if not logger.handlers:
-        formatter = CenteredLevelFormatter("%(asctime)s [%(levelname)s] %(message)s")
-        log_file = log_dir / f"{name.replace('.', '_')}.log"
-
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        for handler in _shared_handlers():
+            logger.addHandler(handler)
 
     return logger